@@ -0,0 +1,215 @@
+"""
+Benchmark the prediction hot paths of footy against synthetic leagues.
+
+Times Footy.fixture, Footy.dataframe, Footy.attack_strength, Competition.add_fixture and Competition.add_team for
+leagues of 20, 200, 2,000 and 20,000 teams, and writes the throughput, latency percentiles and peak memory of each to
+a JSON file.
+
+Examples
+--------
+$ PYTHONPATH=. python benchmarks/bench_hot_paths.py --output benchmarks/results.json
+$ PYTHONPATH=. python benchmarks/bench_hot_paths.py --sizes 20 200 --operations 100
+"""
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from footy import Footy
+from footy.domain.Competition import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Team import Team
+
+SIZES = [20, 200, 2000, 20000]
+"""list of int : The default numbers of teams in the synthetic leagues."""
+FIRST_START = datetime(2021, 1, 1, 15, 0)
+"""datetime.datetime : The UTC start of the first fixture added to the synthetic competitions."""
+
+
+def synthetic_teams(size, seed=0):
+    """
+    Create the teams of a synthetic league where every team has played at least one home and one away game.
+
+    Parameters
+    ----------
+    size : int
+        The number of teams.
+    seed : int, optional
+        The seed of the random number generator.
+
+    Returns
+    -------
+    list of footy.domain.Team.Team
+        The teams of the league.
+    """
+    rng = random.Random(seed)
+    teams = []
+
+    for index in range(size):
+        home_games = rng.randint(1, 19)
+        away_games = rng.randint(1, 19)
+        games = home_games + away_games
+        teams.append(Team(f'Team {index}', rng.randint(games // 2, games * 2), rng.randint(games // 2, games * 2),
+                          home_games, away_games, rng.randint(0, games * 3)))
+
+    return teams
+
+
+def synthetic_footy(teams):
+    """
+    Create a Footy object holding the teams of a synthetic league.
+
+    Parameters
+    ----------
+    teams : list of footy.domain.Team.Team
+        The teams of the league.
+
+    Returns
+    -------
+    footy.Footy
+        The Footy object.
+    """
+    footy = Footy()
+
+    for team in teams:
+        footy.add_team(team)
+
+    footy.average_goals_scored_by_a_home_team(1.36)
+    footy.average_goals_scored_by_an_away_team(1.06)
+    return footy
+
+
+def measure(operation, arguments):
+    """
+    Time an operation for each of a list of arguments.
+
+    The first tenth of the calls are traced with tracemalloc to find the peak memory, and the rest are timed without
+    tracing (as tracing slows down every allocation).
+
+    Parameters
+    ----------
+    operation : callable
+        The operation to time.
+    arguments : list of tuple
+        The arguments of each call of the operation.
+
+    Returns
+    -------
+    dict
+        The number of timed calls, the throughput (calls per second), the 50th, 90th and 99th percentile latencies
+        (in microseconds) and the peak memory allocated during a call (in bytes).
+    """
+    traced = max(1, len(arguments) // 10)
+    tracemalloc.start()
+
+    for argument in arguments[:traced]:
+        operation(*argument)
+
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    arguments = arguments[traced:] or arguments[:1]
+    latencies = np.empty(len(arguments))
+
+    for index, argument in enumerate(arguments):
+        start = time.perf_counter()
+        operation(*argument)
+        latencies[index] = time.perf_counter() - start
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e6
+    return {
+        'calls': len(arguments),
+        'throughput': len(arguments) / latencies.sum(),
+        'latency_p50_us': p50,
+        'latency_p90_us': p90,
+        'latency_p99_us': p99,
+        'peak_memory_bytes': peak_memory
+    }
+
+
+def benchmark_size(size, operations, seed=0):
+    """
+    Benchmark every hot path for a league of a given size.
+
+    Parameters
+    ----------
+    size : int
+        The number of teams in the league.
+    operations : int
+        The largest number of calls timed for each hot path.
+    seed : int, optional
+        The seed of the random number generator.
+
+    Returns
+    -------
+    dict
+        The measurements of each hot path keyed by its name.
+    """
+    rng = random.Random(seed)
+    teams = synthetic_teams(size, seed)
+    footy = synthetic_footy(teams)
+    pairs = [tuple(rng.sample(teams, 2)) for _ in range(operations)]
+    results = {
+        'Footy.fixture': measure(footy.fixture, pairs),
+        'Footy.dataframe': measure(footy.dataframe, [()] * max(1, min(operations, 200_000 // size))),
+        'Footy.attack_strength': measure(footy.attack_strength, [(team,) for team, _ in pairs])
+    }
+
+    # The competitions already hold one fixture and one team per team in the league, so the timings show the cost
+    # of adding to a competition of that size.
+    competition = Competition('BENCH', 'Benchmark', teams=list(teams), fixtures=[
+        Fixture(home_team, away_team, utc_start=f'2020-01-01T{index % 24:02d}:00:00Z')
+        for index, (home_team, away_team) in enumerate(zip(teams, teams[1:] + teams[:1]))
+    ])
+    # Each new fixture starts a minute after the last, so every key is unique and every start is a valid date/time.
+    new_fixtures = [(Fixture(home_team, away_team,
+                             utc_start=(FIRST_START + timedelta(minutes=index)).strftime('%Y-%m-%dT%H:%M:%SZ')),)
+                    for index, (home_team, away_team) in enumerate(pairs)]
+    results['Competition.add_fixture'] = measure(competition.add_fixture, new_fixtures)
+    new_teams = [(Team(f'New Team {index}'),) for index in range(operations)]
+    results['Competition.add_team'] = measure(competition.add_team, new_teams)
+    return results
+
+
+def main(argv=None):
+    """
+    Run the benchmarks and write the results to a JSON file.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The command line arguments.  Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='the numbers of teams in the leagues')
+    parser.add_argument('--operations', type=int, default=1000, help='the number of calls timed for each hot path')
+    parser.add_argument('--seed', type=int, default=0, help='the seed of the synthetic leagues')
+    parser.add_argument('--output', default='benchmarks/results.json', help='the JSON file to write')
+    args = parser.parse_args(argv)
+    report = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'operations': args.operations,
+        'sizes': {}
+    }
+
+    for size in args.sizes:
+        report['sizes'][str(size)] = benchmark_size(size, args.operations, args.seed)
+
+        for name, result in report['sizes'][str(size)].items():
+            print(f"{size:>6} teams  {name:<24} {result['throughput']:>12.0f} calls/s  "
+                  f"p50 {result['latency_p50_us']:>10.1f} us  p99 {result['latency_p99_us']:>10.1f} us  "
+                  f"peak {result['peak_memory_bytes'] / 1024:>10.1f} KiB")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
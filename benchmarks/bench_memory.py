@@ -0,0 +1,120 @@
+"""
+Benchmark the memory used by the footy domain objects.
+
+Creates a large number of fixtures (each with its own result) between a pool of teams, and a large number of teams,
+and writes the bytes allocated per object to a JSON file.  Run it against two revisions of footy to compare them.
+
+Examples
+--------
+$ PYTHONPATH=. python benchmarks/bench_memory.py --output benchmarks/memory.json
+$ PYTHONPATH=. python benchmarks/bench_memory.py --fixtures 100000 --teams 10000
+"""
+import argparse
+import gc
+import json
+import platform
+import tracemalloc
+
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+
+FIXTURES = 1_000_000
+"""int : The default number of fixtures created."""
+
+TEAMS = 100_000
+"""int : The default number of teams created."""
+
+
+def measure(factory, count):
+    """
+    Find the memory allocated by creating a number of objects.
+
+    Parameters
+    ----------
+    factory : callable
+        Called with the index of each object to create it.
+    count : int
+        The number of objects to create.
+
+    Returns
+    -------
+    dict
+        The number of objects, the total bytes allocated and the bytes allocated per object.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(index) for index in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # The list holding the objects is not part of their cost.
+    allocated -= list_size(len(objects))
+    del objects
+    return {
+        'objects': count,
+        'bytes': allocated,
+        'bytes_per_object': allocated / count
+    }
+
+
+def list_size(length):
+    """
+    Find the memory allocated for a list of a given length.
+
+    Parameters
+    ----------
+    length : int
+        The length of the list.
+
+    Returns
+    -------
+    int
+        The bytes allocated for the list (not including its items).
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [None for _ in range(length)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del items
+    return allocated
+
+
+def main(argv=None):
+    """
+    Run the benchmark and write the results to a JSON file.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The command line arguments.  Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--fixtures', type=int, default=FIXTURES, help='the number of fixtures to create')
+    parser.add_argument('--teams', type=int, default=TEAMS, help='the number of teams to create')
+    parser.add_argument('--output', default='benchmarks/memory.json', help='the JSON file to write')
+    args = parser.parse_args(argv)
+
+    # The teams and start times are shared so that only the fixtures and their results are measured.
+    pool = [Team(f'Team {index}', 30, 30, 10, 10, 30) for index in range(20)]
+    starts = [f'2021-02-{day:02d}T15:00:00Z' for day in range(1, 29)]
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'Fixture': measure(lambda index: Fixture(pool[index % 20], pool[(index + 1) % 20], 'FINISHED',
+                                                 starts[index % 28], Result('FINISHED', 1, 2)), args.fixtures),
+        'Team': measure(lambda index: Team('Team', 30, 30, 10, 10, 30), args.teams)
+    }
+
+    for name in ('Fixture', 'Team'):
+        print(f"{name:<8} {report[name]['objects']:>10} objects  {report[name]['bytes'] / 2 ** 20:>10.1f} MiB  "
+              f"{report[name]['bytes_per_object']:>8.1f} bytes/object")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
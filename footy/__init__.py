@@ -1,11 +1,17 @@
 """Footy - A statistics module for football (soccer)."""
+import json
+
 import numpy as np
 import pandas as pd
 
-from scipy.stats import poisson
 from sklearn.metrics import brier_score_loss
 
 from footy.domain.Fixture import Fixture
+from footy.domain.Team import Team
+from footy.domain.TeamStore import COLUMNS, TeamStore
+from footy.engine.OutcomeEngine import OutcomeEngine
+from footy.instrumentation import register
+from footy.snapshot import load_arrays, save_arrays
 
 # Set match outcome constants.
 OUTCOME_HOME_WIN = [1, 0, 0]
@@ -15,6 +21,43 @@ OUTCOME_SCORE_DRAW = [0, 1, 0]
 OUTCOME_AWAY_WIN = [0, 0, 1]
 """List of int : The notation of an away outcome."""
 
+_SPLITTER = 2.0 ** 27 + 1
+"""float : Splits a float into two halves that can be multiplied exactly (Veltkamp's split)."""
+
+
+def _round(values, decimals):
+    """
+    Round each element of an array half to even, as the built-in round function rounds a float.
+
+    Unlike numpy.round, which scales the values before rounding them, the built-in function rounds the exact binary
+    value, so the results match the scalar calculations of the Footy class.  The exact error of scaling each value is
+    calculated with Dekker's product, so a value that only appears to lie halfway between two results once it has been
+    scaled is rounded the same way.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The values to round.
+    decimals : int
+        The number of decimal places to round to.
+
+    Returns
+    -------
+    numpy.ndarray
+        The rounded values.
+    """
+    values = np.asarray(values, dtype=float)
+    scale = 10.0 ** decimals
+    scaled = values * scale
+    split = _SPLITTER * values
+    high = split - (split - values)
+    error = (high * scale - scaled) + (values - high) * scale
+    rounded = np.rint(scaled)
+    tie = np.abs(scaled - rounded) == 0.5
+    rounded = np.where(tie & (error > 0), np.ceil(scaled), rounded)
+    rounded = np.where(tie & (error < 0), np.floor(scaled), rounded)
+    return rounded / scale
+
 
 class Footy:
     """
@@ -64,6 +107,12 @@ class Footy:
 
     >>> response = widget.fixture(widget.get_team('Arsenal'), widget.get_team('Stoke'))
 
+    Predict many fixtures at once with a single vectorised calculation (see the `predict_fixtures` method).
+
+    >>> prediction = widget.predict_fixtures([(widget.get_team('Arsenal'), widget.get_team('Stoke')),
+    ...                                       (widget.get_team('Hull'), widget.get_team('Man United'))])
+    >>> prediction['outcome_probabilities']
+
     Get a list of all the teams from the dataset.
 
     >>> widget.get_team_names()
@@ -98,22 +147,53 @@ class Footy:
     0.0
     """
 
-    def __init__(self):
-        """Construct a Footy object."""
+    def __init__(self, columnar=False, outcome_engine=None):
+        """
+        Construct a Footy object.
+
+        Parameters
+        ----------
+        columnar : bool, optional
+            If True, the statistics of the teams are only held in the columnar store of the object and `get_team`
+            returns a `footy.domain.TeamStore.TeamView` that reads and writes them from there.  This allows statistics
+            to be updated in place (without adding the team again) when holding a large number of teams.  Defaults to
+            False.
+        outcome_engine : footy.engine.OutcomeEngine.OutcomeEngine, optional
+            The engine that calculates the probabilities of fixtures from the expected goals (for example to set the
+            maximum number of goals or to calculate exact outcome probabilities).  Defaults to an engine with the
+            original settings.
+        """
         self._data = {}
         self._average_goals_scored_by_a_home_team = (-1)
         self._average_goals_scored_by_an_away_team = (-1)
+        self._columnar = columnar
+        self._store = TeamStore()
+        self._outcome_engine = outcome_engine or OutcomeEngine()
 
     def add_team(self, team):
         """
         Add a team to the table.
 
+        The statistics of the team are copied into the columnar store of the object at the time it is added.  The
+        league totals used by `goals_scored` and `goals_conceded` (and the count of teams that have not yet played
+        both home and away that is checked by `fixture`) are updated incrementally from them, and `attack_strength`,
+        `defence_factor`, `expected_goals`, `dataframe` and `fixture` all read them from the store.  If the statistics
+        of a team change, add the team again so that the change is reflected (this is not required for a team
+        returned by `get_team` of a columnar Footy object, as it reads and writes the store directly).
+
         Parameters
         ----------
         team : footy.domain.Team.Team
             The team to set or update (using the team name as a key) in Footy object.
         """
-        self._data[team.team_name()] = team
+        team_name = team.team_name()
+        self._store.add_team(team)
+
+        if self._columnar:
+            if team_name not in self._data:
+                self._data[team_name] = self._store.view(team_name)
+        else:
+            self._data[team_name] = team
 
     def attack_strength(self, team):
         """
@@ -123,6 +203,9 @@ class Footy:
         scored by any team.  An attack strength higher than 1.0 indicates that the team scores more than the
         average number of goals by a team in the competition.
 
+        As for `expected_goals` and `dataframe`, the goals scored by the team are those held when it was last added
+        (see `add_team`).
+
         Parameters
         ----------
         team : footy.domain.Team.Team
@@ -141,7 +224,7 @@ class Footy:
         """
         try:
             league_average_goals_scored = self.goals_scored()
-            attack_strength = team.goals_for() / league_average_goals_scored
+            attack_strength = self._statistic(team, 'goals_for') / league_average_goals_scored
         except ZeroDivisionError:
             return None
 
@@ -211,6 +294,37 @@ class Footy:
         n = len(y_prob)
         return round(bs * n, 2)
 
+    def brier_scores(self, y_true, y_prob):
+        """
+        Return the Brier Score of each of a batch of predictions.
+
+        This calculates the same score as `brier_score` for every prediction in one pass, without rounding.
+
+        Parameters
+        ----------
+        y_true : array_like
+            What actually happened in each fixture (e.g. `OUTCOME_HOME_WIN`), shape (n, 3).
+        y_prob : array_like
+            The predicted probability of each outcome of each fixture, shape (n, 3).
+
+        Returns
+        -------
+        numpy.ndarray
+            The Brier Score of each prediction (between 0.0 and 2.0), shape (n,).
+
+        Raises
+        ------
+        ValueError
+            When y_true and y_prob are not two dimensional arrays of the same shape.
+        """
+        y_true = np.asarray(y_true, dtype=float)
+        y_prob = np.asarray(y_prob, dtype=float)
+
+        if y_true.ndim != 2 or y_true.shape != y_prob.shape:
+            raise ValueError(f'Expected two arrays of shape (n, 3), got {y_true.shape} and {y_prob.shape}.')
+
+        return np.square(y_prob - y_true).sum(axis=1)
+
     def dataframe(self):
         """
         Return the object data as a Pandas dataframe.
@@ -222,41 +336,22 @@ class Footy:
         pandas.DataFrame
             The object data as a Pandas DataFrame.
         """
-        a = []
-        attack_strengths = []
-        defence_factors = []
-        team_names = self.get_team_names()
-
-        for team_name in team_names:
-            team = self.get_team(team_name)
-            attack_strength = self.attack_strength(team)
-            attack_strengths.append(attack_strength)
-            defence_factor = self.defence_factor(team)
-            defence_factors.append(defence_factor)
-            team_list = [
-                team_name,
-                team.goals_for(),
-                team.goals_against(),
-                team.home_games(),
-                team.away_games(),
-                team.goal_difference(),
-                team.points()
-            ]
-            a.append(team_list)
-
-        columns = [
-            'team_name',
-            'goals_for',
-            'goals_against',
-            'home_games',
-            'away_games',
-            'goal_difference',
-            'points'
-        ]
-
-        df = pd.DataFrame(a, columns=columns)
-        df['attack_strength'] = attack_strengths
-        df['defence_factor'] = defence_factors
+        team_names = np.array(self._store.team_names(), dtype=object)
+        goals_for = self._store.column('goals_for')
+        goals_against = self._store.column('goals_against')
+
+        df = pd.DataFrame({
+            'team_name': team_names,
+            'goals_for': goals_for,
+            'goals_against': goals_against,
+            'home_games': self._store.column('home_games'),
+            'away_games': self._store.column('away_games'),
+            'goal_difference': goals_for - goals_against,
+            'points': self._store.column('points')
+        })
+        df['attack_strength'] = self._strengths(goals_for, self.goals_scored)
+        df['defence_factor'] = self._strengths(goals_against, self.goals_conceded)
+        df = df.iloc[np.argsort(team_names, kind='stable')]
         df = df.sort_values(
             [
                 'points',
@@ -282,6 +377,9 @@ class Footy:
         number of goals conceded by all the teams in the competition.  A defence factor > 1.0 indicates that the
         team concedes more goals that of the average team.
 
+        As for `expected_goals` and `dataframe`, the goals conceded by the team are those held when it was last added
+        (see `add_team`).
+
         Parameters
         ----------
         team : footy.domain.Team.Team
@@ -300,12 +398,44 @@ class Footy:
         """
         try:
             league_average_goals_conceded = self.goals_conceded()
-            defence_factor = team.goals_against() / league_average_goals_conceded
+            defence_factor = self._statistic(team, 'goals_against') / league_average_goals_conceded
         except ZeroDivisionError:
             return None
 
         return round(defence_factor, 2)
 
+    def expected_goals(self, pairs):
+        """
+        Calculate the expected goals of the home and away teams for a number of fixtures.
+
+        Parameters
+        ----------
+        pairs : iterable of (footy.domain.Team.Team, footy.domain.Team.Team)
+            The home team and away team of each fixture.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The expected goals of the home teams and of the away teams, each of shape (n,).
+        """
+        home_rows = []
+        away_rows = []
+
+        for home_team, away_team in pairs:
+            home_rows.append(home_team.team_name())
+            away_rows.append(away_team.team_name())
+
+        home_rows = self._store.rows(home_rows)
+        away_rows = self._store.rows(away_rows)
+        # The strengths are calculated once per team and then gathered for each fixture.
+        attack_strengths = self._strengths(self._store.column('goals_for'), self.goals_scored)
+        defence_factors = self._strengths(self._store.column('goals_against'), self.goals_conceded)
+        home_expected_goals = self.average_goals_scored_by_a_home_team()
+        home_expected_goals = home_expected_goals * attack_strengths[home_rows] * defence_factors[away_rows]
+        away_expected_goals = self.average_goals_scored_by_an_away_team()
+        away_expected_goals = away_expected_goals * attack_strengths[away_rows] * defence_factors[home_rows]
+        return _round(home_expected_goals, 2), _round(away_expected_goals, 2)
+
     def fixture(self, home_team, away_team, utc_start=None):
         """
         Calculate the probabilities of a fixture between two teams.
@@ -330,76 +460,48 @@ class Footy:
             When a team name is provided that is not in the dataset.
         """
         response = Fixture(home_team, away_team, utc_start=utc_start)
+        prediction = self.predict_fixtures([(home_team, away_team)])
 
-        # Check that all teams have played more than zero home games.
-        # If the check fails, return None as we do not have enough data
-        # to calculate probabilities.
-        df = self.dataframe()
-        home_games = df['home_games'].values
-
-        if 0 in home_games:
+        if prediction is None:
             return response
 
-        # Check that all teams have played more than zero away games.
-        # If the check fails, return None as we do not have enough data
-        # to calculate probabilities.
-        away_games = df['away_games'].values
+        self._populate_fixture(response, prediction, 0)
+        return response
 
-        if 0 in away_games:
-            return response
+    @classmethod
+    def from_competition(cls, competition, **kwargs):
+        """
+        Construct a Footy object from the teams and finished fixtures of a competition.
 
-        home_expected_goals = self.average_goals_scored_by_a_home_team()
-        away_expected_goals = self.average_goals_scored_by_an_away_team()
-        home_expected_goals *= self.attack_strength(home_team)
-        home_expected_goals *= self.defence_factor(away_team)
-        home_expected_goals = round(home_expected_goals, 2)
-        goals = [0, 1, 2, 3, 4, 5, 6]
-        probability_mass = poisson.pmf(goals, home_expected_goals)
-        # probability_mass = np.append(probability_mass,
-        #                              1.0 - sum(probability_mass))
-        home_probability_mass = np.round(probability_mass, 4)
-        away_expected_goals *= self.attack_strength(away_team)
-        away_expected_goals *= self.defence_factor(home_team)
-        away_expected_goals = round(away_expected_goals, 2)
-        probability_mass = poisson.pmf(goals, away_expected_goals)
-        # probability_mass = np.append(probability_mass,
-        #                              1.0 - sum(probability_mass))
-        away_probability_mass = np.round(probability_mass, 4)
-
-        probabilities = []
-
-        for home_team_goal in range(len(goals)):
-            for away_team_goal in range(len(goals)):
-                probability = home_probability_mass[home_team_goal]
-                probability *= away_probability_mass[away_team_goal]
-                probability = round(probability, 4)
-                probabilities.append([home_team_goal, away_team_goal,
-                                      probability])
-
-        df = pd.DataFrame(probabilities, columns=['home',
-                                                  'away',
-                                                  'probability'])
-        df = df[df.probability != 0]
-        df = df.sort_values('probability', ascending=False)
-        df = df.reset_index(drop=True)
-        response.final_score_probabilities(df)
-
-        df2 = df[df.home > df.away]
-        home_win_probability = round(sum(df2.probability.values), 4)
-        df2 = df[df.home == df.away]
-        draw_probability = round(sum(df2.probability.values), 4)
-        df2 = df[df.home < df.away]
-        away_win_probability = round(sum(df2.probability.values), 4)
-
-        response.outcome_probabilities([
-            home_win_probability,
-            draw_probability,
-            away_win_probability
-        ])
-
-        response.home_team_goals_probability(list(home_probability_mass))
-        response.away_team_goals_probability(list(away_probability_mass))
-        return response
+        The average goals scored by a home team and by an away team are calculated from the results of the fixtures
+        of the competition with a status of FINISHED.  If there are no finished fixtures, they are not set.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition to take the teams and fixtures from.
+        **kwargs
+            Passed to the constructor of the Footy object.
+
+        Returns
+        -------
+        Footy
+            A Footy object holding the teams of the competition.
+        """
+        footy = cls(**kwargs)
+
+        for team in competition.teams:
+            footy.add_team(team)
+
+        finished = [fixture.result for fixture in competition.fixtures if fixture.status == 'FINISHED']
+
+        if finished:
+            home_goals = sum(result.home_team_goals_scored for result in finished)
+            away_goals = sum(result.away_team_goals_scored for result in finished)
+            footy.average_goals_scored_by_a_home_team(round(home_goals / len(finished), 2))
+            footy.average_goals_scored_by_an_away_team(round(away_goals / len(finished), 2))
+
+        return footy
 
     def get_team(self, team_name):
         """
@@ -439,11 +541,12 @@ class Footy:
         Get the number of goals conceded.
 
         If the team name is provided then the number of goals conceded by that team is returned.  Otherwise the number
-        of goals conceded by all teams is returned.
+        of goals conceded by all teams is returned.  As for `attack_strength`, the goals are those held when the team
+        was last added (see `add_team`).
 
         Parameters
         ----------
-        team_name : footy.domain.Team.Team, optional
+        team_name : str, optional
             The name of the team to get the number of goals conceded.
 
         Returns
@@ -457,24 +560,17 @@ class Footy:
             When a team name is provided that is not in the dataset.
         """
         if team_name:
-            team = self.get_team(team_name)
-            return team.goals_against
+            return self._store.get(self._store.row(team_name), 'goals_against')
         else:
-            goals_conceded = 0
-            team_names = self.get_team_names()
-
-            for team_name in team_names:
-                team = self.get_team(team_name)
-                goals_conceded += team.goals_against()
-
-            return int(round(goals_conceded / len(team_names)))
+            return int(round(self._store.total('goals_against') / len(self._store)))
 
     def goals_scored(self, team_name=None):
         """
         Get the number of goals scored.
 
         If team_name is provided, the number of goals scored by that team is returned.  If not, the average number of
-        goals scored by all teams is returned.
+        goals scored by all teams is returned.  As for `attack_strength`, the goals are those held when the team was
+        last added (see `add_team`).
 
         Parameters
         ----------
@@ -492,13 +588,266 @@ class Footy:
             When a team name is provided that is not in the dataset.
         """
         if team_name:
-            return self.get_team(team_name).goals_for()
+            return self._store.get(self._store.row(team_name), 'goals_for')
         else:
-            goals_for = 0
-            team_names = self.get_team_names()
+            return int(round(self._store.total('goals_for') / len(self._store)))
+
+    def group_brier_scores(self, scores, groups):
+        """
+        Aggregate Brier Scores by a group such as the matchday or season of each prediction.
+
+        Parameters
+        ----------
+        scores : array_like
+            The Brier Score of each prediction (e.g. from `brier_scores`), shape (n,).
+        groups : array_like
+            The group of each prediction, shape (n,).
+
+        Returns
+        -------
+        pandas.DataFrame
+            The number of predictions, total and mean Brier Score of each group, indexed and sorted by group.
+
+        Raises
+        ------
+        ValueError
+            When scores and groups are not the same length.
+        """
+        scores = np.asarray(scores, dtype=float).reshape(-1)
+        groups = np.asarray(groups).reshape(-1)
+
+        if len(scores) != len(groups):
+            raise ValueError(f'Expected a group for each of the {len(scores)} scores, got {len(groups)}.')
+
+        # Factorizing hashes the groups, which is much faster than sorting them when they are strings.
+        inverse, keys = pd.factorize(groups, sort=True)
+        count = np.bincount(inverse, minlength=len(keys))
+        total = np.bincount(inverse, weights=scores, minlength=len(keys))
+        return pd.DataFrame({'count': count, 'total': total, 'mean': total / np.maximum(count, 1)},
+                            index=pd.Index(keys, name='group'))
+
+    def populate_fixtures(self, fixtures, prediction=None):
+        """
+        Calculate and set the probabilities of a number of fixtures with a single vectorised calculation.
+
+        Parameters
+        ----------
+        fixtures : list of footy.domain.Fixture.Fixture
+            The fixtures to be populated with predicted probabilities.
+        prediction : dict, optional
+            A prediction of the fixtures (in the same order) as returned by `predict_fixtures`, for example one
+            calculated in another process.  Defaults to calculating the prediction.
+
+        Returns
+        -------
+        list of footy.domain.Fixture.Fixture
+            The fixtures provided, containing the predicted probabilities (if available).
+        """
+        if prediction is None:
+            prediction = self.predict_fixtures([(fixture.home_team, fixture.away_team) for fixture in fixtures])
+
+        if prediction is not None:
+            for index, fixture in enumerate(fixtures):
+                self._populate_fixture(fixture, prediction, index)
+
+        return fixtures
+
+    def predict_fixtures(self, pairs):
+        """
+        Calculate the probabilities of a number of fixtures with a single vectorised calculation.
+
+        Parameters
+        ----------
+        pairs : iterable of (footy.domain.Team.Team, footy.domain.Team.Team)
+            The home team and away team of each fixture.
+
+        Returns
+        -------
+        dict
+            The expected goals, goal probabilities, final score probabilities and outcome probabilities of every
+            fixture as numpy arrays (see `footy.engine.OutcomeEngine.OutcomeEngine.predict` for the details).  If
+            there is not enough data to calculate the probabilities, return None.
+
+        Raises
+        ------
+        KeyError
+            When a team name is provided that is not in the dataset.
+        """
+        if not self._ready():
+            return None
+
+        home_expected_goals, away_expected_goals = self.expected_goals(pairs)
+        return self._outcome_engine.predict(home_expected_goals, away_expected_goals)
+
+    @classmethod
+    def restore(cls, path, mmap_mode=None):
+        """
+        Construct a Footy object from a snapshot written by `snapshot`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the snapshot.
+        mmap_mode : str, optional
+            If given (e.g. 'r'), the arrays of the snapshot are memory mapped while they are read (see
+            `footy.snapshot.load_arrays`).  The statistics are copied into the new object either way, so it can be
+            updated.  Defaults to reading the arrays.
+
+        Returns
+        -------
+        Footy
+            A Footy object holding the teams, league averages and outcome engine settings of the snapshot.
+
+        Raises
+        ------
+        KeyError
+            When the file is not a snapshot of a Footy object.
+        """
+        arrays = load_arrays(path, mmap_mode)
+        footy = cls(columnar=bool(arrays['columnar']),
+                    outcome_engine=OutcomeEngine(**json.loads(str(arrays['outcome_engine']))))
+        footy._store = TeamStore.from_columns(arrays['team_names'].tolist(),
+                                              {column: arrays[column] for column in COLUMNS})
+
+        for row, team_name in enumerate(footy._store.team_names()):
+            if footy._columnar:
+                footy._data[team_name] = footy._store.view(team_name)
+            else:
+                footy._data[team_name] = Team(team_name, *(footy._store.get(row, column) for column in COLUMNS))
+
+        footy.average_goals_scored_by_a_home_team(float(arrays['average_goals_scored_by_a_home_team']))
+        footy.average_goals_scored_by_an_away_team(float(arrays['average_goals_scored_by_an_away_team']))
+        return footy
+
+    def snapshot(self, path):
+        """
+        Save the teams, league averages and outcome engine settings to a binary snapshot.
+
+        The statistics of the teams are written as one array per column (see `footy.snapshot`), so a snapshot of
+        many teams is restored by `restore` without building the league totals team by team.  The histories of the
+        teams are not saved.
+
+        Parameters
+        ----------
+        path : str
+            The path of the snapshot (conventionally ending in '.npz').
+        """
+        arrays = {column: self._store.column(column) for column in COLUMNS}
+        arrays['team_names'] = np.array(self._store.team_names(), dtype=str)
+        arrays['columnar'] = np.array(self._columnar)
+        arrays['outcome_engine'] = np.array(json.dumps(self._outcome_engine.settings()))
+        arrays['average_goals_scored_by_a_home_team'] = np.array(self.average_goals_scored_by_a_home_team(),
+                                                                 dtype=float)
+        arrays['average_goals_scored_by_an_away_team'] = np.array(self.average_goals_scored_by_an_away_team(),
+                                                                  dtype=float)
+        save_arrays(path, arrays)
+
+    def team_brier_scores(self, scores, home_team_names, away_team_names):
+        """
+        Aggregate Brier Scores by team, counting each prediction for both the home and away team.
+
+        Parameters
+        ----------
+        scores : array_like
+            The Brier Score of each prediction (e.g. from `brier_scores`), shape (n,).
+        home_team_names : array_like
+            The name of the home team of each prediction, shape (n,).
+        away_team_names : array_like
+            The name of the away team of each prediction, shape (n,).
+
+        Returns
+        -------
+        pandas.DataFrame
+            The number of predictions, total and mean Brier Score of each team, indexed and sorted by team name.
+        """
+        scores = np.asarray(scores, dtype=float).reshape(-1)
+        df = self.group_brier_scores(np.concatenate([scores, scores]),
+                                     np.concatenate([np.asarray(home_team_names, dtype=object).reshape(-1),
+                                                     np.asarray(away_team_names, dtype=object).reshape(-1)]))
+        df.index.name = 'team_name'
+        return df
+
+    def _populate_fixture(self, fixture, prediction, index):
+        """
+        Set the probabilities of a fixture from a row of a vectorised prediction.
+
+        Parameters
+        ----------
+        fixture : footy.domain.Fixture.Fixture
+            The fixture to populate.
+        prediction : dict
+            A prediction as returned by `predict_fixtures`.
+        index : int
+            The row of the prediction that refers to the fixture.
+        """
+        fixture.final_score_matrix(prediction['final_score_probabilities'][index], self._outcome_engine.tail_mass())
+        fixture.outcome_probabilities(list(prediction['outcome_probabilities'][index]))
+        fixture.home_team_goals_probability(list(prediction['home_team_goals_probability'][index]))
+        fixture.away_team_goals_probability(list(prediction['away_team_goals_probability'][index]))
+
+    def _statistic(self, team, column):
+        """
+        Get a statistic of a team as it is held in the store (i.e. when the team was last added).
+
+        Parameters
+        ----------
+        team : footy.domain.Team.Team
+            The team.
+        column : str
+            The name of the statistic (one of `footy.domain.TeamStore.COLUMNS`).
+
+        Returns
+        -------
+        int
+            The value of the statistic.
+
+        Raises
+        ------
+        KeyError
+            When the team is not in the dataset.
+        """
+        return self._store.get(self._store.row(team.team_name()), column)
+
+    def _strengths(self, goals, league_average):
+        """
+        Calculate attack strengths or defence factors for an array of goals.
+
+        Parameters
+        ----------
+        goals : numpy.ndarray
+            The goals scored (for attack strengths) or conceded (for defence factors) by each team.
+        league_average : callable
+            Returns the league average of goals scored or conceded (`goals_scored` or `goals_conceded`).
+
+        Returns
+        -------
+        numpy.ndarray
+            The strengths rounded as `attack_strength` and `defence_factor` round them, or NaN if there is not enough
+            data to calculate them.
+        """
+        try:
+            average = league_average()
+        except ZeroDivisionError:
+            average = 0
+
+        if average == 0:
+            return np.full(len(goals), np.nan)
+
+        return _round(goals / average, 2)
+
+    def _ready(self):
+        """
+        Check that there is enough data to calculate probabilities.
+
+        This is a constant time check of a count that is maintained by `add_team`.
+
+        Returns
+        -------
+        bool
+            True if every team has played at least one home game and one away game.
+        """
+        return len(self._store) > 0 and self._store.incomplete_teams() == 0
 
-            for team_name in team_names:
-                team = self.get_team(team_name)
-                goals_for += team.goals_for()
 
-            return int(round(goals_for / len(team_names)))
+register(Footy, 'brier_scores', 'dataframe', 'expected_goals', 'fixture', 'goals_conceded', 'goals_scored',
+         'group_brier_scores', 'predict_fixtures', 'team_brier_scores')
@@ -1,4 +1,20 @@
 """Competition - Data structure for a competition/league."""
+import bisect
+import heapq
+import json
+
+import numpy as np
+
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+from footy.domain.TeamStore import COLUMNS
+from footy.season import timestamp, valid_timestamp
+from footy.snapshot import load_arrays, save_arrays
+
+PREDICTIONS = ('final_score_matrix', 'outcome_probabilities', 'home_team_goals_probability',
+               'away_team_goals_probability')
+"""tuple of str : The predictions of a fixture that are saved in a snapshot."""
 
 
 class Competition:
@@ -28,11 +44,28 @@ class Competition:
         """
         self._code = code
         self._name = name
-        self._teams = teams or []
         self._start_date = start_date
         self._end_date = end_date
         self._stage = stage
-        self._fixtures = fixtures or []
+        self.teams = teams or []
+        self.fixtures = fixtures or []
+
+    def __setstate__(self, state):
+        """
+        Set the state of an unpickled competition.
+
+        Fixtures do not pickle the competitions that index them, so the competition is added to each of its fixtures
+        again.
+
+        Parameters
+        ----------
+        state : dict
+            The attributes of the competition.
+        """
+        self.__dict__.update(state)
+
+        for sequence, (fixture, *_) in self._fixture_entries.items():
+            fixture.add_competition(self, sequence)
 
     def code(self, code=None):
         """
@@ -98,6 +131,10 @@ class Competition:
             The value you wish to set the teams property to.
         """
         self._teams = teams
+        self._team_index = {}
+
+        for team in teams:
+            self._team_index.setdefault(team.team_name(), team)
 
     @property
     def start_date(self):
@@ -194,30 +231,560 @@ class Competition:
             The value you wish to set the fixtures property to.
         """
         self._fixtures = fixtures
+        self._fixture_index = {}
+        self._fixture_entries = {}
+        self._fixtures_by_team = {}
+        self._fixtures_by_status = {}
+        self._fixtures_by_start = []
+        self._fixture_sequence = 0
+        self._index_fixtures(fixtures)
 
     def add_team(self, team):
         """
-        Add the provided team to the list of teams if an instance of that object isn't already present.
+        Add the provided team to the list of teams if a team with the same name isn't already present.
+
+        Teams are indexed by name, so this costs O(1) however many teams the competition has.
 
         Parameters
         ----------
         team : Team
             The Team to be added to Teams.
         """
-        #     TODO: Teams should be unique by name; throw an exception if a team with that name is already in the list.
-        if team not in self._teams:
+        team_name = team.team_name()
+
+        if team_name not in self._team_index:
+            self._team_index[team_name] = team
             self._teams.append(team)
 
     def add_fixture(self, fixture):
         """
         Add the provided fixture to the list of fixtures if the fixture isn't already present.
 
+        Fixtures are indexed by their key (the names of the home and away teams and the start time, see
+        `footy.domain.Fixture.Fixture.key`), so this costs O(1) however many fixtures the competition has.
+
         Parameters
         ----------
         fixture : footy.domain.Fixture.Fixture
             The Team to be added to Teams.
         """
-        # TODO: We need to decide if there can be more than one fixture for same teams. If so, we
-        #  need to decide what gives fixture it's uniqueness (e.g. teams + date)
-        if fixture not in self._fixtures:
+        if fixture.key() not in self._fixture_index:
+            self._index_fixture(fixture)
             self._fixtures.append(fixture)
+
+    def fixtures_between(self, start=None, end=None):
+        """
+        Get the fixtures that start within a period.
+
+        Fixtures without a valid UTC start are never returned.
+
+        Parameters
+        ----------
+        start : str or datetime.datetime, optional
+            The start of the period (inclusive).  Defaults to no lower limit.
+        end : str or datetime.datetime, optional
+            The end of the period (exclusive).  Defaults to no upper limit.
+
+        Returns
+        -------
+        list of footy.domain.Fixture.Fixture
+            The fixtures sorted by when they start.
+
+        Raises
+        ------
+        ValueError
+            When start or end is not a valid date/time.
+        """
+        lower = 0
+        upper = len(self._fixtures_by_start)
+
+        if start is not None:
+            lower = bisect.bisect_left(self._fixtures_by_start, (valid_timestamp(start),))
+
+        if end is not None:
+            upper = bisect.bisect_left(self._fixtures_by_start, (valid_timestamp(end),))
+
+        return [self._fixture_entries[sequence][0] for _, sequence in self._fixtures_by_start[lower:upper]]
+
+    def fixtures_for_team(self, team_name):
+        """
+        Get the fixtures where a team is playing at home or away.
+
+        Parameters
+        ----------
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        list of footy.domain.Fixture.Fixture
+            The fixtures of the team in the order they were added.
+        """
+        return list(self._fixtures_by_team.get(team_name, {}).values())
+
+    def fixtures_with_status(self, status):
+        """
+        Get the fixtures with a status.
+
+        Parameters
+        ----------
+        status : str
+            The status (e.g. SCHEDULED or FINISHED).
+
+        Returns
+        -------
+        list of footy.domain.Fixture.Fixture
+            The fixtures with the status.
+        """
+        return list(self._fixtures_by_status.get(status, {}).values())
+
+    def get_fixture(self, home_team_name, away_team_name, utc_start=''):
+        """
+        Get a fixture of the competition.
+
+        Parameters
+        ----------
+        home_team_name : str
+            The name of the home team.
+        away_team_name : str
+            The name of the away team.
+        utc_start : str, optional
+            UTC date/time when the fixture is scheduled to start.  Defaults to empty string.
+
+        Returns
+        -------
+        footy.domain.Fixture.Fixture
+            The fixture.
+
+        Raises
+        ------
+        KeyError
+            When the competition has no such fixture.
+        """
+        return self._fixture_index[(home_team_name, away_team_name, utc_start)]
+
+    def get_team(self, team_name):
+        """
+        Get a team of the competition.
+
+        Parameters
+        ----------
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        footy.domain.Team.Team
+            The team.
+
+        Raises
+        ------
+        KeyError
+            When the competition has no team of that name.
+        """
+        return self._team_index[team_name]
+
+    def has_fixture(self, fixture):
+        """
+        Check if the competition has a fixture with the same key as the provided fixture.
+
+        Parameters
+        ----------
+        fixture : footy.domain.Fixture.Fixture
+            The fixture to look for.
+
+        Returns
+        -------
+        bool
+            True if the competition has the fixture.
+        """
+        return fixture.key() in self._fixture_index
+
+    def has_team(self, team_name):
+        """
+        Check if the competition has a team.
+
+        Parameters
+        ----------
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        bool
+            True if the competition has a team of that name.
+        """
+        return team_name in self._team_index
+
+    def most_confident_fixtures(self, k, status=None, least=False):
+        """
+        Get the k fixtures with the largest (or smallest) of the outcome probabilities.
+
+        Fixtures without outcome probabilities are skipped.  A heap is used, so this costs O(n log k) for n fixtures.
+
+        Parameters
+        ----------
+        k : int
+            The number of fixtures to return.
+        status : str, optional
+            Only rank fixtures with this status (e.g. SCHEDULED).  Defaults to ranking every fixture.
+        least : bool, optional
+            If True, get the least confident fixtures instead.  Defaults to False.
+
+        Returns
+        -------
+        list of footy.domain.Fixture.Fixture
+            The fixtures, most confident first (or least confident first if least is True).
+        """
+        if status is None:
+            fixtures = self._fixtures
+        else:
+            fixtures = self._fixtures_by_status.get(status, {}).values()
+
+        return Competition.rank_fixtures(fixtures, k, least)
+
+    @staticmethod
+    def rank_fixtures(fixtures, k, least=False):
+        """
+        Get the k fixtures with the largest (or smallest) of the outcome probabilities from any fixtures.
+
+        This can rank fixtures from many competitions (e.g. the scheduled fixtures of every competition) in one pass.
+        Fixtures without outcome probabilities are skipped.
+
+        Parameters
+        ----------
+        fixtures : iterable of footy.domain.Fixture.Fixture
+            The fixtures to rank.
+        k : int
+            The number of fixtures to return.
+        least : bool, optional
+            If True, get the least confident fixtures instead.  Defaults to False.
+
+        Returns
+        -------
+        list of footy.domain.Fixture.Fixture
+            The fixtures, most confident first (or least confident first if least is True).
+        """
+        select = heapq.nsmallest if least else heapq.nlargest
+        candidates = (fixture for fixture in fixtures if fixture.largest_odds() is not None)
+        return select(k, candidates, key=lambda fixture: fixture.largest_odds())
+
+    @classmethod
+    def restore(cls, path, mmap_mode=None):
+        """
+        Construct a Competition object from a snapshot written by `snapshot`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the snapshot.
+        mmap_mode : str, optional
+            If given (e.g. 'r'), the arrays of the snapshot are memory mapped (see `footy.snapshot.load_arrays`) and
+            the final score matrices of the fixtures are views of the file rather than copies, so they are only read
+            from disk when they are used.  Defaults to reading the arrays.
+
+        Returns
+        -------
+        footy.domain.Competition.Competition
+            The competition with its teams, fixtures, results and predictions.
+
+        Raises
+        ------
+        KeyError
+            When the file is not a snapshot of a competition.
+        """
+        arrays = load_arrays(path, mmap_mode)
+        details = json.loads(str(arrays['competition']))
+        teams = [Team(team_name, *statistics) for team_name, *statistics in
+                 zip(arrays['team_names'].tolist(), *(arrays[column].tolist() for column in COLUMNS))]
+        fixtures = [
+            Fixture(teams[home_row], teams[away_row], status, utc_start,
+                    Result(result_status, home_team_goals_scored, away_team_goals_scored))
+            for home_row, away_row, status, utc_start, result_status, home_team_goals_scored, away_team_goals_scored
+            in zip(arrays['home_team'].tolist(), arrays['away_team'].tolist(), _unstack_strings(arrays, 'status'),
+                   _unstack_strings(arrays, 'utc_start'), _unstack_strings(arrays, 'result_status'),
+                   arrays['home_goals'].tolist(), arrays['away_goals'].tolist())
+        ]
+
+        for prediction in PREDICTIONS:
+            # A plain array is indexed much faster than a numpy.memmap and is still a view of the mapped file.
+            values = np.asarray(arrays[prediction])
+
+            for index in np.flatnonzero(arrays[f'has_{prediction}']).tolist():
+                # The matrices stay as (possibly memory mapped) arrays; the other predictions are held as lists.
+                if prediction == 'final_score_matrix':
+                    fixtures[index].final_score_matrix(values[index], bool(arrays['final_score_tail_mass'][index]))
+                else:
+                    getattr(fixtures[index], prediction)(values[index].tolist())
+
+        competition = cls(details['code'], details['name'], teams[:details['teams']], details['start_date'],
+                          details['end_date'], details['stage'])
+        competition._fixtures = fixtures
+        competition._index_fixtures(fixtures, [None if np.isnan(start) else start
+                                               for start in arrays['start'].tolist()])
+        return competition
+
+    def snapshot(self, path):
+        """
+        Save the teams, fixtures, results and predictions of the competition to a binary snapshot.
+
+        Each attribute is written as one array over every team or fixture (see `footy.snapshot`), and the
+        predictions are written as stacked arrays, so a competition with many seasons of fixtures is restored by
+        `restore` in a fraction of a second.  Teams that only appear in fixtures are saved with the fixtures, the UTC
+        start of each fixture is saved as a string and the histories of the teams are not saved.
+
+        Parameters
+        ----------
+        path : str
+            The path of the snapshot (conventionally ending in '.npz').
+
+        Raises
+        ------
+        ValueError
+            When a prediction (e.g. the final score matrix) does not have the same shape for every fixture.
+        """
+        teams = {}
+
+        for team in self._teams:
+            teams.setdefault(team.team_name(), team)
+
+        listed = len(teams)
+
+        for fixture in self._fixtures:
+            teams.setdefault(fixture.home_team.team_name(), fixture.home_team)
+            teams.setdefault(fixture.away_team.team_name(), fixture.away_team)
+
+        rows = {team_name: row for row, team_name in enumerate(teams)}
+        fixtures = self._fixtures
+        results = [fixture.result for fixture in fixtures]
+        arrays = {
+            'competition': np.array(json.dumps({'code': self._code, 'name': self._name, 'teams': listed,
+                                                'start_date': self._start_date, 'end_date': self._end_date,
+                                                'stage': self._stage})),
+            'team_names': np.array(list(teams), dtype=str),
+            'home_team': np.array([rows[fixture.home_team.team_name()] for fixture in fixtures], dtype=np.int64),
+            'away_team': np.array([rows[fixture.away_team.team_name()] for fixture in fixtures], dtype=np.int64),
+            'start': np.array([timestamp(fixture.utc_start) for fixture in fixtures], dtype=float),
+            'home_goals': np.array([result.home_team_goals_scored for result in results], dtype=np.int64),
+            'away_goals': np.array([result.away_team_goals_scored for result in results], dtype=np.int64),
+            'final_score_tail_mass': np.array([fixture.final_score_tail_mass() for fixture in fixtures], dtype=bool)
+        }
+
+        for column in COLUMNS:
+            arrays[column] = np.array([getattr(team, column)() for team in teams.values()], dtype=np.int64)
+
+        # The strings may be None (e.g. a fixture without a start), so whether each is set is saved alongside.
+        for name, values in (('status', [fixture.status for fixture in fixtures]),
+                             ('utc_start', [fixture.utc_start for fixture in fixtures]),
+                             ('result_status', [result.status for result in results])):
+            arrays[f'has_{name}'], arrays[name] = _stack_strings(values)
+
+        for prediction in PREDICTIONS:
+            arrays[f'has_{prediction}'], arrays[prediction] = _stack(
+                [getattr(fixture, prediction)() for fixture in fixtures], prediction
+            )
+
+        save_arrays(path, arrays)
+
+    def fixture_changed(self, fixture, attribute=None):
+        """
+        Update the indexes of the competition after the key, status or start of a fixture changes.
+
+        This is called by the setters of a fixture that has been added to the competition, so it does not normally
+        need to be called directly.  Only the indexes that the change affects are updated, so a change of status moves
+        the fixture between two status indexes in O(1) and the index of start times is only updated when the start
+        actually changes.
+
+        Parameters
+        ----------
+        fixture : footy.domain.Fixture.Fixture
+            The fixture that has changed.
+        attribute : str, optional
+            The name of the attribute that changed ('home_team', 'away_team', 'status' or 'utc_start').  Defaults to
+            checking every index.
+
+        Raises
+        ------
+        ValueError
+            When another fixture of the competition already has the new key of the fixture.  The indexes are left as
+            they were (and the setter of the fixture sets the attribute back).
+        """
+        sequence = fixture.competition_sequence(self)
+        entry = self._fixture_entries.get(sequence)
+
+        if entry is None or entry[0] is not fixture:
+            return
+
+        _, key, status, start = entry
+        new_key = key if attribute == 'status' else fixture.key()
+        new_start = timestamp(fixture.utc_start) if attribute in (None, 'utc_start') else start
+
+        if new_key != key and self._fixture_index.get(new_key, fixture) is not fixture:
+            raise ValueError(f'The competition already has a fixture with the key {new_key!r}.')
+
+        if new_key != key:
+            if self._fixture_index.get(key) is fixture:
+                del self._fixture_index[key]
+
+            self._fixture_index[new_key] = fixture
+
+            for team_name in key[:2]:
+                self._fixtures_by_team[team_name].pop(sequence, None)
+
+            for team_name in new_key[:2]:
+                self._fixtures_by_team.setdefault(team_name, {})[sequence] = fixture
+
+        if fixture.status != status:
+            del self._fixtures_by_status[status][sequence]
+            self._fixtures_by_status.setdefault(fixture.status, {})[sequence] = fixture
+
+        if new_start != start:
+            if start is not None:
+                del self._fixtures_by_start[bisect.bisect_left(self._fixtures_by_start, (start, sequence))]
+
+            if new_start is not None:
+                bisect.insort(self._fixtures_by_start, (new_start, sequence))
+
+        self._fixture_entries[sequence] = (fixture, new_key, fixture.status, new_start)
+
+    def _index_fixture(self, fixture, sequence=None, key=None, start=None, sort=True):
+        """
+        Add a fixture to the indexes of the competition.
+
+        Parameters
+        ----------
+        fixture : footy.domain.Fixture.Fixture
+            The fixture to index.
+        sequence : int, optional
+            The sequence number of the fixture in the competition.  Defaults to the next sequence number.
+        key : tuple, optional
+            The key of the fixture, if it is already known.  Defaults to calculating it.
+        start : float, optional
+            The timestamp of the start of the fixture, if it is already known.  Defaults to calculating it.
+        sort : bool, optional
+            If False, the fixture is appended to the index of start times, which the caller must then sort.  Defaults
+            to True (the fixture is inserted in order).
+        """
+        if sequence is None:
+            sequence = self._fixture_sequence
+            self._fixture_sequence += 1
+
+        if key is None:
+            key = fixture.key()
+
+        if start is None:
+            start = timestamp(fixture.utc_start)
+
+        self._fixture_index.setdefault(key, fixture)
+        self._fixture_entries[sequence] = (fixture, key, fixture.status, start)
+        self._fixtures_by_team.setdefault(key[0], {})[sequence] = fixture
+        self._fixtures_by_team.setdefault(key[1], {})[sequence] = fixture
+        self._fixtures_by_status.setdefault(fixture.status, {})[sequence] = fixture
+
+        if start is not None and sort:
+            bisect.insort(self._fixtures_by_start, (start, sequence))
+        elif start is not None:
+            self._fixtures_by_start.append((start, sequence))
+
+        fixture.add_competition(self, sequence)
+
+    def _index_fixtures(self, fixtures, starts=None):
+        """
+        Add a number of fixtures to the indexes of the competition, skipping fixtures that are already indexed.
+
+        The index of start times is sorted once at the end rather than as each fixture is added.
+
+        Parameters
+        ----------
+        fixtures : list of footy.domain.Fixture.Fixture
+            The fixtures to index.
+        starts : list of float, optional
+            The timestamp of the start of each fixture (None where it is not valid), if they are already known.
+            Defaults to calculating them.
+        """
+        if starts is None:
+            starts = [None] * len(fixtures)
+
+        for fixture, start in zip(fixtures, starts):
+            key = fixture.key()
+
+            if key not in self._fixture_index:
+                self._index_fixture(fixture, key=key, start=start, sort=False)
+
+        self._fixtures_by_start.sort()
+
+
+def _stack(values, name):
+    """
+    Stack the predictions of a number of fixtures into one array.
+
+    Parameters
+    ----------
+    values : list
+        The prediction of each fixture, or None where a fixture has not been predicted.
+    name : str
+        The name of the prediction (used in the error message).
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Whether each fixture has been predicted and the stacked predictions (NaN where a fixture has not been
+        predicted).
+
+    Raises
+    ------
+    ValueError
+        When the predictions do not all have the same shape.
+    """
+    present = np.array([value is not None for value in values], dtype=bool)
+    predicted = [value for value in values if value is not None]
+
+    if not predicted:
+        return present, np.zeros((len(values), 0))
+
+    stacked = np.full((len(values),) + np.shape(predicted[0]), np.nan)
+
+    try:
+        stacked[present] = predicted
+    except ValueError:
+        raise ValueError(f'The {name} of every fixture must have the same shape to be saved in a snapshot.')
+
+    return present, stacked
+
+
+def _stack_strings(values):
+    """
+    Stack a number of strings (any of which may be None) into one array.
+
+    Parameters
+    ----------
+    values : list
+        The strings, or None where a string is not set.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Whether each string is set and the strings (empty where a string is not set).
+    """
+    present = np.array([value is not None for value in values], dtype=bool)
+    return present, np.array(['' if value is None else value for value in values], dtype=str)
+
+
+def _unstack_strings(arrays, name):
+    """
+    Read a number of strings stacked by `_stack_strings` from the arrays of a snapshot.
+
+    Parameters
+    ----------
+    arrays : dict
+        The arrays of the snapshot.
+    name : str
+        The name of the strings.
+
+    Returns
+    -------
+    list
+        The strings, or None where a string was not set.
+    """
+    return [value if present else None
+            for present, value in zip(arrays[f'has_{name}'].tolist(), arrays[name].tolist())]
@@ -1,5 +1,8 @@
 """Fixture - Data structure for a fixture."""
+import weakref
 
+import numpy as np
+import pandas as pd
 
 from footy.domain.Result import Result
 
@@ -7,6 +10,10 @@ from footy.domain.Result import Result
 class Fixture:
     """Fixture - Data structure for a fixture."""
 
+    __slots__ = ('_home_team', '_away_team', '_status', '_utc_start', '_result', '_outcome_probabilities',
+                 '_largest_odds', '_home_team_goals_probability', '_away_team_goals_probability',
+                 '_final_score_probabilities', '_final_score_matrix', '_final_score_tail_mass', '_competitions')
+
     def __init__(self, home_team, away_team, status='SCHEDULED', utc_start='', result=None):
         """
         Construct a Fixture object.
@@ -30,9 +37,13 @@ class Fixture:
         self._utc_start = utc_start
         self._result = result or Result()
         self._outcome_probabilities = None
+        self._largest_odds = None
         self._home_team_goals_probability = None
         self._away_team_goals_probability = None
         self._final_score_probabilities = None
+        self._final_score_matrix = None
+        self._final_score_tail_mass = False
+        self._competitions = None
 
     def __eq__(self, other):
         """
@@ -55,7 +66,7 @@ class Fixture:
                 self._status == other._status and
                 self._utc_start == other._utc_start and
                 self._result == other._result and
-                self.largest_odds() == other.largest_odds()
+                self._largest_odds == other._largest_odds
         )
 
     def __ne__(self, other):
@@ -79,7 +90,7 @@ class Fixture:
                 self._status != other._status or
                 self._utc_start != other._utc_start or
                 self._result != other._result or
-                self.largest_odds() != other.largest_odds()
+                self._largest_odds != other._largest_odds
         )
 
     def __ge__(self, other):
@@ -97,7 +108,7 @@ class Fixture:
         bool
             True if >= to other.
         """
-        return self.largest_odds() >= other.largest_odds()
+        return self._largest_odds >= other._largest_odds
 
     def __gt__(self, other):
         """
@@ -113,7 +124,7 @@ class Fixture:
         bool
             True if other has greater odds.
         """
-        return self.largest_odds() > other.largest_odds()
+        return self._largest_odds > other._largest_odds
 
     def __le__(self, other):
         """
@@ -129,7 +140,7 @@ class Fixture:
         bool
             True if self <= other.
         """
-        return self.largest_odds() <= other.largest_odds()
+        return self._largest_odds <= other._largest_odds
 
     def __lt__(self, other):
         """
@@ -145,7 +156,35 @@ class Fixture:
         bool
             True if the other object is larger than the current object, false otherwise.
         """
-        return self.largest_odds() < other.largest_odds()
+        return self._largest_odds < other._largest_odds
+
+    def __getstate__(self):
+        """
+        Get the state of the fixture to be pickled.
+
+        The competitions that index the fixture are not pickled (a fixture would otherwise take every fixture of its
+        competitions with it).
+
+        Returns
+        -------
+        dict
+            The value of each attribute of the fixture.
+        """
+        return {name: getattr(self, name) for name in self.__slots__ if name != '_competitions'}
+
+    def __setstate__(self, state):
+        """
+        Set the state of an unpickled fixture.
+
+        Parameters
+        ----------
+        state : dict
+            The value of each attribute of the fixture.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self._competitions = None
 
     @property
     def home_team(self):
@@ -169,7 +208,8 @@ class Fixture:
         home_team : Team
             The value you wish to set the home_team property to.
         """
-        self._home_team = home_team
+        previous, self._home_team = self._home_team, home_team
+        self._changed('home_team', previous)
 
     @property
     def away_team(self):
@@ -193,7 +233,8 @@ class Fixture:
         away_team : Team
             The value you wish to set the away_team property to.
         """
-        self._away_team = away_team
+        previous, self._away_team = self._away_team, away_team
+        self._changed('away_team', previous)
 
     @property
     def status(self):
@@ -217,7 +258,8 @@ class Fixture:
         status : str
             The value you wish to set the status property to.
         """
-        self._status = status
+        previous, self._status = self._status, status
+        self._changed('status', previous)
 
     @property
     def utc_start(self):
@@ -241,7 +283,8 @@ class Fixture:
         utc_start : str
             The value you wish to set the utc_start property to.
         """
-        self._utc_start = utc_start
+        previous, self._utc_start = self._utc_start, utc_start
+        self._changed('utc_start', previous)
 
     @property
     def result(self):
@@ -267,6 +310,17 @@ class Fixture:
         """
         self._result = result
 
+    def key(self):
+        """
+        Get the key that identifies the fixture.
+
+        Returns
+        -------
+        tuple
+            The name of the home team, the name of the away team and the UTC date/time when the fixture starts.
+        """
+        return self._home_team.team_name(), self._away_team.team_name(), self._utc_start
+
     def outcome_probabilities(self, outcome_probabilities=None):
         """
         Get or set the outcome_probabilities of the fixture.
@@ -286,6 +340,7 @@ class Fixture:
         """
         if outcome_probabilities is not None:
             self._outcome_probabilities = outcome_probabilities
+            self._largest_odds = max(outcome_probabilities[:3]) if len(outcome_probabilities) else None
         return self._outcome_probabilities
 
     def home_team_goals_probability(self, home_team_goals_probability=None):
@@ -333,6 +388,60 @@ class Fixture:
             self._away_team_goals_probability = away_team_goals_probability
         return self._away_team_goals_probability
 
+    def add_competition(self, competition, sequence):
+        """
+        Add a competition that indexes the fixture.
+
+        This is called by `footy.domain.Competition.Competition.add_fixture`.  Each competition that indexes the
+        fixture is told when its key, status or start changes so that it can update its indexes.  The competitions are
+        held by weak reference, so the fixture does not keep a competition alive.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition that indexes the fixture.
+        sequence : int
+            The sequence number of the fixture within the competition.
+        """
+        if self._competitions is None:
+            self._competitions = {}
+
+        self._competitions[weakref.ref(competition)] = sequence
+
+    def competition_sequence(self, competition):
+        """
+        Get the sequence number of the fixture within a competition that indexes it.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition.
+
+        Returns
+        -------
+        int
+            The sequence number, or None if the fixture has not been added to the competition.
+        """
+        if self._competitions is None:
+            return None
+
+        return self._competitions.get(weakref.ref(competition))
+
+    def competitions(self):
+        """
+        Get the competitions that index the fixture.
+
+        Returns
+        -------
+        list of footy.domain.Competition.Competition
+            The competitions that the fixture has been added to (and that still exist).
+        """
+        if self._competitions is None:
+            return []
+
+        competitions = (reference() for reference in self._competitions)
+        return [competition for competition in competitions if competition is not None]
+
     def final_score_probabilities(self, final_score_probabilities=None):
         """
         Get or set the final_score_probabilities of the fixture.
@@ -350,26 +459,125 @@ class Fixture:
             A Pandas DataFrame with each row containing the number of goals scored by the home team, the number of
             goals scored by the away team and the probability of that final score. The table will be sorted with the
             most probable results descending.  If there is not enough data to calculate the probabilities, this
-            will return None.
+            will return None.  If the final score matrix has a tail bucket (see `final_score_matrix`), its goals are
+            labelled as a string such as '7+'.
         """
         if final_score_probabilities is not None:
             self._final_score_probabilities = final_score_probabilities
+        elif self._final_score_probabilities is None and self._final_score_matrix is not None:
+            home_goals, away_goals = np.nonzero(self._final_score_matrix)
+            labels = np.arange(len(self._final_score_matrix))
+
+            if self._final_score_tail_mass:
+                labels = np.array([*labels[:-1].tolist(), f'{len(labels) - 1}+'], dtype=object)
+
+            df = pd.DataFrame({
+                'home': labels[home_goals],
+                'away': labels[away_goals],
+                'probability': self._final_score_matrix[home_goals, away_goals]
+            })
+            df = df.sort_values('probability', ascending=False)
+            self._final_score_probabilities = df.reset_index(drop=True)
         return self._final_score_probabilities
 
+    def final_score_matrix(self, final_score_matrix=None, tail_mass=False):
+        """
+        Get or set the final_score_matrix of the fixture.
+
+        Setting the matrix discards any final_score_probabilities, which will be built from the matrix (and then
+        cached) when they are next requested.
+
+        Parameters
+        ----------
+        final_score_matrix: numpy.ndarray
+            A two dimensional array of the probability of each final score, indexed by the number of goals scored by
+            the home team and the number of goals scored by the away team.
+        tail_mass : bool, optional
+            Set with the matrix.  If True, the final row and column of the matrix hold the probability of more goals
+            than the previous row and column (see `footy.engine.OutcomeEngine.OutcomeEngine`) rather than an exact
+            number of goals.  Defaults to False.
+
+        Returns
+        -------
+        numpy.ndarray
+            A two dimensional array of the probability of each final score, indexed by the number of goals scored by
+            the home team and the number of goals scored by the away team.  If there is not enough data to calculate
+            the probabilities, this will return None.
+        """
+        if final_score_matrix is not None:
+            self._final_score_matrix = final_score_matrix
+            self._final_score_tail_mass = tail_mass
+            self._final_score_probabilities = None
+        return self._final_score_matrix
+
+    def final_score_tail_mass(self):
+        """
+        Check if the final score matrix has a tail bucket.
+
+        Returns
+        -------
+        bool
+            True if the final row and column of the final score matrix hold the probability of more goals than the
+            previous row and column.
+        """
+        return self._final_score_tail_mass
+
     def largest_odds(self):
         """
         Return the largest of the outcome probabilities.
 
+        The value is worked out once when the outcome probabilities are set, so the comparison methods (and sorting
+        or ranking many fixtures) do not go through the probabilities again.
+
         Returns
         -------
         float
             The largest probability from a home wine, draw or away win.
         """
-        probabilities = self.outcome_probabilities()
+        return self._largest_odds
 
-        if not probabilities:
-            return None
+    def _changed(self, attribute, previous):
+        """
+        Tell the competitions that index the fixture that its key, status or start has changed.
+
+        If a competition rejects the change (because another of its fixtures already has the new key), the attribute
+        is set back to its previous value, so the fixture and the indexes of its competitions stay as they were.
+
+        Parameters
+        ----------
+        attribute : str
+            The name of the attribute that changed.
+        previous : object
+            The value of the attribute before the change.
+
+        Raises
+        ------
+        ValueError
+            When a competition of the fixture already has another fixture with the new key.
+        """
+        if self._competitions is None:
+            return
+
+        try:
+            self._notify(attribute)
+        except ValueError:
+            setattr(self, f'_{attribute}', previous)
+            self._notify(attribute)
+            raise
+
+    def _notify(self, attribute):
+        """
+        Call `footy.domain.Competition.Competition.fixture_changed` of each competition that indexes the fixture.
+
+        Parameters
+        ----------
+        attribute : str
+            The name of the attribute that changed.
+        """
+        for reference in list(self._competitions):
+            competition = reference()
 
-        response = max(probabilities[0], probabilities[1])
-        response = max(response, probabilities[2])
-        return response
+            if competition is None:
+                del self._competitions[reference]
+            else:
+                competition.fixture_changed(self, attribute)
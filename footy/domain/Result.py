@@ -7,6 +7,8 @@
 class Result:
     """Result - Data structure for a result."""
 
+    __slots__ = ('_status', '_home_team_goals_scored', '_away_team_goals_scored')
+
     def __init__(self, status='SCHEDULED', home_team_goals_scored=0, away_team_goals_scored=0):
         """
         Construct a Result object.
@@ -0,0 +1,512 @@
+"""ResultsStore - Append-only, memory mapped store of the results of many seasons and competitions."""
+import json
+import os
+
+from datetime import datetime, timezone
+
+import numpy as np
+
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+from footy.season import season_of, season_start_month, timestamp
+
+RECORD = np.dtype([
+    ('competition', 'S8'),
+    ('season', '<i2'),
+    ('kickoff', '<i8'),
+    ('home_team', '<i4'),
+    ('away_team', '<i4'),
+    ('home_goals', '<i2'),
+    ('away_goals', '<i2'),
+    ('status', 'u1')
+])
+"""numpy.dtype : The fixed-width record held for each fixture."""
+STATUSES = ('SCHEDULED', 'LIVE', 'IN_PLAY', 'PAUSED', 'FINISHED', 'POSTPONED', 'SUSPENDED', 'CANCELLED')
+"""tuple of str : The statuses of a fixture, which are stored as their position in this tuple."""
+NO_KICKOFF = np.iinfo(np.int64).min
+"""int : The kickoff stored for a fixture without a valid UTC start."""
+GROUPS = ('season', 'competition', 'team')
+"""tuple of str : The attributes that records can be grouped by."""
+
+
+class ResultsStore:
+    """
+    ResultsStore - Append-only, memory mapped store of the results of many seasons and competitions.
+
+    Each fixture is held as a fixed-width record (see `RECORD`) of its competition code, season, kickoff (as a POSIX
+    timestamp), the integer ids of the home and away teams, the goals scored and the status.  The records are
+    appended to a binary file and read through a read-only `numpy.memmap`, so only the pages that are used are read
+    from disk and several processes reading the same store share those pages rather than each holding a copy (a
+    store is pickled as its path, so it can be passed to a process pool cheaply).  The names of the teams, indexed by
+    their id, are held in a JSON file alongside the records (the path of the store with '.json' appended).
+
+    Records can be read as arrays (`records`, `groups`) or as `footy.domain.Fixture.Fixture` objects that are
+    created as they are iterated (`fixtures`), so holding the results of many seasons costs a few dozen bytes per
+    fixture rather than a few hundred.
+
+    Only one process should append to a store at a time.  Other processes see the appended records after calling
+    `refresh`.
+
+    Examples
+    --------
+    >>> store = ResultsStore('results.bin', mode='a')
+    >>> store.append(competition.fixtures_with_status('FINISHED'), 'PL', season=2020)
+    >>> for season, records in store.groups('season'):
+    ...     print(season, records['home_goals'].mean())
+    >>> fixtures = list(store.fixtures(competition='PL', team='Arsenal'))
+    """
+
+    def __init__(self, path, mode='r'):
+        """
+        Construct a ResultsStore object.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file of records.
+        mode : str, optional
+            'r' to read an existing store or 'a' to read and append to a store, creating it if it does not exist.
+            Defaults to 'r'.
+
+        Raises
+        ------
+        FileNotFoundError
+            When reading a store that does not exist.
+        ValueError
+            When the mode is not valid or the store was written with different records.
+        """
+        if mode not in ('r', 'a'):
+            raise ValueError(f'Invalid mode: {mode!r}')
+
+        self._path = path
+        self._mode = mode
+        self._records = None
+
+        if mode == 'a' and not os.path.exists(path):
+            open(path, 'ab').close()
+            self._team_names = []
+            self._write_team_names()
+        else:
+            with open(self._team_names_path()) as f:
+                metadata = json.load(f)
+
+            if [tuple(field) for field in metadata['record']] != RECORD.descr:
+                raise ValueError(f'The store {path} was written with different records.')
+
+            self._team_names = metadata['team_names']
+
+        self._team_ids = {team_name: team_id for team_id, team_name in enumerate(self._team_names)}
+
+    def __iter__(self):
+        """
+        Iterate over every fixture of the store.
+
+        Returns
+        -------
+        iterator of footy.domain.Fixture.Fixture
+            The fixtures in the order they were appended.
+        """
+        return self.fixtures()
+
+    def __len__(self):
+        """
+        Get the number of fixtures held in the store.
+
+        Returns
+        -------
+        int
+            The number of fixtures.
+        """
+        return len(self.records())
+
+    def __reduce__(self):
+        """
+        Pickle the store as its path and mode, so the records are mapped again rather than copied.
+
+        Returns
+        -------
+        tuple
+            The class and the arguments to construct it with.
+        """
+        return self.__class__, (self._path, self._mode)
+
+    def append(self, fixtures, competition, season=None):
+        """
+        Append fixtures to the end of the store.
+
+        Teams that are not yet held in the store are given the next ids.
+
+        Parameters
+        ----------
+        fixtures : iterable of footy.domain.Fixture.Fixture
+            The fixtures to append.
+        competition : str
+            The code of the competition of the fixtures (of no more than eight characters).
+        season : int, optional
+            The year that the season of the fixtures starts in.  Defaults to the year that the season of each fixture
+            starts in (see `season_of` and `season_start_month`).
+
+        Returns
+        -------
+        int
+            The number of fixtures appended.
+
+        Raises
+        ------
+        ValueError
+            When the store is read only, the competition code is too long, a fixture has a status that is not in
+            `STATUSES` or the season of a fixture without a valid UTC start is not given.
+        """
+        if self._mode != 'a':
+            raise ValueError(f'The store {self._path} is read only.')
+
+        code = competition.encode('ascii')
+
+        if len(code) > RECORD['competition'].itemsize:
+            raise ValueError(f'The competition code {competition!r} is too long.')
+
+        fixtures = list(fixtures)
+        records = np.zeros(len(fixtures), dtype=RECORD)
+        team_count = len(self._team_names)
+
+        try:
+            self._fill(records, fixtures, code, season, season_start_month(competition))
+        except ValueError:
+            # Forget the teams of the fixtures that were not appended.
+            for team_name in self._team_names[team_count:]:
+                del self._team_ids[team_name]
+
+            del self._team_names[team_count:]
+            raise
+
+        # The names of new teams are written first, so a reader never sees a team id without its name.
+        if len(self._team_names) > team_count:
+            self._write_team_names()
+
+        with open(self._path, 'ab') as f:
+            records.tofile(f)
+
+        self._records = None
+        return len(records)
+
+    def competitions(self):
+        """
+        Get the codes of the competitions held in the store.
+
+        Returns
+        -------
+        list of str
+            The competition codes, sorted.
+        """
+        return [code.decode('ascii') for code in np.unique(self.records()['competition']).tolist()]
+
+    def fixtures(self, season=None, competition=None, team=None):
+        """
+        Iterate over fixtures of the store.
+
+        The fixture objects are created as they are iterated, with teams that only hold their names.
+
+        Parameters
+        ----------
+        season : int, optional
+            Only iterate over the fixtures of this season.
+        competition : str, optional
+            Only iterate over the fixtures of this competition.
+        team : str, optional
+            Only iterate over the fixtures where this team is playing at home or away.
+
+        Returns
+        -------
+        iterator of footy.domain.Fixture.Fixture
+            The fixtures in the order they were appended.
+        """
+        return self._fixtures(self.records(season, competition, team))
+
+    def groups(self, by, fixtures=False):
+        """
+        Iterate over the records of the store grouped by season, competition or team.
+
+        If the records were appended in order of the attribute (e.g. season by season), each group is a slice of
+        the memory mapped records rather than a copy.
+
+        Parameters
+        ----------
+        by : str
+            The attribute to group by (one of `GROUPS`).
+        fixtures : bool, optional
+            If True, each group is an iterator of fixture objects (see `fixtures`) rather than an array of records.
+            Defaults to False.
+
+        Returns
+        -------
+        iterator of tuple
+            The season, competition code or team name of each group (in sorted order) and its records or fixtures.
+
+        Raises
+        ------
+        ValueError
+            When the attribute is not one of `GROUPS`.
+        """
+        if by not in GROUPS:
+            raise ValueError(f'Invalid group: {by!r}')
+
+        return self._groups(by, fixtures)
+
+    def records(self, season=None, competition=None, team=None):
+        """
+        Get records of the store.
+
+        Parameters
+        ----------
+        season : int, optional
+            Only get the records of this season.
+        competition : str, optional
+            Only get the records of this competition.
+        team : str, optional
+            Only get the records where this team is playing at home or away.
+
+        Returns
+        -------
+        numpy.ndarray
+            The records (see `RECORD`) in the order they were appended.  Without any filter this is the read-only
+            memory mapped array of every record, otherwise it is a copy of the matching records.
+        """
+        if self._records is None:
+            self.refresh()
+
+        if season is None and competition is None and team is None:
+            return self._records
+
+        records = self._records
+        mask = np.ones(len(records), dtype=bool)
+
+        if season is not None:
+            mask &= records['season'] == season
+
+        if competition is not None:
+            mask &= records['competition'] == competition.encode('ascii')
+
+        if team is not None:
+            team_id = self._team_ids.get(team, -1)
+            mask &= (records['home_team'] == team_id) | (records['away_team'] == team_id)
+
+        return records[mask]
+
+    def refresh(self):
+        """Map the records again, so records appended since the store was opened (e.g. by another process) are read."""
+        if self._mode == 'r':
+            with open(self._team_names_path()) as f:
+                self._team_names = json.load(f)['team_names']
+
+            self._team_ids = {team_name: team_id for team_id, team_name in enumerate(self._team_names)}
+
+        count = os.path.getsize(self._path) // RECORD.itemsize
+
+        if count == 0:
+            self._records = np.zeros(0, dtype=RECORD)
+        else:
+            self._records = np.memmap(self._path, dtype=RECORD, mode='r', shape=(count,))
+
+    def seasons(self):
+        """
+        Get the seasons held in the store.
+
+        Returns
+        -------
+        list of int
+            The years that the seasons start in, sorted.
+        """
+        return np.unique(self.records()['season']).tolist()
+
+    def team_id(self, team_name):
+        """
+        Get the id of a team.
+
+        Parameters
+        ----------
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        int
+            The id of the team.
+
+        Raises
+        ------
+        KeyError
+            When the team is not held in the store.
+        """
+        return self._team_ids[team_name]
+
+    def team_names(self):
+        """
+        Get the names of the teams in order of their id.
+
+        Returns
+        -------
+        list of str
+            The names of the teams.
+        """
+        return list(self._team_names)
+
+    def _fill(self, records, fixtures, code, season, start_month):
+        """
+        Fill records from fixtures.
+
+        Parameters
+        ----------
+        records : numpy.ndarray
+            The records to fill, one per fixture.
+        fixtures : list of footy.domain.Fixture.Fixture
+            The fixtures.
+        code : bytes
+            The code of the competition of the fixtures.
+        season : int
+            The year that the season of the fixtures starts in, or None to work it out from the UTC start of each
+            fixture.
+        start_month : int
+            The month that the seasons of the competition start in.
+
+        Raises
+        ------
+        ValueError
+            When a fixture has a status that is not in `STATUSES` or the season of a fixture without a valid UTC
+            start is not given.
+        """
+        for index, fixture in enumerate(fixtures):
+            if fixture.status not in STATUSES:
+                raise ValueError(f'Invalid status: {fixture.status!r}')
+
+            kickoff = timestamp(fixture.utc_start)
+
+            if season is not None:
+                fixture_season = season
+            elif kickoff is None:
+                raise ValueError(f'The season of {fixture.key()} is needed as it does not have a valid UTC start.')
+            else:
+                fixture_season = season_of(kickoff, start_month)
+
+            records[index] = (code, fixture_season, NO_KICKOFF if kickoff is None else int(kickoff),
+                              self._team_id(fixture.home_team.team_name()),
+                              self._team_id(fixture.away_team.team_name()), fixture.result.home_team_goals_scored,
+                              fixture.result.away_team_goals_scored, STATUSES.index(fixture.status))
+
+    def _fixtures(self, records):
+        """
+        Create fixture objects from records.
+
+        Parameters
+        ----------
+        records : numpy.ndarray
+            The records.
+
+        Returns
+        -------
+        iterator of footy.domain.Fixture.Fixture
+            The fixtures.
+        """
+        teams = {}
+
+        for _, _, kickoff, home_team, away_team, home_goals, away_goals, status in records.tolist():
+            for team_id in (home_team, away_team):
+                if team_id not in teams:
+                    teams[team_id] = Team(self._team_names[team_id])
+
+            if kickoff == NO_KICKOFF:
+                utc_start = ''
+            else:
+                utc_start = datetime.fromtimestamp(kickoff, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+            status = STATUSES[status]
+            yield Fixture(teams[home_team], teams[away_team], status, utc_start, Result(status, home_goals, away_goals))
+
+    def _groups(self, by, fixtures):
+        """
+        Iterate over the records of the store grouped by season, competition or team.
+
+        Parameters
+        ----------
+        by : str
+            The attribute to group by (one of `GROUPS`).
+        fixtures : bool
+            If True, each group is an iterator of fixture objects rather than an array of records.
+
+        Returns
+        -------
+        iterator of tuple
+            The season, competition code or team name of each group and its records or fixtures.
+        """
+        records = self.records()
+
+        if by == 'team':
+            rows = np.concatenate([np.arange(len(records)), np.arange(len(records))])
+            keys = np.concatenate([records['home_team'], records['away_team']])
+        else:
+            rows = None
+            keys = records[by]
+
+        order = np.argsort(keys, kind='stable')
+        values, starts = np.unique(keys[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        contiguous = rows is None and bool(np.all(order[1:] > order[:-1]))
+
+        for value, start, end in zip(values.tolist(), starts.tolist(), ends.tolist()):
+            if contiguous:
+                group = records[start:end]
+            elif rows is None:
+                group = records[order[start:end]]
+            else:
+                # A team's records are put back in the order they were appended.
+                group = records[np.sort(rows[order[start:end]])]
+
+            if by == 'competition':
+                value = value.decode('ascii')
+            elif by == 'team':
+                value = self._team_names[value]
+
+            yield value, self._fixtures(group) if fixtures else group
+
+    def _team_id(self, team_name):
+        """
+        Get the id of a team, giving it the next id if it is not yet held in the store.
+
+        Parameters
+        ----------
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        int
+            The id of the team.
+        """
+        team_id = self._team_ids.get(team_name)
+
+        if team_id is None:
+            team_id = len(self._team_names)
+            self._team_names.append(team_name)
+            self._team_ids[team_name] = team_id
+
+        return team_id
+
+    def _team_names_path(self):
+        """
+        Get the path of the file holding the names of the teams.
+
+        Returns
+        -------
+        str
+            The path of the store with '.json' appended.
+        """
+        return self._path + '.json'
+
+    def _write_team_names(self):
+        """Write the names of the teams (and the layout of the records) to a new file that replaces the old one."""
+        path = self._team_names_path()
+
+        with open(path + '.tmp', 'w') as f:
+            json.dump({'record': RECORD.descr, 'team_names': self._team_names}, f)
+
+        os.replace(path + '.tmp', path)
@@ -0,0 +1,267 @@
+"""RingBuffer - Fixed capacity history of floats."""
+import numpy as np
+
+
+class RingBuffer:
+    """
+    RingBuffer - Fixed capacity history of floats.
+
+    Values are appended in O(1) and, once the buffer is full, each new value replaces the oldest.  The statistics are
+    calculated on the (at most two) slices of the underlying array that hold the values, so the history is never
+    copied.
+
+    Examples
+    --------
+    >>> history = RingBuffer(3)
+    >>> for value in [1.0, 2.0, 3.0, 4.0]:
+    ...     history.append(value)
+    >>> history.tolist()
+    [2.0, 3.0, 4.0]
+    >>> history.mean(window=2)
+    3.5
+    """
+
+    __slots__ = ('_values', '_start', '_size')
+
+    def __init__(self, capacity):
+        """
+        Construct a RingBuffer object.
+
+        Parameters
+        ----------
+        capacity : int
+            The largest number of values held.  Older values are discarded.
+
+        Raises
+        ------
+        ValueError
+            When the capacity is less than one.
+        """
+        if capacity < 1:
+            raise ValueError(f'The capacity must be at least one, got {capacity}.')
+
+        self._values = np.empty(capacity, dtype=float)
+        self._start = 0
+        self._size = 0
+
+    def __getitem__(self, index):
+        """
+        Get a value, where index 0 is the oldest value held and index -1 the newest.
+
+        Parameters
+        ----------
+        index : int
+            The index of the value.
+
+        Returns
+        -------
+        float
+            The value.
+
+        Raises
+        ------
+        IndexError
+            When the index is out of range.
+        """
+        if not -self._size <= index < self._size:
+            raise IndexError('RingBuffer index out of range')
+
+        return float(self._values[(self._start + index % self._size) % len(self._values)])
+
+    def __iter__(self):
+        """
+        Iterate over the values, oldest first.
+
+        Returns
+        -------
+        iterator of float
+            The values.
+        """
+        for values in self._slices(self._size):
+            yield from values.tolist()
+
+    def __len__(self):
+        """
+        Get the number of values held.
+
+        Returns
+        -------
+        int
+            The number of values held.
+        """
+        return self._size
+
+    def __repr__(self):
+        """
+        Get a representation of the buffer.
+
+        Returns
+        -------
+        str
+            The capacity and values of the buffer.
+        """
+        return f'RingBuffer(capacity={len(self._values)}, values={self.tolist()})'
+
+    def append(self, value):
+        """
+        Append a value, discarding the oldest value if the buffer is full.
+
+        Parameters
+        ----------
+        value : float
+            The value to append.
+        """
+        capacity = len(self._values)
+
+        if self._size < capacity:
+            self._values[(self._start + self._size) % capacity] = value
+            self._size += 1
+        else:
+            self._values[self._start] = value
+            self._start = (self._start + 1) % capacity
+
+    def capacity(self):
+        """
+        Get the largest number of values held.
+
+        Returns
+        -------
+        int
+            The capacity of the buffer.
+        """
+        return len(self._values)
+
+    def clear(self):
+        """Discard every value."""
+        self._start = 0
+        self._size = 0
+
+    def ewm(self, alpha, window=None):
+        """
+        Calculate the exponentially weighted mean of the newest values.
+
+        The weight of a value is (1 - alpha) to the power of its age, so the newest value has a weight of one.  This
+        matches `pandas.Series.ewm(alpha=alpha).mean()` at the newest value.
+
+        Parameters
+        ----------
+        alpha : float
+            The smoothing factor, greater than 0.0 and at most 1.0.
+        window : int, optional
+            The number of newest values to include.  Defaults to every value held.
+
+        Returns
+        -------
+        float
+            The exponentially weighted mean, or NaN if the buffer is empty.
+
+        Raises
+        ------
+        ValueError
+            When alpha is not greater than 0.0 and at most 1.0.
+        """
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f'Alpha must be greater than 0.0 and at most 1.0, got {alpha}.')
+
+        weighted_total = 0.0
+        total_weight = 0.0
+        age = 0
+
+        # The slices are oldest first, so work backwards from the newest value.
+        for values in reversed(self._slices(window)):
+            weights = (1.0 - alpha) ** np.arange(age + len(values) - 1, age - 1, -1)
+            weighted_total += float(weights @ values)
+            total_weight += float(weights.sum())
+            age += len(values)
+
+        return weighted_total / total_weight if age else float('nan')
+
+    def mean(self, window=None):
+        """
+        Calculate the mean of the newest values.
+
+        Parameters
+        ----------
+        window : int, optional
+            The number of newest values to include.  Defaults to every value held.
+
+        Returns
+        -------
+        float
+            The mean, or NaN if the buffer is empty.
+        """
+        slices = self._slices(window)
+        count = sum(len(values) for values in slices)
+        return sum(float(values.sum()) for values in slices) / count if count else float('nan')
+
+    def std(self, window=None, ddof=0):
+        """
+        Calculate the standard deviation of the newest values.
+
+        Parameters
+        ----------
+        window : int, optional
+            The number of newest values to include.  Defaults to every value held.
+        ddof : int, optional
+            The delta degrees of freedom (1 for the sample standard deviation).  Defaults to 0.
+
+        Returns
+        -------
+        float
+            The standard deviation, or NaN if there are not more values than ddof.
+        """
+        slices = self._slices(window)
+        count = sum(len(values) for values in slices)
+
+        if count <= ddof:
+            return float('nan')
+
+        mean = sum(float(values.sum()) for values in slices) / count
+        squares = sum(float(np.square(values - mean).sum()) for values in slices)
+        return (squares / (count - ddof)) ** 0.5
+
+    def tolist(self):
+        """
+        Get the values as a list.
+
+        Returns
+        -------
+        list of float
+            The values, oldest first.
+        """
+        return list(self)
+
+    def values(self):
+        """
+        Get a copy of the values as an array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values, oldest first.
+        """
+        return np.concatenate(self._slices(self._size))
+
+    def _slices(self, window):
+        """
+        Get views of the underlying array that hold the newest values.
+
+        Parameters
+        ----------
+        window : int
+            The number of newest values.  If None, or larger than the number of values held, every value is included.
+
+        Returns
+        -------
+        list of numpy.ndarray
+            One or two views, oldest values first.
+        """
+        count = self._size if window is None else max(0, min(window, self._size))
+        capacity = len(self._values)
+        first = (self._start + self._size - count) % capacity
+        last = first + count
+
+        if last <= capacity:
+            return [self._values[first:last]]
+
+        return [self._values[first:], self._values[:last - capacity]]
@@ -1,9 +1,16 @@
 """Result - Data structure for a team."""
+from footy.domain.RingBuffer import RingBuffer
+
+HISTORY_CAPACITY = 100
+"""int : The number of values held by each history of a team (older values are discarded)."""
 
 
 class Team:
     """Result - Data structure for a team."""
 
+    __slots__ = ('_team_name', '_goals_for', '_goals_against', '_home_games', '_away_games', '_points',
+                 '_historic_briers_scores', '_historic_attack_strength', '_historic_defence_factor')
+
     def __init__(self, team_name, goals_for=0, goals_against=0, home_games=0, away_games=0, points=0):
         """Construct a Team object."""
         self._team_name = team_name
@@ -12,9 +19,11 @@ class Team:
         self._home_games = home_games
         self._away_games = away_games
         self._points = points
-        self._historic_briers_scores = []
-        self._historic_attack_strength = []
-        self._historic_defence_factor = []
+
+        # Most teams never have a history, so the histories are only created when they are first used.
+        self._historic_briers_scores = None
+        self._historic_attack_strength = None
+        self._historic_defence_factor = None
 
     def __eq__(self, other):
         """
@@ -31,13 +40,13 @@ class Team:
             True/False if the values in the two objects are equal.
         """
         return (
-                self.__class__ == other.__class__ and
-                self._team_name == other._team_name and
-                self._goals_for == other._goals_for and
-                self._goals_against == other._goals_against and
-                self._home_games == other._home_games and
-                self._away_games == other._away_games and
-                self._points == other._points
+                isinstance(other, Team) and
+                self.team_name() == other.team_name() and
+                self.goals_for() == other.goals_for() and
+                self.goals_against() == other.goals_against() and
+                self.home_games() == other.home_games() and
+                self.away_games() == other.away_games() and
+                self.points() == other.points()
         )
 
     def team_name(self):
@@ -99,9 +108,12 @@ class Team:
 
         Returns
         -------
-        list of floats
-            A list of the historic attack strengths.
+        footy.domain.RingBuffer.RingBuffer
+            The historic attack strengths, holding the newest `HISTORY_CAPACITY` values.
         """
+        if self._historic_attack_strength is None:
+            self._historic_attack_strength = RingBuffer(HISTORY_CAPACITY)
+
         if attack_strength is not None:
             self._historic_attack_strength.append(attack_strength)
 
@@ -117,9 +129,12 @@ class Team:
 
         Returns
         -------
-        list of float
-            List of the historic outcome Briers scores.
+        footy.domain.RingBuffer.RingBuffer
+            The historic outcome Briers scores, holding the newest `HISTORY_CAPACITY` values.
         """
+        if self._historic_briers_scores is None:
+            self._historic_briers_scores = RingBuffer(HISTORY_CAPACITY)
+
         if briers_score is not None:
             self._historic_briers_scores.append(briers_score)
         return self._historic_briers_scores
@@ -135,9 +150,12 @@ class Team:
 
         Returns
         -------
-        list of float
-            The historic defence factors for this team.
+        footy.domain.RingBuffer.RingBuffer
+            The historic defence factors for this team, holding the newest `HISTORY_CAPACITY` values.
         """
+        if self._historic_defence_factor is None:
+            self._historic_defence_factor = RingBuffer(HISTORY_CAPACITY)
+
         if defence_factor is not None:
             self._historic_defence_factor.append(defence_factor)
 
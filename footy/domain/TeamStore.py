@@ -0,0 +1,468 @@
+"""TeamStore - Columnar data structure for the statistics of many teams."""
+import numpy as np
+
+from footy.domain.Team import Team
+
+COLUMNS = ('goals_for', 'goals_against', 'home_games', 'away_games', 'points')
+"""tuple of str : The statistics held for each team."""
+
+
+class TeamStore:
+    """
+    TeamStore - Columnar data structure for the statistics of many teams.
+
+    Each statistic is held in a NumPy array with one row per team, and the team names are indexed to their row.  The
+    league totals of each statistic and the number of teams that have not played both a home and an away game are
+    maintained as rows are written, so reading them costs O(1).
+    """
+
+    def __init__(self, capacity=32):
+        """
+        Construct a TeamStore object.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            The number of rows to allocate initially.  The store grows as required.  Defaults to 32.
+        """
+        self._columns = {column: np.zeros(capacity, dtype=np.int64) for column in COLUMNS}
+        self._team_names = []
+        self._index = {}
+        self._totals = dict.fromkeys(COLUMNS, 0)
+        self._incomplete_teams = 0
+
+    def __contains__(self, team_name):
+        """
+        Check if a team is held in the store.
+
+        Parameters
+        ----------
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        bool
+            True if the team is held in the store.
+        """
+        return team_name in self._index
+
+    def __len__(self):
+        """
+        Get the number of teams held in the store.
+
+        Returns
+        -------
+        int
+            The number of teams.
+        """
+        return len(self._team_names)
+
+    def add_team(self, team):
+        """
+        Add (or update using the team name as a key) the statistics of a team.
+
+        Parameters
+        ----------
+        team : footy.domain.Team.Team
+            The team to be added.
+
+        Returns
+        -------
+        int
+            The row of the team in the store.
+        """
+        team_name = team.team_name()
+        row = self._index.get(team_name)
+
+        if row is None:
+            row = len(self._team_names)
+
+            if row == len(self._columns['goals_for']):
+                self._grow()
+
+            self._team_names.append(team_name)
+            self._index[team_name] = row
+            self._incomplete_teams += 1
+
+        for column in COLUMNS:
+            self.set(row, column, getattr(team, column)())
+
+        return row
+
+    def column(self, column):
+        """
+        Get the values of a statistic for every team.
+
+        Parameters
+        ----------
+        column : str
+            The name of the statistic (one of `COLUMNS`).
+
+        Returns
+        -------
+        numpy.ndarray
+            A read-only view of the statistic with one element per row.
+        """
+        values = self._columns[column][:len(self._team_names)]
+        values.flags.writeable = False
+        return values
+
+    @classmethod
+    def from_columns(cls, team_names, columns):
+        """
+        Construct a TeamStore object from the values of every statistic at once (e.g. from a snapshot).
+
+        The league totals and the number of incomplete teams are calculated with one vectorised pass over the
+        columns rather than team by team.
+
+        Parameters
+        ----------
+        team_names : list of str
+            The names of the teams in row order.
+        columns : dict
+            The values of each statistic (see `COLUMNS`) in row order.
+
+        Returns
+        -------
+        footy.domain.TeamStore.TeamStore
+            The store holding the teams.
+
+        Raises
+        ------
+        ValueError
+            When a team name is repeated or a statistic does not have one value per team.
+        """
+        store = cls(max(len(team_names), 1))
+        store._team_names = [str(team_name) for team_name in team_names]
+        store._index = {team_name: row for row, team_name in enumerate(store._team_names)}
+
+        if len(store._index) != len(store._team_names):
+            raise ValueError('The team names of a store must be unique.')
+
+        for column in COLUMNS:
+            values = np.asarray(columns[column], dtype=np.int64)
+
+            if values.shape != (len(team_names),):
+                raise ValueError(f'The {column} column must have one value per team.')
+
+            store._columns[column][:len(values)] = values
+            store._totals[column] = int(values.sum())
+
+        store._incomplete_teams = int(np.count_nonzero((store.column('home_games') == 0) |
+                                                       (store.column('away_games') == 0)))
+        return store
+
+    def get(self, row, column):
+        """
+        Get the value of a statistic for a team.
+
+        Parameters
+        ----------
+        row : int
+            The row of the team.
+        column : str
+            The name of the statistic (one of `COLUMNS`).
+
+        Returns
+        -------
+        int
+            The value of the statistic.
+        """
+        return int(self._columns[column][row])
+
+    def incomplete_teams(self):
+        """
+        Get the number of teams that have not played at least one home game and one away game.
+
+        Returns
+        -------
+        int
+            The number of teams.
+        """
+        return self._incomplete_teams
+
+    def row(self, team_name):
+        """
+        Get the row of a team.
+
+        Parameters
+        ----------
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        int
+            The row of the team.
+
+        Raises
+        ------
+        KeyError
+            When the team is not held in the store.
+        """
+        return self._index[team_name]
+
+    def rows(self, team_names):
+        """
+        Get the rows of a number of teams.
+
+        Parameters
+        ----------
+        team_names : iterable of str
+            The names of the teams.
+
+        Returns
+        -------
+        numpy.ndarray
+            The row of each team.
+
+        Raises
+        ------
+        KeyError
+            When a team is not held in the store.
+        """
+        index = self._index
+        return np.array([index[team_name] for team_name in team_names], dtype=np.intp)
+
+    def set(self, row, column, value):
+        """
+        Set the value of a statistic for a team.
+
+        Parameters
+        ----------
+        row : int
+            The row of the team.
+        column : str
+            The name of the statistic (one of `COLUMNS`).
+        value : int
+            The value of the statistic.
+        """
+        values = self._columns[column]
+        previous = int(values[row])
+        values[row] = value
+        self._totals[column] += value - previous
+
+        if column in ('home_games', 'away_games'):
+            home_games = self._columns['home_games'][row]
+            away_games = self._columns['away_games'][row]
+            was_incomplete = previous == 0 or (home_games if column == 'away_games' else away_games) == 0
+            self._incomplete_teams += int(home_games == 0 or away_games == 0) - int(was_incomplete)
+
+    def team_name(self, row):
+        """
+        Get the name of the team held in a row.
+
+        Parameters
+        ----------
+        row : int
+            The row of the team.
+
+        Returns
+        -------
+        str
+            The name of the team.
+        """
+        return self._team_names[row]
+
+    def team_names(self):
+        """
+        Get the names of the teams in row order.
+
+        Returns
+        -------
+        list of str
+            The names of the teams.
+        """
+        return list(self._team_names)
+
+    def total(self, column):
+        """
+        Get the total of a statistic over every team.
+
+        Parameters
+        ----------
+        column : str
+            The name of the statistic (one of `COLUMNS`).
+
+        Returns
+        -------
+        int
+            The total of the statistic.
+        """
+        return self._totals[column]
+
+    def view(self, team_name):
+        """
+        Get a team object that reads and writes its statistics from the store.
+
+        Parameters
+        ----------
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        footy.domain.TeamStore.TeamView
+            A view of the team.
+
+        Raises
+        ------
+        KeyError
+            When the team is not held in the store.
+        """
+        return TeamView(self, self._index[team_name])
+
+    def _grow(self):
+        """Double the number of rows allocated for each statistic."""
+        for column in COLUMNS:
+            values = self._columns[column]
+            grown = np.zeros(max(2 * len(values), 1), dtype=values.dtype)
+            grown[:len(values)] = values
+            self._columns[column] = grown
+
+
+class TeamView(Team):
+    """TeamView - A team whose statistics are held in a row of a TeamStore."""
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store, row):
+        """
+        Construct a TeamView object.
+
+        Parameters
+        ----------
+        store : footy.domain.TeamStore.TeamStore
+            The store holding the statistics of the team.
+        row : int
+            The row of the team in the store.
+        """
+        self._store = store
+        self._row = row
+        self._historic_briers_scores = None
+        self._historic_attack_strength = None
+        self._historic_defence_factor = None
+
+    def team_name(self):
+        """
+        Getter method for property team_name.
+
+        Returns
+        -------
+        str
+            The value of property team_name.
+        """
+        return self._store.team_name(self._row)
+
+    def goals_for(self, goals_for=None):
+        """
+        Getter/setter for property goals_for.
+
+        Parameters
+        ----------
+        goals_for : int, optional
+            Set the value of property goals_for.
+
+        Returns
+        -------
+        int
+            The value of property goals_for.
+        """
+        return self._column('goals_for', goals_for)
+
+    def goals_against(self, goals_against=None):
+        """
+        Getter/setter method for property goals_against.
+
+        Parameters
+        ----------
+        goals_against : int, optional
+            The value to set the property to.
+
+        Returns
+        -------
+        int
+            The value of property goals_against.
+        """
+        return self._column('goals_against', goals_against)
+
+    def home_games(self, home_games=None):
+        """
+        Setter/getter method for property home_games.
+
+        Parameters
+        ----------
+        home_games : int, optional
+            The value you wish to set the home_games property to.
+
+        Returns
+        -------
+        int
+            The value of property home_games.
+        """
+        return self._column('home_games', home_games)
+
+    def away_games(self, away_games=None):
+        """
+        Getter/setter method for property away_games.
+
+        Parameters
+        ----------
+        away_games : int, optional
+            The value you wish to set the away_games property to.
+
+        Returns
+        -------
+        int
+            The value of property away_games.
+        """
+        return self._column('away_games', away_games)
+
+    def points(self, points=None):
+        """
+        Getter/setter method for property points.
+
+        Parameters
+        ----------
+        points : int, optional
+            The value you wish to set the points property to.
+
+        Returns
+        -------
+        int
+            The value of property points.
+        """
+        return self._column('points', points)
+
+    def goal_difference(self):
+        """
+        Calculate and return the goal difference for the team.
+
+        Returns
+        -------
+        int
+            goals_for - goals_against
+        """
+        return self.goals_for() - self.goals_against()
+
+    def _column(self, column, value):
+        """
+        Get or set a statistic of the team in the store.
+
+        Parameters
+        ----------
+        column : str
+            The name of the statistic.
+        value : int or None
+            The value to set the statistic to (if not None).
+
+        Returns
+        -------
+        int
+            The value of the statistic.
+        """
+        if value is not None:
+            self._store.set(self._row, column, value)
+
+        return self._store.get(self._row, column)
@@ -0,0 +1,234 @@
+"""Backtest Engine - Walk-forward replay of finished fixtures to score the predictions of the model."""
+import itertools
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from footy import Footy
+from footy.domain.Competition import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+from footy.engine.OutcomeEngine import OutcomeEngine
+from footy.engine.UpdateEngine import UpdateEngine
+from footy.instrumentation import register
+from footy.season import season_of, season_start_month, timestamp
+
+FIXTURE_COLUMNS = {
+    'competition': object,
+    'season': np.int64,
+    'matchday': object,
+    'utc_start': object,
+    'home_team': object,
+    'away_team': object,
+    'home_goals': np.int64,
+    'away_goals': np.int64,
+    'home_expected_goals': float,
+    'away_expected_goals': float
+}
+"""dict : The columns (and their types) describing each replayed fixture, before its probabilities and score."""
+
+
+class BacktestEngine:
+    """
+    Backtest Engine - Walk-forward replay of finished fixtures to score the predictions of the model.
+
+    The FINISHED fixtures of each competition are replayed in the order they started, one season and one matchday
+    (the UTC date of the start) at a time.  Each season (see `footy.season.season_of`, as some
+    competitions play a season in a calendar year) starts from an empty table.  Before each matchday the
+    expected goals of its fixtures are calculated from the table as it stood at the end of the previous matchday.
+    Its results are then applied to the teams of the table with
+    `footy.engine.UpdateEngine.UpdateEngine.apply_results` and only the teams that changed are added to the model
+    again, so the table is updated incrementally rather than rebuilt.  Fixtures are only predicted once every team of
+    the season has played at least one home game and one away game (as for `footy.Footy.predict_fixtures`).
+
+    The probabilities of every predicted fixture are calculated at the end with a single vectorised call of the
+    outcome engine and scored with `footy.Footy.brier_scores`.  Several competitions can be replayed in a pool of
+    processes.
+
+    Examples
+    --------
+    >>> competitions = UpdateEngine().load_results(['E0-2019.csv', 'E0-2020.csv', 'D1-2020.csv'])
+    >>> backtest = BacktestEngine(workers=4).backtest(list(competitions.values()))
+    >>> backtest['seasons']
+    >>> backtest['teams'].sort_values('mean').head()
+    """
+
+    def __init__(self, outcome_engine=None, workers=1, season_start_months=None):
+        """
+        Construct a BacktestEngine object.
+
+        Parameters
+        ----------
+        outcome_engine : footy.engine.OutcomeEngine.OutcomeEngine, optional
+            The engine that calculates the probabilities.  Defaults to an OutcomeEngine with the default settings.
+        workers : int, optional
+            The number of processes that competitions are replayed in.  Defaults to 1 (no process pool).
+        season_start_months : dict, optional
+            The month that the seasons of a competition start in, by competition code.  Defaults to the month given
+            by `footy.season.season_start_month` (July, or January for calendar year competitions such as
+            BSA).
+        """
+        self._outcome_engine = outcome_engine or OutcomeEngine()
+        self._workers = workers
+        self._season_start_months = season_start_months or {}
+
+    def backtest(self, competition, workers=None):
+        """
+        Replay the finished fixtures of a competition (or competitions) and score the predictions.
+
+        Finished fixtures without a valid UTC start cannot be put in order, so they are not replayed.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition or list
+            The competition (or competitions) to replay.
+        workers : int, optional
+            The number of processes that competitions are replayed in.  Defaults to the number the engine was
+            constructed with.
+
+        Returns
+        -------
+        dict
+            pandas.DataFrame objects of the predicted fixtures ('fixtures', one row per fixture with its expected
+            goals, outcome probabilities and Brier Score) and of the number of predictions, total and mean Brier Score
+            of each matchday ('matchdays'), season ('seasons'), competition ('competitions') and team ('teams').
+        """
+        competitions = [competition] if isinstance(competition, Competition) else list(competition)
+        workers = self._workers if workers is None else workers
+        arguments = [_fixtures(item, self._season_start_months.get(item.code(), season_start_month(item.code())))
+                     for item in competitions]
+
+        if workers > 1 and len(arguments) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(arguments))) as executor:
+                replays = list(executor.map(_replay, arguments))
+        else:
+            replays = list(map(_replay, arguments))
+
+        frames = [pd.DataFrame({'competition': item.code(), **replay})
+                  for item, replay in zip(competitions, replays) if replay['season']]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+            {column: pd.Series(dtype=dtype) for column, dtype in FIXTURE_COLUMNS.items()}
+        )
+        footy = Footy(outcome_engine=self._outcome_engine)
+        y_prob = np.zeros((len(df), 3))
+
+        if len(df):
+            prediction = self._outcome_engine.predict(df['home_expected_goals'].to_numpy(),
+                                                      df['away_expected_goals'].to_numpy())
+            y_prob = np.asarray(prediction['outcome_probabilities'], dtype=float)
+
+        home_goals = df['home_goals'].to_numpy()
+        away_goals = df['away_goals'].to_numpy()
+        y_true = np.eye(3)[np.where(home_goals > away_goals, 0, np.where(home_goals == away_goals, 1, 2))]
+        scores = footy.brier_scores(y_true, y_prob)
+        df['home_win'] = y_prob[:, 0]
+        df['draw'] = y_prob[:, 1]
+        df['away_win'] = y_prob[:, 2]
+        df['brier_score'] = scores
+        return {
+            'fixtures': df,
+            'matchdays': footy.group_brier_scores(scores, df['matchday'].to_numpy()),
+            'seasons': footy.group_brier_scores(scores, df['season'].to_numpy()),
+            'competitions': footy.group_brier_scores(scores, df['competition'].to_numpy()),
+            'teams': footy.team_brier_scores(scores, df['home_team'].to_numpy(), df['away_team'].to_numpy())
+        }
+
+
+def _fixtures(competition, start_month):
+    """
+    Get the finished fixtures of a competition in the order they started.
+
+    Parameters
+    ----------
+    competition : footy.domain.Competition.Competition
+        The competition.
+    start_month : int
+        The month that the seasons of the competition start in.
+
+    Returns
+    -------
+    list of tuple
+        The season, matchday, UTC start, home team name, away team name, home goals and away goals of each fixture.
+    """
+    fixtures = []
+
+    for fixture in competition.fixtures_between():
+        if fixture.status != 'FINISHED':
+            continue
+
+        start = timestamp(fixture.utc_start)
+        home_team_name, away_team_name, utc_start = fixture.key()
+        matchday = datetime.fromtimestamp(start, timezone.utc).date().isoformat()
+        fixtures.append((season_of(start, start_month), matchday, utc_start, home_team_name, away_team_name,
+                         fixture.result.home_team_goals_scored, fixture.result.away_team_goals_scored))
+
+    return fixtures
+
+
+def _replay(fixtures):
+    """
+    Replay the finished fixtures of a competition, calculating the expected goals of each before its matchday.
+
+    Parameters
+    ----------
+    fixtures : list of tuple
+        The fixtures as returned by `_fixtures`.
+
+    Returns
+    -------
+    dict
+        Lists of the season, matchday, UTC start, team names, goals and expected goals of each predicted fixture.
+    """
+    update_engine = UpdateEngine()
+    replay = {column: [] for column in list(FIXTURE_COLUMNS)[1:]}
+
+    for _, season in itertools.groupby(fixtures, key=lambda fixture: fixture[0]):
+        season = list(season)
+        team_names = list(dict.fromkeys(team_name for fixture in season for team_name in fixture[3:5]))
+        table = Competition(teams=[Team(team_name) for team_name in team_names])
+        footy = Footy()
+
+        for team in table.teams:
+            footy.add_team(team)
+
+        incomplete_teams = set(team_names)
+        finished = 0
+        home_goals = 0
+        away_goals = 0
+
+        for _, matchday in itertools.groupby(season, key=lambda fixture: fixture[1]):
+            matchday = list(matchday)
+            pairs = [(table.get_team(fixture[3]), table.get_team(fixture[4])) for fixture in matchday]
+
+            if finished and not incomplete_teams:
+                footy.average_goals_scored_by_a_home_team(round(home_goals / finished, 2))
+                footy.average_goals_scored_by_an_away_team(round(away_goals / finished, 2))
+                home_expected_goals, away_expected_goals = footy.expected_goals(pairs)
+
+                for fixture, home, away in zip(matchday, home_expected_goals.tolist(), away_expected_goals.tolist()):
+                    for column, value in zip(replay, fixture + (home, away)):
+                        replay[column].append(value)
+
+            changed_teams = [table.get_team(team_name) for team_name in update_engine.apply_results(table, [
+                Fixture(home_team, away_team, 'FINISHED', fixture[2], Result('FINISHED', fixture[5], fixture[6]))
+                for fixture, (home_team, away_team) in zip(matchday, pairs)
+            ])]
+
+            # Only the teams whose results changed are added again, which keeps the league totals up to date.
+            for team in changed_teams:
+                footy.add_team(team)
+
+            finished += len(matchday)
+            home_goals += sum(fixture[5] for fixture in matchday)
+            away_goals += sum(fixture[6] for fixture in matchday)
+            incomplete_teams.difference_update(team.team_name() for team in changed_teams
+                                               if team.home_games() > 0 and team.away_games() > 0)
+
+    return replay
+
+
+register(BacktestEngine, 'backtest')
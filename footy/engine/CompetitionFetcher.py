@@ -0,0 +1,164 @@
+"""Competition Fetcher - Fetch competitions concurrently over pooled HTTP connections."""
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+"""tuple of int : The HTTP statuses that are retried."""
+
+
+class CompetitionFetcher:
+    """
+    Competition Fetcher - Fetch competitions concurrently over pooled HTTP connections.
+
+    The pages of the competitions are fetched by a pool of threads sharing one `requests.Session`, so connections to
+    the same host are kept alive and reused.  No more than `max_per_host` requests are made to a host at once, every
+    request has a timeout and failed connections and retryable statuses (see `RETRY_STATUSES`) are retried with an
+    exponential backoff.  The source (see `footy.engine.TableSource.TableSource`) provides the URL of each competition
+    and turns the page into a competition.
+
+    Examples
+    --------
+    >>> with CompetitionFetcher(TableSource('footy.yml'), max_workers=9) as fetcher:
+    ...     competitions = fetcher.fetch_all()
+    >>> competitions['PL'].get_team('Arsenal').points()
+    """
+
+    def __init__(self, source, max_workers=8, max_per_host=4, timeout=10.0, retries=3, backoff_factor=0.5):
+        """
+        Construct a CompetitionFetcher object.
+
+        Parameters
+        ----------
+        source : footy.engine.TableSource.TableSource
+            The source of the URLs and the parser of the pages.
+        max_workers : int, optional
+            The number of threads fetching pages (and the number of connections kept per host).  Defaults to 8.
+        max_per_host : int, optional
+            The largest number of requests made to one host at once.  Defaults to 4.
+        timeout : float, optional
+            The number of seconds to wait to connect to a host or for data from it.  Defaults to 10.0.
+        retries : int, optional
+            The number of times a failed request is retried.  Defaults to 3.
+        backoff_factor : float, optional
+            The factor (in seconds) of the exponentially increasing delay between retries.  Defaults to 0.5.
+        """
+        self._source = source
+        self._max_workers = max_workers
+        self._max_per_host = max_per_host
+        self._timeout = timeout
+        self._semaphores = {}
+        self._lock = threading.Lock()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers,
+                              max_retries=Retry(total=retries, backoff_factor=backoff_factor,
+                                                status_forcelist=RETRY_STATUSES, raise_on_status=False))
+        self._session = requests.Session()
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def __enter__(self):
+        """
+        Enter a with block.
+
+        Returns
+        -------
+        footy.engine.CompetitionFetcher.CompetitionFetcher
+            The fetcher.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the connections at the end of a with block.
+
+        Parameters
+        ----------
+        exc_type : type
+            The type of the exception raised in the block, if any.
+        exc_value : Exception
+            The exception raised in the block, if any.
+        traceback : traceback
+            The traceback of the exception raised in the block, if any.
+        """
+        self.close()
+
+    def close(self):
+        """Close the pooled connections."""
+        self._session.close()
+
+    def fetch(self, code):
+        """
+        Fetch a competition.
+
+        Parameters
+        ----------
+        code : str
+            The competition code.
+
+        Returns
+        -------
+        footy.domain.Competition.Competition
+            The competition.
+
+        Raises
+        ------
+        requests.RequestException
+            When the page cannot be fetched, after any retries.
+        """
+        url = self._source.url(code)
+
+        with self._semaphore(urlsplit(url).netloc):
+            response = self._session.get(url, timeout=self._timeout)
+
+        response.raise_for_status()
+        return self._source.parse(code, response.text)
+
+    def fetch_all(self, codes=None):
+        """
+        Fetch competitions concurrently.
+
+        Parameters
+        ----------
+        codes : list of str, optional
+            The competition codes.  Defaults to every competition of the source.
+
+        Returns
+        -------
+        dict
+            The competitions keyed by their code.
+
+        Raises
+        ------
+        requests.RequestException
+            When a page cannot be fetched, after any retries.
+        """
+        codes = list(self._source.codes() if codes is None else codes)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return dict(zip(codes, executor.map(self.fetch, codes)))
+
+    def _semaphore(self, host):
+        """
+        Get the semaphore limiting the requests made to a host at once.
+
+        Parameters
+        ----------
+        host : str
+            The host (and port) of a URL.
+
+        Returns
+        -------
+        threading.BoundedSemaphore
+            The semaphore of the host.
+        """
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self._max_per_host)
+
+            return self._semaphores[host]
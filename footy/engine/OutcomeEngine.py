@@ -0,0 +1,308 @@
+"""Outcome Engine - Vectorised calculation of the probabilities of fixture outcomes."""
+import numpy as np
+
+from scipy.stats import skellam
+
+from footy.engine.PoissonCache import DEFAULT_CACHE
+
+MINIMUM_EXPECTED_GOALS = 1e-12
+"""float : The smallest expected goals passed to the Skellam distribution (which is undefined for zero)."""
+
+
+class OutcomeEngine:
+    """
+    Outcome Engine - Vectorised calculation of the probabilities of fixture outcomes.
+
+    All methods accept arrays of expected goals so that any number of fixtures (even from different competitions) can
+    be calculated with a single call.
+
+    The default settings reproduce the original calculation of `footy.Footy.fixture`: goals are cut off at six,
+    probabilities are rounded to four decimal places and the outcome probabilities are summed from the final score
+    probabilities (so any probability of more than six goals is lost).  For probabilities that sum to one, set
+    `closed_form` to calculate the outcomes from the Skellam distribution, set `tail_mass` to hold the probability of
+    more than `max_goals` goals in a final bucket and set `decimals` to None to skip the intermediate rounding.
+
+    Examples
+    --------
+    >>> engine = OutcomeEngine()
+    >>> prediction = engine.predict([2.1, 0.6], [0.56, 2.12])
+    >>> prediction['outcome_probabilities']
+    array([[0.728 , 0.1799, 0.0862],
+           [0.0921, 0.1804, 0.7212]])
+    >>> engine = OutcomeEngine(closed_form=True, tail_mass=True, decimals=None)
+    >>> engine.predict([2.1], [0.56])['outcome_probabilities'].round(4)
+    array([[0.7339, 0.1798, 0.0863]])
+    """
+
+    def __init__(self, max_goals=6, tail_mass=False, decimals=4, closed_form=False, cache=None):
+        """
+        Construct an OutcomeEngine object.
+
+        Parameters
+        ----------
+        max_goals : int, optional
+            The largest number of goals that a probability is calculated for.  Defaults to 6.
+        tail_mass : bool, optional
+            If True, the goal probabilities and final score probabilities have an extra final bucket holding the
+            probability of more than `max_goals` goals being scored.  Defaults to False.  The final score where both
+            teams score more than `max_goals` goals is split between the three outcomes by the probability of each
+            when both teams do (see `tail_outcome_probabilities`).
+        decimals : int or None, optional
+            The number of decimal places that probabilities are rounded to.  If None, probabilities are not
+            rounded.  Defaults to 4.
+        closed_form : bool, optional
+            If True, the outcome probabilities are calculated exactly from the Skellam distribution of the goal
+            difference instead of being summed from the (truncated) final score probabilities.  Defaults to False.
+        cache : footy.engine.PoissonCache.PoissonCache, optional
+            The cache that the probability mass of goals is read from.  Defaults to the cache shared by every
+            engine, `footy.engine.PoissonCache.DEFAULT_CACHE`.
+        """
+        self._max_goals = max_goals
+        self._tail_mass = tail_mass
+        self._decimals = decimals
+        self._closed_form = closed_form
+        self._cache = cache or DEFAULT_CACHE
+
+    def cache(self):
+        """
+        Get the cache that the probability mass of goals is read from.
+
+        Returns
+        -------
+        footy.engine.PoissonCache.PoissonCache
+            The cache used by the engine.
+        """
+        return self._cache
+
+    def tail_mass(self):
+        """
+        Check if the goal probabilities and final score probabilities have a final bucket for more goals.
+
+        Returns
+        -------
+        bool
+            True if the probability of more than `max_goals` goals is held in a final bucket.
+        """
+        return self._tail_mass
+
+    def settings(self):
+        """
+        Get the settings of the engine.
+
+        Returns
+        -------
+        dict
+            The values of max_goals, tail_mass, decimals and closed_form.
+        """
+        return {
+            'max_goals': self._max_goals,
+            'tail_mass': self._tail_mass,
+            'decimals': self._decimals,
+            'closed_form': self._closed_form
+        }
+
+    def goals_probability(self, expected_goals):
+        """
+        Calculate the probability of each number of goals being scored.
+
+        Parameters
+        ----------
+        expected_goals : array_like
+            The expected goals of each team, shape (n,).
+
+        Returns
+        -------
+        numpy.ndarray
+            The probability of zero to `max_goals` goals being scored by each team, shape (n, max_goals + 1).  If
+            `tail_mass` is set, a final column holds the probability of more than `max_goals` goals, shape
+            (n, max_goals + 2).
+        """
+        probability_mass = self._cache.probability_mass(expected_goals, self._max_goals)
+
+        if not self._tail_mass:
+            probability_mass = probability_mass[:, :-1]
+
+        return self._round(probability_mass)
+
+    def outcome_probabilities(self, home_expected_goals, away_expected_goals):
+        """
+        Calculate the exact probabilities of a home win, a score draw and an away win.
+
+        The probabilities are calculated from the Skellam distribution of the difference between two Poisson
+        distributed numbers of goals, so no probability is lost to a maximum number of goals.
+
+        Parameters
+        ----------
+        home_expected_goals : array_like
+            The expected goals of the home team in each fixture, shape (n,).
+        away_expected_goals : array_like
+            The expected goals of the away team in each fixture, shape (n,).
+
+        Returns
+        -------
+        numpy.ndarray
+            The probability of a home win, a score draw and an away win, shape (n, 3).
+        """
+        return self._round(_skellam_outcomes(home_expected_goals, away_expected_goals))
+
+    def predict(self, home_expected_goals, away_expected_goals):
+        """
+        Calculate the probabilities of a number of fixtures.
+
+        Parameters
+        ----------
+        home_expected_goals : array_like
+            The expected goals of the home team in each fixture, shape (n,).
+        away_expected_goals : array_like
+            The expected goals of the away team in each fixture, shape (n,).
+
+        Returns
+        -------
+        dict
+            A dictionary of numpy arrays with the following keys (where k is `max_goals` + 1, or `max_goals` + 2 if
+            `tail_mass` is set):
+
+            home_expected_goals
+                The expected goals of the home teams, shape (n,).
+            away_expected_goals
+                The expected goals of the away teams, shape (n,).
+            home_team_goals_probability
+                The probability of each number of goals being scored by the home teams, shape (n, k).
+            away_team_goals_probability
+                The probability of each number of goals being scored by the away teams, shape (n, k).
+            home_tail_mass
+                The probability of more than `max_goals` goals being scored by the home teams, shape (n,).
+            away_tail_mass
+                The probability of more than `max_goals` goals being scored by the away teams, shape (n,).
+            final_score_probabilities
+                The probability of each final score indexed by [fixture, home goals, away goals], shape (n, k, k).
+            outcome_probabilities
+                The probability of a home win, a score draw and an away win, shape (n, 3).
+        """
+        home_expected_goals = np.asarray(home_expected_goals, dtype=float).reshape(-1)
+        away_expected_goals = np.asarray(away_expected_goals, dtype=float).reshape(-1)
+        home_probability_mass = self._cache.probability_mass(home_expected_goals, self._max_goals)
+        away_probability_mass = self._cache.probability_mass(away_expected_goals, self._max_goals)
+        home_tail_mass = home_probability_mass[:, -1]
+        away_tail_mass = away_probability_mass[:, -1]
+
+        if not self._tail_mass:
+            home_probability_mass = home_probability_mass[:, :-1]
+            away_probability_mass = away_probability_mass[:, :-1]
+
+        home_probability_mass = self._round(home_probability_mass)
+        away_probability_mass = self._round(away_probability_mass)
+        score_probabilities = home_probability_mass[:, :, np.newaxis] * away_probability_mass[:, np.newaxis, :]
+        score_probabilities = self._round(score_probabilities)
+
+        if self._closed_form:
+            outcome_probabilities = self.outcome_probabilities(home_expected_goals, away_expected_goals)
+        else:
+            home_win_probability = np.tril(score_probabilities, -1).sum(axis=(1, 2))
+            draw_probability = np.trace(score_probabilities, axis1=1, axis2=2)
+            away_win_probability = np.triu(score_probabilities, 1).sum(axis=(1, 2))
+            outcome_probabilities = np.stack([home_win_probability, draw_probability, away_win_probability], axis=1)
+
+            if self._tail_mass:
+                # Both teams scoring more than max_goals goals is not always a draw, so the final cell is split.
+                both_tails = score_probabilities[:, -1, -1]
+                outcome_probabilities[:, 1] -= both_tails
+                outcome_probabilities += both_tails[:, np.newaxis] * self.tail_outcome_probabilities(
+                    home_expected_goals, away_expected_goals
+                )
+
+            outcome_probabilities = self._round(outcome_probabilities)
+
+        return {
+            'home_expected_goals': home_expected_goals,
+            'away_expected_goals': away_expected_goals,
+            'home_team_goals_probability': home_probability_mass,
+            'away_team_goals_probability': away_probability_mass,
+            'home_tail_mass': home_tail_mass,
+            'away_tail_mass': away_tail_mass,
+            'final_score_probabilities': score_probabilities,
+            'outcome_probabilities': outcome_probabilities
+        }
+
+    def tail_outcome_probabilities(self, home_expected_goals, away_expected_goals):
+        """
+        Calculate the probabilities of each outcome when both teams score more than `max_goals` goals.
+
+        The probability of each outcome with both teams scoring more than `max_goals` goals is the exact probability
+        of the outcome (from the Skellam distribution) less the probability of the final scores where at least one
+        team scores no more than `max_goals` goals.  Dividing by their total gives the probability of each outcome
+        given that both teams score more than `max_goals` goals.
+
+        Parameters
+        ----------
+        home_expected_goals : array_like
+            The expected goals of the home team in each fixture, shape (n,).
+        away_expected_goals : array_like
+            The expected goals of the away team in each fixture, shape (n,).
+
+        Returns
+        -------
+        numpy.ndarray
+            The probability of a home win, a score draw and an away win given that both teams score more than
+            `max_goals` goals, shape (n, 3).  Where that is too unlikely to be calculated, it is counted as a draw.
+        """
+        home_probability_mass = self._cache.probability_mass(home_expected_goals, self._max_goals)
+        away_probability_mass = self._cache.probability_mass(away_expected_goals, self._max_goals)
+        home_tail_mass = home_probability_mass[:, -1]
+        away_tail_mass = away_probability_mass[:, -1]
+        home_probability_mass = home_probability_mass[:, :-1]
+        away_probability_mass = away_probability_mass[:, :-1]
+        score_probabilities = home_probability_mass[:, :, np.newaxis] * away_probability_mass[:, np.newaxis, :]
+        outcome_probabilities = _skellam_outcomes(home_expected_goals, away_expected_goals) - np.stack([
+            np.tril(score_probabilities, -1).sum(axis=(1, 2)) + home_tail_mass * away_probability_mass.sum(axis=1),
+            np.trace(score_probabilities, axis1=1, axis2=2),
+            np.triu(score_probabilities, 1).sum(axis=(1, 2)) + away_tail_mass * home_probability_mass.sum(axis=1)
+        ], axis=1)
+        outcome_probabilities = np.maximum(outcome_probabilities, 0.0)
+        total = outcome_probabilities.sum(axis=1, keepdims=True)
+        return np.where(total > 0, outcome_probabilities / np.where(total > 0, total, 1.0), [0.0, 1.0, 0.0])
+
+    def _round(self, probabilities):
+        """
+        Round probabilities to the configured number of decimal places.
+
+        Parameters
+        ----------
+        probabilities : numpy.ndarray
+            The probabilities to round.
+
+        Returns
+        -------
+        numpy.ndarray
+            The rounded probabilities (or the probabilities unchanged if `decimals` is None).
+        """
+        if self._decimals is None:
+            return probabilities
+
+        return np.round(probabilities, self._decimals)
+
+
+def _skellam_outcomes(home_expected_goals, away_expected_goals):
+    """
+    Calculate the exact probabilities of a home win, a score draw and an away win without rounding them.
+
+    Parameters
+    ----------
+    home_expected_goals : array_like
+        The expected goals of the home team in each fixture, shape (n,).
+    away_expected_goals : array_like
+        The expected goals of the away team in each fixture, shape (n,).
+
+    Returns
+    -------
+    numpy.ndarray
+        The probability of a home win, a score draw and an away win, shape (n, 3).
+    """
+    home_expected_goals = np.maximum(np.asarray(home_expected_goals, dtype=float), MINIMUM_EXPECTED_GOALS)
+    away_expected_goals = np.maximum(np.asarray(away_expected_goals, dtype=float), MINIMUM_EXPECTED_GOALS)
+    outcome_probabilities = np.stack([
+        skellam.sf(0, home_expected_goals, away_expected_goals),
+        skellam.pmf(0, home_expected_goals, away_expected_goals),
+        skellam.cdf(-1, home_expected_goals, away_expected_goals)
+    ], axis=-1)
+    return outcome_probabilities.reshape(-1, 3)
@@ -0,0 +1,118 @@
+"""Poisson Cache - Bounded cache of the Poisson probability mass of goals for expected goals."""
+import threading
+
+from collections import OrderedDict
+
+import numpy as np
+
+from scipy.stats import poisson
+
+
+class PoissonCache:
+    """
+    Poisson Cache - Bounded cache of the Poisson probability mass of goals for expected goals.
+
+    Footy rounds expected goals to two decimal places, so a season of fixtures only has a few hundred distinct
+    expected goals.  The cache holds the probability mass of each distinct value (keyed by the exact value and the
+    maximum number of goals) and discards the least recently used values when it is full.
+
+    Examples
+    --------
+    >>> cache = PoissonCache(max_size=1024)
+    >>> cache.probability_mass([2.1, 0.56, 2.1], max_goals=6).shape
+    (3, 8)
+    >>> cache.stats()
+    {'hits': 1, 'misses': 2, 'size': 2, 'max_size': 1024}
+    """
+
+    def __init__(self, max_size=4096):
+        """
+        Construct a PoissonCache object.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            The largest number of distinct expected goals held in the cache.  Defaults to 4096.
+        """
+        self._max_size = max_size
+        self._rows = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Remove every value from the cache and reset the counters."""
+        with self._lock:
+            self._rows.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def probability_mass(self, expected_goals, max_goals):
+        """
+        Get the probability of each number of goals being scored for an array of expected goals.
+
+        Parameters
+        ----------
+        expected_goals : array_like
+            The expected goals of each team, shape (n,).
+        max_goals : int
+            The largest number of goals that a probability is returned for.
+
+        Returns
+        -------
+        numpy.ndarray
+            The probability of zero to `max_goals` goals being scored by each team, followed by a final column with
+            the probability of more than `max_goals` goals being scored, shape (n, max_goals + 2).
+        """
+        expected_goals = np.asarray(expected_goals, dtype=float).reshape(-1)
+        values, inverse, counts = np.unique(expected_goals, return_inverse=True, return_counts=True)
+        table = np.empty((len(values), max_goals + 2))
+        missing = []
+
+        with self._lock:
+            for index, value in enumerate(values.tolist()):
+                row = self._rows.get((max_goals, value))
+
+                if row is None:
+                    missing.append(index)
+                    self._misses += 1
+                    self._hits += int(counts[index]) - 1
+                else:
+                    self._rows.move_to_end((max_goals, value))
+                    table[index] = row
+                    self._hits += int(counts[index])
+
+            if missing:
+                missing_values = values[missing].reshape(-1, 1)
+                table[missing, :-1] = poisson.pmf(np.arange(max_goals + 1), missing_values)
+                table[missing, -1] = poisson.sf(max_goals, missing_values[:, 0])
+
+                for index in missing:
+                    self._rows[(max_goals, float(values[index]))] = table[index].copy()
+
+                while len(self._rows) > self._max_size:
+                    self._rows.popitem(last=False)
+
+        return table[inverse.reshape(-1)]
+
+    def stats(self):
+        """
+        Get the counters of the cache.
+
+        Returns
+        -------
+        dict
+            The number of hits, the number of misses, the number of values held and the maximum number of values
+            held.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'size': len(self._rows),
+                'max_size': self._max_size
+            }
+
+
+DEFAULT_CACHE = PoissonCache()
+"""PoissonCache : The cache shared by every OutcomeEngine that is not given its own cache."""
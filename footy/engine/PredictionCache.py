@@ -0,0 +1,353 @@
+"""Prediction Cache - Persistent cache of fixture predictions keyed by the inputs of the model."""
+import hashlib
+import json
+import sqlite3
+import threading
+
+import numpy as np
+
+
+class PredictionCache:
+    """
+    Prediction Cache - Persistent cache of fixture predictions keyed by the inputs of the model.
+
+    Predictions are held in an SQLite database, keyed by a SHA-256 hash of the inputs of the prediction (the goals of
+    the two teams and the league averages) and the settings of the outcome engine, so a restarted process can reuse
+    the predictions of an earlier one.  Each row stores the expected goals, the outcome probabilities, the goal
+    probabilities of both teams and the final score matrix, along with a checksum of those values.  When the cache
+    holds more than `max_entries` predictions the least recently used are evicted.  The number of predictions held is
+    counted once when the database is opened and then kept up to date as predictions are added and removed.
+
+    Examples
+    --------
+    >>> cache = PredictionCache('predictions.sqlite', max_entries=50000)
+    >>> engine = PredictionEngine(cache=cache)
+    >>> engine.predict_results(competition)
+    >>> cache.stats()
+    {'hits': 0, 'misses': 380, 'size': 380, 'max_entries': 50000}
+    """
+
+    def __init__(self, path=':memory:', max_entries=100000):
+        """
+        Construct a PredictionCache object.
+
+        Parameters
+        ----------
+        path : str, optional
+            The path of the SQLite database, which is created if it does not exist.  Defaults to an in-memory
+            database (which is not persistent).
+        max_entries : int, optional
+            The largest number of predictions held.  Defaults to 100000.
+        """
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS predictions ('
+            'key TEXT PRIMARY KEY, home_expected_goals REAL, away_expected_goals REAL, goals INTEGER, '
+            'outcome_probabilities BLOB, home_team_goals_probability BLOB, away_team_goals_probability BLOB, '
+            'final_score_matrix BLOB, checksum TEXT, last_used INTEGER)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS predictions_last_used ON predictions (last_used)')
+        self._connection.commit()
+        self._clock = self._connection.execute('SELECT COALESCE(MAX(last_used), 0) FROM predictions').fetchone()[0]
+        self._size = self._connection.execute('SELECT COUNT(*) FROM predictions').fetchone()[0]
+
+    def __enter__(self):
+        """
+        Enter a with block.
+
+        Returns
+        -------
+        footy.engine.PredictionCache.PredictionCache
+            The cache.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the database at the end of a with block.
+
+        Parameters
+        ----------
+        exc_type : type
+            The type of the exception raised in the block, if any.
+        exc_value : Exception
+            The exception raised in the block, if any.
+        traceback : traceback
+            The traceback of the exception raised in the block, if any.
+        """
+        self.close()
+
+    @staticmethod
+    def key(inputs, settings):
+        """
+        Get the key of a prediction.
+
+        Parameters
+        ----------
+        inputs : iterable of float
+            The inputs of the prediction (e.g. the goals for and against of both teams and the league averages).
+        settings : dict
+            The settings of the outcome engine.
+
+        Returns
+        -------
+        str
+            The SHA-256 hash of the inputs and settings.
+        """
+        document = json.dumps({'inputs': [float(value) for value in inputs], 'settings': settings}, sort_keys=True)
+        return hashlib.sha256(document.encode()).hexdigest()
+
+    def check(self, remove=True):
+        """
+        Check the integrity of the cache.
+
+        Parameters
+        ----------
+        remove : bool, optional
+            If True, remove the predictions that do not match their checksum.  Defaults to True.
+
+        Returns
+        -------
+        list of str
+            The keys of the predictions that do not match their checksum.
+
+        Raises
+        ------
+        sqlite3.DatabaseError
+            When the database itself is corrupt.
+        """
+        with self._lock:
+            result = self._connection.execute('PRAGMA integrity_check').fetchone()[0]
+
+            if result != 'ok':
+                raise sqlite3.DatabaseError(f'The prediction cache is corrupt: {result}')
+
+            corrupt = [row[0] for row in self._connection.execute('SELECT * FROM predictions') if not _valid(row)]
+
+            if remove and corrupt:
+                self._connection.executemany('DELETE FROM predictions WHERE key = ?', [(key,) for key in corrupt])
+                self._connection.commit()
+                self._size -= len(corrupt)
+
+            return corrupt
+
+    def clear(self):
+        """Remove every prediction from the cache and reset the counters."""
+        with self._lock:
+            self._connection.execute('DELETE FROM predictions')
+            self._connection.commit()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+
+    def close(self):
+        """Close the database."""
+        self._connection.close()
+
+    def get_many(self, keys):
+        """
+        Get the predictions held for a number of keys.
+
+        Predictions that do not match their checksum are removed and treated as missing.
+
+        Parameters
+        ----------
+        keys : list of str
+            The keys of the predictions.
+
+        Returns
+        -------
+        dict
+            For each key found, the expected goals of the home and away teams, the outcome probabilities, the goal
+            probabilities of the home and away teams and the final score matrix.
+        """
+        found = {}
+        corrupt = []
+
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                rows = self._connection.execute(
+                    f'SELECT * FROM predictions WHERE key IN ({", ".join("?" * len(batch))})', batch
+                )
+
+                for row in rows:
+                    if _valid(row):
+                        found[row[0]] = _unpack(row)
+                    else:
+                        corrupt.append((row[0],))
+
+            # A lookup that finds nothing leaves the database as it is, so it does not need to write or commit.
+            if found or corrupt:
+                self._connection.executemany('DELETE FROM predictions WHERE key = ?', corrupt)
+                self._connection.executemany('UPDATE predictions SET last_used = ? WHERE key = ?',
+                                             [(self._tick(), key) for key in found])
+                self._connection.commit()
+                self._size -= len(corrupt)
+
+            self._hits += len(found)
+            self._misses += len(keys) - len(found)
+
+        return found
+
+    def put_many(self, predictions):
+        """
+        Add a number of predictions, evicting the least recently used predictions if the cache is full.
+
+        Parameters
+        ----------
+        predictions : dict
+            For each key, the expected goals of the home and away teams, the outcome probabilities, the goal
+            probabilities of the home and away teams and the final score matrix.
+        """
+        keys = list(predictions)
+
+        with self._lock:
+            # Replacing a prediction that is already held does not change the number held, so only new keys count.
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                self._size += len(batch) - self._connection.execute(
+                    f'SELECT COUNT(*) FROM predictions WHERE key IN ({", ".join("?" * len(batch))})', batch
+                ).fetchone()[0]
+
+            rows = [_pack(key, *prediction) + (self._tick(),) for key, prediction in predictions.items()]
+            self._connection.executemany('INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                         rows)
+
+            if self._size > self._max_entries:
+                self._size -= self._connection.execute(
+                    'DELETE FROM predictions WHERE key IN (SELECT key FROM predictions ORDER BY last_used LIMIT ?)',
+                    (self._size - self._max_entries,)
+                ).rowcount
+
+            self._connection.commit()
+
+    def stats(self):
+        """
+        Get the counters of the cache.
+
+        Returns
+        -------
+        dict
+            The number of hits, the number of misses, the number of predictions held and the maximum number of
+            predictions held.
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'size': self._size,
+                'max_entries': self._max_entries
+            }
+
+    def _tick(self):
+        """
+        Advance the clock used to find the least recently used predictions.
+
+        Returns
+        -------
+        int
+            The new time.
+        """
+        self._clock += 1
+        return self._clock
+
+
+def _checksum(row):
+    """
+    Calculate the checksum of the values of a row.
+
+    Parameters
+    ----------
+    row : tuple
+        The key, expected goals, number of goals and blobs of a row.
+
+    Returns
+    -------
+    str
+        The SHA-256 hash of the values.
+    """
+    digest = hashlib.sha256(repr(row[:4]).encode())
+
+    for blob in row[4:8]:
+        digest.update(bytes(blob))
+
+    return digest.hexdigest()
+
+
+def _pack(key, home_expected_goals, away_expected_goals, outcome_probabilities, home_team_goals_probability,
+          away_team_goals_probability, final_score_matrix):
+    """
+    Convert a prediction to a row of the database.
+
+    Parameters
+    ----------
+    key : str
+        The key of the prediction.
+    home_expected_goals : float
+        The expected goals of the home team.
+    away_expected_goals : float
+        The expected goals of the away team.
+    outcome_probabilities : array_like
+        The probabilities of a home win, a draw and an away win.
+    home_team_goals_probability : array_like
+        The probability of each number of goals being scored by the home team.
+    away_team_goals_probability : array_like
+        The probability of each number of goals being scored by the away team.
+    final_score_matrix : array_like
+        The probability of each final score.
+
+    Returns
+    -------
+    tuple
+        The values of the row, apart from when it was last used.
+    """
+    final_score_matrix = np.asarray(final_score_matrix, dtype=float)
+    row = (key, float(home_expected_goals), float(away_expected_goals), final_score_matrix.shape[0],
+           np.asarray(outcome_probabilities, dtype=float).tobytes(),
+           np.asarray(home_team_goals_probability, dtype=float).tobytes(),
+           np.asarray(away_team_goals_probability, dtype=float).tobytes(), final_score_matrix.tobytes())
+    return row + (_checksum(row),)
+
+
+def _unpack(row):
+    """
+    Convert a row of the database to a prediction.
+
+    Parameters
+    ----------
+    row : tuple
+        The row.
+
+    Returns
+    -------
+    tuple
+        The expected goals of the home and away teams, the outcome probabilities, the goal probabilities of the home
+        and away teams and the final score matrix.
+    """
+    goals = row[3]
+    return (row[1], row[2], np.frombuffer(row[4]), np.frombuffer(row[5]), np.frombuffer(row[6]),
+            np.frombuffer(row[7]).reshape(goals, goals))
+
+
+def _valid(row):
+    """
+    Check if a row of the database matches its checksum.
+
+    Parameters
+    ----------
+    row : tuple
+        The row.
+
+    Returns
+    -------
+    bool
+        True if the row matches its checksum.
+    """
+    return isinstance(row[8], str) and _checksum(row) == row[8]
@@ -1,23 +1,377 @@
 """Prediction Engine - Engine to predict the result of future fixtures."""
-# calculate the results for fixtures
-from footy.domain import Competition
+from concurrent.futures import ProcessPoolExecutor
+
+from footy import Footy
+from footy.domain.Competition import Competition
+from footy.domain.Team import Team
+from footy.engine.OutcomeEngine import OutcomeEngine
+from footy.engine.PredictionCache import PredictionCache
+from footy.instrumentation import register
 
 
 class PredictionEngine:
-    """Prediction Engine - Engine to predict the result of future fixtures."""
+    """
+    Prediction Engine - Engine to predict the result of future fixtures.
+
+    The SCHEDULED fixtures of each competition are predicted by `footy.Footy` (set up with
+    `footy.Footy.from_competition`) and the probabilities are written back onto the fixtures.  Several competitions
+    can be predicted in a pool of processes: each process is sent the teams, league averages and scheduled pairs of
+    a competition and returns the prediction, which is written back onto the fixtures in this process, so the results
+    are the same however many processes are used.
+
+    The engine remembers the inputs of each prediction: the goals for and against of the two teams and the league
+    averages.  A fixture whose inputs have not changed keeps its prediction.  When the inputs have changed, the
+    expected goals are recalculated (which is cheap) and the probabilities are only recalculated if the expected
+    goals have moved by more than the tolerance, so a new result does not re-predict every fixture.  If the engine is
+    given a `footy.engine.PredictionCache.PredictionCache`, fixtures that need to be predicted are looked up in the
+    cache first, so a restarted engine can reuse the predictions of an earlier one.
+
+    The predictions are remembered by the code and name of their competition, so a competition that is fetched again
+    (as a new object) keeps the predictions of the fixtures that have not changed.  Competitions that are predicted
+    by the same engine must therefore not share both a code and a name.
+
+    The league averages are calculated from the finished fixtures of a competition, so a competition needs its
+    finished and scheduled fixtures to be predicted.  The competitions read from table pages (see
+    `footy.engine.TableSource.TableSource`) only have teams, so they are left as they are.
+
+    Examples
+    --------
+    >>> engine = PredictionEngine(workers=4)
+    >>> competitions = UpdateEngine().load_results(['E0-2021.csv', 'D1-2021.csv'])
+    >>> competitions = engine.predict_results(list(competitions.values()))
+    """
 
-    def __init__(self, competition):
-        """Construct a competition object."""
+    def __init__(self, competition=None, workers=1, outcome_engine=None, tolerance=0.0, cache=None):
+        """
+        Construct a PredictionEngine object.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition or list, optional
+            The competition (or competitions) predicted by default.
+        workers : int, optional
+            The number of processes that competitions are predicted in.  Defaults to 1 (no process pool).
+        outcome_engine : footy.engine.OutcomeEngine.OutcomeEngine, optional
+            The engine that calculates the probabilities.  Defaults to an OutcomeEngine with the default settings.
+        tolerance : float, optional
+            The largest change in the expected goals of either team for which a prediction is kept.  Defaults to 0.0
+            (a prediction is kept only while the expected goals are unchanged).
+        cache : footy.engine.PredictionCache.PredictionCache, optional
+            The persistent cache of predictions.  Defaults to no cache.
+        """
         self._competition = competition
+        self._workers = workers
+        self._outcome_engine = outcome_engine or OutcomeEngine()
+        self._tolerance = tolerance
+        self._cache = cache
+        self._results = {}
+        self._predicted = 0
+        self._reused = 0
+        self._cached = 0
+
+    def clear(self):
+        """Forget the predictions made so far, so every fixture is predicted again."""
         self._results = {}
 
-    def predict_results(self, competition):
+    def predict_results(self, competition=None, workers=None):
         """
         Generate the predictions for fixtures within a competition.
 
+        Fixtures of a competition without enough data to be predicted (e.g. with no finished fixtures) are left as
+        they are.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition or list, optional
+            The competition (or competitions) to predict.  Defaults to the competition the engine was constructed
+            with.
+        workers : int, optional
+            The number of processes that competitions are predicted in.  Defaults to the number the engine was
+            constructed with.
+
         Return
         -------
         Competition
-            Enriched competition with most recent predictions.
+            Enriched competition with most recent predictions (or a list of competitions if a list was given).
+
+        Raises
+        ------
+        KeyError
+            When a fixture refers to a team that is not in its competition.
+        ValueError
+            When two of the competitions have the same code and name.
+        """
+        competitions = self._competition if competition is None else competition
+        single = isinstance(competitions, Competition)
+
+        if single:
+            competitions = [competitions]
+
+        keys = [_competition_key(item) for item in competitions]
+
+        if len(set(keys)) != len(keys):
+            raise ValueError('Competitions that are predicted together must not share both a code and a name.')
+
+        workers = self._workers if workers is None else workers
+        settings = self._outcome_engine.settings()
+        jobs = []
+
+        for item in competitions:
+            footy = Footy.from_competition(item, outcome_engine=self._outcome_engine)
+
+            # The league averages are only set when the competition has finished fixtures.
+            if footy.average_goals_scored_by_a_home_team() < 0:
+                continue
+
+            fixtures = self._stale_fixtures(item, footy)
+
+            if self._cache is not None:
+                fixtures = self._cached_fixtures(item, fixtures, settings)
+
+            if not fixtures:
+                continue
+
+            teams = [(team.team_name(), team.goals_for(), team.goals_against(), team.home_games(),
+                      team.away_games(), team.points()) for team in item.teams]
+            pairs = [(fixture.home_team.team_name(), fixture.away_team.team_name()) for fixture, _ in fixtures]
+            jobs.append((item, footy, fixtures, (teams, footy.average_goals_scored_by_a_home_team(),
+                                                 footy.average_goals_scored_by_an_away_team(), pairs, settings)))
+
+        arguments = [job[3] for job in jobs]
+
+        if workers > 1 and len(arguments) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(arguments))) as executor:
+                predictions = list(executor.map(_predict_fixtures, arguments))
+        else:
+            predictions = list(map(_predict_fixtures, arguments))
+
+        for (item, footy, fixtures, _), prediction in zip(jobs, predictions):
+            if prediction is None:
+                continue
+
+            footy.populate_fixtures([fixture for fixture, _ in fixtures], prediction)
+            results = self._results.setdefault(_competition_key(item), {})
+            self._predicted += len(fixtures)
+
+            for index, (fixture, signature) in enumerate(fixtures):
+                results[fixture.key()] = (fixture, signature, prediction['home_expected_goals'][index],
+                                          prediction['away_expected_goals'][index])
+
+            if self._cache is not None:
+                self._cache.put_many({
+                    PredictionCache.key(_inputs(signature), settings): (
+                        prediction['home_expected_goals'][index], prediction['away_expected_goals'][index],
+                        prediction['outcome_probabilities'][index], prediction['home_team_goals_probability'][index],
+                        prediction['away_team_goals_probability'][index],
+                        prediction['final_score_probabilities'][index]
+                    )
+                    for index, (_, signature) in enumerate(fixtures)
+                })
+
+        return competitions[0] if single else competitions
+
+    def stats(self):
+        """
+        Get the number of fixtures predicted, kept and read from the cache since the engine was constructed.
+
+        Returns
+        -------
+        dict
+            The number of fixtures whose probabilities were calculated, the number whose previous probabilities were
+            kept and the number whose probabilities were read from the cache.
+        """
+        return {'predicted': self._predicted, 'reused': self._reused, 'cached': self._cached}
+
+    def _stale_fixtures(self, competition, footy):
         """
-        return Competition
+        Find the scheduled fixtures of a competition that need to be predicted.
+
+        The previous predictions of the other scheduled fixtures are kept (and copied onto the fixture if the
+        competition now holds a different fixture object with the same key).  The predictions of fixtures that are
+        no longer scheduled are forgotten.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition.
+        footy : footy.Footy
+            The model set up with the teams and league averages of the competition.
+
+        Returns
+        -------
+        list of tuple
+            Each fixture to predict with the signature of its inputs.
+        """
+        previous = self._results.get(_competition_key(competition), {})
+        results = {}
+        changed = []
+        league = (footy.goals_scored(), footy.goals_conceded(), footy.average_goals_scored_by_a_home_team(),
+                  footy.average_goals_scored_by_an_away_team())
+
+        for fixture in competition.fixtures:
+            if fixture.status != 'SCHEDULED':
+                continue
+
+            home_team = fixture.home_team
+            away_team = fixture.away_team
+            signature = (home_team.goals_for(), home_team.goals_against(), away_team.goals_for(),
+                         away_team.goals_against(), league)
+            entry = previous.get(fixture.key())
+
+            if entry is not None and entry[1] == signature:
+                results[fixture.key()] = self._reuse(fixture, entry)
+            else:
+                changed.append((fixture, signature, entry))
+
+        self._results[_competition_key(competition)] = results
+        stale = []
+
+        if changed:
+            home_expected_goals, away_expected_goals = footy.expected_goals(
+                [(fixture.home_team, fixture.away_team) for fixture, _, _ in changed]
+            )
+
+            for (fixture, signature, entry), home, away in zip(changed, home_expected_goals, away_expected_goals):
+                if (entry is not None and abs(home - entry[2]) <= self._tolerance and
+                        abs(away - entry[3]) <= self._tolerance):
+                    # The expected goals of the stored prediction are kept, so small changes cannot add up.
+                    self._reuse(fixture, entry)
+                    results[fixture.key()] = (fixture, signature, entry[2], entry[3])
+                else:
+                    stale.append((fixture, signature))
+
+        return stale
+
+    def _cached_fixtures(self, competition, fixtures, settings):
+        """
+        Populate the fixtures that need to be predicted from the cache, where it holds their predictions.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition of the fixtures.
+        fixtures : list of tuple
+            Each fixture to predict with the signature of its inputs.
+        settings : dict
+            The settings of the outcome engine.
+
+        Returns
+        -------
+        list of tuple
+            Each fixture that is not in the cache with the signature of its inputs.
+        """
+        keys = [PredictionCache.key(_inputs(signature), settings) for _, signature in fixtures]
+        found = self._cache.get_many(keys)
+        results = self._results.setdefault(_competition_key(competition), {})
+        missing = []
+
+        for (fixture, signature), key in zip(fixtures, keys):
+            if key not in found:
+                missing.append((fixture, signature))
+                continue
+
+            (home_expected_goals, away_expected_goals, outcome_probabilities, home_team_goals_probability,
+             away_team_goals_probability, final_score_matrix) = found[key]
+            fixture.final_score_matrix(final_score_matrix, settings['tail_mass'])
+            fixture.outcome_probabilities(list(outcome_probabilities))
+            fixture.home_team_goals_probability(list(home_team_goals_probability))
+            fixture.away_team_goals_probability(list(away_team_goals_probability))
+            results[fixture.key()] = (fixture, signature, home_expected_goals, away_expected_goals)
+            self._cached += 1
+
+        return missing
+
+    def _reuse(self, fixture, entry):
+        """
+        Keep the previous prediction of a fixture.
+
+        Parameters
+        ----------
+        fixture : footy.domain.Fixture.Fixture
+            The fixture.
+        entry : tuple
+            The fixture that was predicted, the signature of its inputs and the expected goals of the home and away
+            teams.
+
+        Returns
+        -------
+        tuple
+            The entry for the fixture.
+        """
+        predicted = entry[0]
+        self._reused += 1
+
+        if predicted is fixture:
+            return entry
+
+        fixture.final_score_matrix(predicted.final_score_matrix(), predicted.final_score_tail_mass())
+        fixture.outcome_probabilities(predicted.outcome_probabilities())
+        fixture.home_team_goals_probability(predicted.home_team_goals_probability())
+        fixture.away_team_goals_probability(predicted.away_team_goals_probability())
+        return (fixture,) + entry[1:]
+
+
+def _competition_key(competition):
+    """
+    Get the key that the predictions of a competition are remembered by.
+
+    Parameters
+    ----------
+    competition : footy.domain.Competition.Competition
+        The competition.
+
+    Returns
+    -------
+    tuple
+        The code and name of the competition.
+    """
+    return competition.code(), competition.name
+
+
+def _inputs(signature):
+    """
+    Flatten the signature of the inputs of a prediction.
+
+    Parameters
+    ----------
+    signature : tuple
+        The goals for and against of the home and away teams and the league averages.
+
+    Returns
+    -------
+    list of float
+        The inputs.
+    """
+    *goals, league = signature
+    return [*goals, *league]
+
+
+def _predict_fixtures(arguments):
+    """
+    Predict the scheduled fixtures of a competition.
+
+    Parameters
+    ----------
+    arguments : tuple
+        The name, goals for, goals against, home games, away games and points of each team, the average goals scored
+        by a home team and by an away team, the names of the home and away teams of each fixture and the settings of
+        the outcome engine.
+
+    Returns
+    -------
+    dict
+        The prediction of the fixtures as returned by `footy.Footy.predict_fixtures`, or None if there is not enough
+        data.
+    """
+    teams, home_average, away_average, pairs, settings = arguments
+    footy = Footy(outcome_engine=OutcomeEngine(**settings))
+
+    for team in teams:
+        footy.add_team(Team(*team))
+
+    footy.average_goals_scored_by_a_home_team(home_average)
+    footy.average_goals_scored_by_an_away_team(away_average)
+    return footy.predict_fixtures([(footy.get_team(home), footy.get_team(away)) for home, away in pairs])
+
+
+register(PredictionEngine, 'predict_results')
@@ -0,0 +1,278 @@
+"""Results Loader - Stream historical results files into competitions."""
+import os
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from footy.domain.Competition import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+DIVISIONS = {
+    'E0': 'PL',
+    'E1': 'ELC',
+    'D1': 'BL1',
+    'SP1': 'PD',
+    'I1': 'SA',
+    'F1': 'FL1',
+    'N1': 'DED',
+    'P1': 'PPL',
+    'BRA': 'BSA'
+}
+"""dict : The competition code (as used in footy.yml) of each football-data division code."""
+
+COLUMNS = {
+    'Div': 'division',
+    'Date': 'date',
+    'Time': 'time',
+    'HomeTeam': 'home_team',
+    'AwayTeam': 'away_team',
+    'FTHG': 'home_goals',
+    'FTAG': 'away_goals',
+    'Home': 'home_team',
+    'Away': 'away_team',
+    'HG': 'home_goals',
+    'AG': 'away_goals'
+}
+"""dict : The columns read from football-data files (both the main and the extra league layouts)."""
+
+KICKOFF_TIMEZONE = 'Europe/London'
+"""str : The time zone of the kickoff times of football-data files, which are converted to UTC."""
+
+
+class ResultsLoader:
+    """
+    Results Loader - Stream historical results files into competitions.
+
+    Reads results files in the football-data.co.uk layout (CSV, or Parquet if pyarrow is installed) a chunk of rows at
+    a time, so only one chunk is held as a DataFrame however big the files are.  The teams and fixtures of each row
+    are added to the competition of its division, and finished results are applied to the team totals with
+    `footy.engine.UpdateEngine.UpdateEngine.apply_results`.  Only the divisions of competitions configured in
+    footy.yml are loaded.  The kickoff times of the files are UK local times (see `KICKOFF_TIMEZONE`) and are
+    converted to UTC; rows without a kickoff time start at midnight UTC on their date.
+
+    Every season of a division is loaded into the one competition, so the goals, games and points of its teams are
+    totals over all of the seasons loaded.  The competitions are meant for history and backtesting (see
+    `footy.engine.BacktestEngine.BacktestEngine`, which replays each season from an empty table) and should not be
+    predicted directly unless a single season has been loaded.
+
+    Examples
+    --------
+    >>> loader = ResultsLoader(UpdateEngine(), 'footy.yml')
+    >>> competitions = loader.load(['E0-2019.csv', 'E0-2020.csv', 'D1-2020.csv'])
+    >>> competitions['PL'].get_team('Arsenal').points()
+    """
+
+    def __init__(self, update_engine, config='footy.yml', chunk_size=10000):
+        """
+        Construct a ResultsLoader object.
+
+        Parameters
+        ----------
+        update_engine : footy.engine.UpdateEngine.UpdateEngine
+            The engine that applies the results.
+        config : str or dict, optional
+            The path of the footy configuration file, or the configuration itself.  Defaults to 'footy.yml'.
+        chunk_size : int, optional
+            The number of rows read at a time.  Defaults to 10000.
+        """
+        if not isinstance(config, dict):
+            with open(config) as f:
+                config = yaml.safe_load(f)
+
+        self._config = config.get('competitions') or {}
+        self._chunk_size = chunk_size
+        self._update_engine = update_engine
+        self._competitions = {}
+
+    def competitions(self):
+        """
+        Get the competitions loaded so far.
+
+        Returns
+        -------
+        dict
+            The competitions keyed by their code.
+        """
+        return self._competitions
+
+    def load(self, paths, division=None):
+        """
+        Load results files.
+
+        Loading a file again does not count its results twice.
+
+        Parameters
+        ----------
+        paths : str or list of str
+            The paths of the files.  Files ending in .parquet are read as Parquet and any other file as CSV.
+        division : str, optional
+            The football-data division code (e.g. 'E0') of files without a Div column (such as the extra leagues
+            files).
+
+        Returns
+        -------
+        dict
+            The competitions loaded so far, keyed by their code.
+
+        Raises
+        ------
+        ImportError
+            When a Parquet file is loaded and pyarrow is not installed.
+        ValueError
+            When a file has no Div column and no division is given.
+        """
+        if isinstance(paths, (str, os.PathLike)):
+            paths = [paths]
+
+        for path in paths:
+            for chunk in self._read_chunks(path):
+                self._add_chunk(chunk, division)
+
+        return self._competitions
+
+    def _add_chunk(self, chunk, division):
+        """
+        Add the teams, fixtures and results of a chunk of rows to the competitions.
+
+        Parameters
+        ----------
+        chunk : pandas.DataFrame
+            The rows, with the columns renamed as in `COLUMNS`.
+        division : str
+            The division of rows without a division column.
+
+        Raises
+        ------
+        ValueError
+            When the chunk has no division column and no division is given.
+        """
+        if 'division' not in chunk:
+            if division is None:
+                raise ValueError('The file has no Div column, so the division must be given.')
+
+            chunk = chunk.assign(division=division)
+
+        chunk = chunk.dropna(subset=['division', 'date', 'home_team', 'away_team'])
+        dates = pd.to_datetime(chunk['date'], format='%d/%m/%Y', errors='coerce')
+        dates = dates.fillna(pd.to_datetime(chunk['date'], format='%d/%m/%y', errors='coerce'))
+        times = chunk['time'] if 'time' in chunk else pd.Series(np.nan, index=chunk.index)
+        kickoffs = pd.to_datetime(dates.dt.strftime('%Y-%m-%d ') + times.astype(str), format='%Y-%m-%d %H:%M',
+                                  errors='coerce')
+        # A kickoff in the hour repeated when the clocks go back is taken to be the first (BST) one.
+        kickoffs = kickoffs.dt.tz_localize(KICKOFF_TIMEZONE, ambiguous=np.ones(len(kickoffs), dtype=bool),
+                                           nonexistent='shift_forward').dt.tz_convert('UTC')
+        kickoffs = kickoffs.where(times.notna(), dates.dt.tz_localize('UTC'))
+        utc_starts = kickoffs.dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+        finished = chunk['home_goals'].notna() & chunk['away_goals'].notna()
+        home_goals = chunk['home_goals'].fillna(0).astype(int)
+        away_goals = chunk['away_goals'].fillna(0).astype(int)
+        results = {}
+
+        for row in zip(chunk['division'].tolist(), chunk['home_team'].tolist(), chunk['away_team'].tolist(),
+                       utc_starts.tolist(), finished.tolist(), home_goals.tolist(), away_goals.tolist()):
+            division_code, home_team_name, away_team_name, utc_start, is_finished, home, away = row
+            competition = self._competition(DIVISIONS.get(division_code))
+
+            if competition is None or not isinstance(utc_start, str):
+                continue
+
+            home_team = self._team(competition, home_team_name)
+            away_team = self._team(competition, away_team_name)
+
+            if is_finished:
+                results.setdefault(competition.code(), []).append(
+                    Fixture(home_team, away_team, 'FINISHED', utc_start, Result('FINISHED', home, away))
+                )
+            else:
+                competition.add_fixture(Fixture(home_team, away_team, 'SCHEDULED', utc_start))
+
+        for code, fixtures in results.items():
+            self._update_engine.apply_results(self._competitions[code], fixtures)
+
+    def _competition(self, code):
+        """
+        Get the competition for a code, creating it if it is configured and has not been loaded yet.
+
+        Parameters
+        ----------
+        code : str
+            The competition code.
+
+        Returns
+        -------
+        footy.domain.Competition.Competition
+            The competition, or None if the code is not configured.
+        """
+        competition = self._competitions.get(code)
+
+        if competition is None and code in self._config:
+            competition = Competition(code, self._config[code].get('competition_name'))
+            self._competitions[code] = competition
+
+        return competition
+
+    def _read_chunks(self, path):
+        """
+        Read a results file a chunk of rows at a time.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        Returns
+        -------
+        iterator of pandas.DataFrame
+            The chunks, with the columns renamed as in `COLUMNS`.
+
+        Raises
+        ------
+        ImportError
+            When the file is a Parquet file and pyarrow is not installed.
+        """
+        if str(path).endswith('.parquet'):
+            if pq is None:
+                raise ImportError('pyarrow is required to read Parquet files.')
+
+            parquet_file = pq.ParquetFile(path)
+            columns = [column for column in parquet_file.schema_arrow.names if column in COLUMNS]
+
+            for batch in parquet_file.iter_batches(batch_size=self._chunk_size, columns=columns):
+                yield batch.to_pandas().rename(columns=COLUMNS)
+        else:
+            # football-data files are encoded in Latin-1 and the teams and dates are read as text.
+            chunks = pd.read_csv(path, usecols=lambda column: column in COLUMNS, chunksize=self._chunk_size,
+                                 encoding='latin-1', dtype={'Div': str, 'Date': str, 'Time': str, 'HomeTeam': str,
+                                                            'AwayTeam': str, 'Home': str, 'Away': str})
+
+            for chunk in chunks:
+                yield chunk.rename(columns=COLUMNS)
+
+    def _team(self, competition, team_name):
+        """
+        Get a team of a competition, adding it if the competition does not have it yet.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition.
+        team_name : str
+            The name of the team.
+
+        Returns
+        -------
+        footy.domain.Team.Team
+            The team.
+        """
+        if not competition.has_team(team_name):
+            competition.add_team(Team(team_name))
+
+        return competition.get_team(team_name)
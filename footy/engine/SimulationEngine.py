@@ -0,0 +1,175 @@
+"""Simulation Engine - Monte Carlo simulation of the remaining fixtures of a competition."""
+import math
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from footy import Footy
+
+
+class SimulationEngine:
+    """
+    Simulation Engine - Monte Carlo simulation of the remaining fixtures of a competition.
+
+    The goals of every SCHEDULED fixture are drawn from Poisson distributions of the expected goals calculated by
+    `footy.Footy`, the points and goals are added to the current table and the final position of each team is
+    counted.  Teams are ranked by points, goal difference and goals scored, with any remaining tie broken at random.
+
+    The iterations are simulated in chunks, each with its own random number generator spawned from the seed, so a
+    seeded simulation gives the same result whatever the number of worker processes.
+
+    Examples
+    --------
+    >>> engine = SimulationEngine(competition)
+    >>> positions = engine.simulate(100000, seed=42, workers=4)
+    >>> engine.summary(positions, top=4, relegated=3)
+    """
+
+    def __init__(self, competition, footy=None):
+        """
+        Construct a SimulationEngine object.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition to simulate.
+        footy : footy.Footy, optional
+            The model providing the expected goals of each fixture.  Defaults to `footy.Footy.from_competition`.
+        """
+        self._competition = competition
+        self._footy = footy or Footy.from_competition(competition)
+
+    def simulate(self, iterations=10000, seed=None, workers=1, chunk_size=10000):
+        """
+        Simulate the remaining fixtures of the competition.
+
+        Parameters
+        ----------
+        iterations : int, optional
+            The number of seasons to simulate.  Defaults to 10000.
+        seed : int, optional
+            The seed of the random number generators.  If None, the simulation is not reproducible.
+        workers : int, optional
+            The number of processes to spread the chunks of iterations over.  Defaults to 1 (no process pool).
+        chunk_size : int, optional
+            The number of iterations simulated by each random number generator.  Defaults to 10000.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The probability of each team (the index) finishing in each position (the columns, starting from 1).
+
+        Raises
+        ------
+        ValueError
+            When the number of iterations or the chunk size is less than one, or there is not enough data to
+            calculate the expected goals of the remaining fixtures.
+        KeyError
+            When a fixture refers to a team that is not in the competition.
+        """
+        if iterations < 1:
+            raise ValueError(f'At least one iteration must be simulated, got {iterations}.')
+
+        if chunk_size < 1:
+            raise ValueError(f'The chunk size must be at least one, got {chunk_size}.')
+
+        teams = self._competition.teams
+        team_names = [team.team_name() for team in teams]
+        index = {team_name: row for row, team_name in enumerate(team_names)}
+        fixtures = [fixture for fixture in self._competition.fixtures if fixture.status == 'SCHEDULED']
+        home_rows = np.array([index[fixture.home_team.team_name()] for fixture in fixtures], dtype=np.intp)
+        away_rows = np.array([index[fixture.away_team.team_name()] for fixture in fixtures], dtype=np.intp)
+
+        home_expected_goals, away_expected_goals = self._footy.expected_goals(
+            [(fixture.home_team, fixture.away_team) for fixture in fixtures]
+        )
+        expected_goals = np.concatenate([home_expected_goals, away_expected_goals])
+
+        if not np.all(np.isfinite(expected_goals) & (expected_goals >= 0)):
+            raise ValueError('Not enough data to calculate the expected goals of the remaining fixtures.')
+
+        table = np.array([[team.points(), team.goals_for(), team.goals_against()] for team in teams],
+                         dtype=np.int64).reshape(-1, 3)
+        chunks = math.ceil(iterations / chunk_size)
+        seeds = np.random.SeedSequence(seed).spawn(chunks)
+        arguments = [
+            (table, home_rows, away_rows, home_expected_goals, away_expected_goals,
+             min(chunk_size, iterations - chunk * chunk_size), seeds[chunk])
+            for chunk in range(chunks)
+        ]
+
+        if workers > 1 and chunks > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                counts = sum(executor.map(_simulate_seasons, arguments))
+        else:
+            counts = sum(map(_simulate_seasons, arguments))
+
+        return pd.DataFrame(counts / iterations, index=team_names, columns=range(1, len(teams) + 1))
+
+    def summary(self, positions, top=4, relegated=3):
+        """
+        Summarise a distribution of final positions.
+
+        Parameters
+        ----------
+        positions : pandas.DataFrame
+            The probability of each team finishing in each position (as returned by `simulate`).
+        top : int, optional
+            The number of places at the top of the table (e.g. for European qualification).  Defaults to 4.
+        relegated : int, optional
+            The number of places at the bottom of the table that are relegated.  Defaults to 3.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The probability of each team winning the title, finishing in the top places and being relegated, and
+            the expected final position of each team.  Sorted by expected position.
+        """
+        df = pd.DataFrame({
+            'title': positions.iloc[:, 0],
+            'top': positions.iloc[:, :top].sum(axis=1),
+            'relegated': positions.iloc[:, positions.shape[1] - relegated:].sum(axis=1),
+            'expected_position': positions.values @ positions.columns.values.astype(float)
+        }, index=positions.index)
+        return df.sort_values('expected_position')
+
+
+def _simulate_seasons(arguments):
+    """
+    Simulate a chunk of seasons and count the final positions.
+
+    Parameters
+    ----------
+    arguments : tuple
+        The current table (points, goals for, goals against) of each team, the rows of the home and away teams of
+        each remaining fixture, the expected goals of the home and away teams, the number of seasons to simulate
+        and the seed sequence of the random number generator.
+
+    Returns
+    -------
+    numpy.ndarray
+        The number of times each team (rows) finished in each position (columns).
+    """
+    table, home_rows, away_rows, home_expected_goals, away_expected_goals, iterations, seed = arguments
+    rng = np.random.default_rng(seed)
+    teams = len(table)
+    home_goals = rng.poisson(home_expected_goals, size=(iterations, len(home_rows)))
+    away_goals = rng.poisson(away_expected_goals, size=(iterations, len(away_rows)))
+    home_points = 3 * (home_goals > away_goals) + (home_goals == away_goals)
+    away_points = 3 * (away_goals > home_goals) + (home_goals == away_goals)
+
+    # Incidence matrices map the fixtures onto the rows of their home and away teams.
+    home_incidence = np.zeros((len(home_rows), teams), dtype=np.int64)
+    home_incidence[np.arange(len(home_rows)), home_rows] = 1
+    away_incidence = np.zeros((len(away_rows), teams), dtype=np.int64)
+    away_incidence[np.arange(len(away_rows)), away_rows] = 1
+
+    points = table[:, 0] + home_points @ home_incidence + away_points @ away_incidence
+    goals_for = table[:, 1] + home_goals @ home_incidence + away_goals @ away_incidence
+    goals_against = table[:, 2] + away_goals @ home_incidence + home_goals @ away_incidence
+    tie_break = rng.random((iterations, teams))
+    order = np.lexsort((tie_break, -goals_for, -(goals_for - goals_against), -points), axis=-1)
+    cells = order * teams + np.arange(teams)
+    return np.bincount(cells.ravel(), minlength=teams * teams).reshape(teams, teams)
@@ -0,0 +1,125 @@
+"""Table Source - Read competition tables from the BBC Sport table pages configured in footy.yml."""
+import io
+
+import pandas as pd
+import yaml
+
+from footy.domain.Competition import Competition
+from footy.domain.Team import Team
+
+COLUMNS = {
+    'Team': 'team_name',
+    'P': 'played',
+    'Played': 'played',
+    'F': 'goals_for',
+    'GF': 'goals_for',
+    'Goals For': 'goals_for',
+    'A': 'goals_against',
+    'GA': 'goals_against',
+    'Goals Against': 'goals_against',
+    'Pts': 'points',
+    'Points': 'points'
+}
+"""dict : The columns read from a table (both the abbreviated and full column names)."""
+
+
+class TableSource:
+    """
+    Table Source - Read competition tables from the BBC Sport table pages configured in footy.yml.
+
+    A source tells `footy.engine.CompetitionFetcher.CompetitionFetcher` which URL to fetch for a competition and how
+    to turn the page into a competition, so other sources (or a local stand-in for testing) can be used by providing
+    the same `codes`, `url` and `parse` methods.
+
+    The tables do not split the games played into home and away games, so the home games of each team are taken to
+    be half of the games played (rounded up) and the away games the rest.  The tables do not have fixtures either, so
+    the competitions have no league averages and cannot be predicted by `footy.engine.PredictionEngine.PredictionEngine`
+    until their finished and scheduled fixtures are added.
+    """
+
+    def __init__(self, config='footy.yml'):
+        """
+        Construct a TableSource object.
+
+        Parameters
+        ----------
+        config : str or dict, optional
+            The path of the footy configuration file, or the configuration itself.  Defaults to 'footy.yml'.
+        """
+        if not isinstance(config, dict):
+            with open(config) as f:
+                config = yaml.safe_load(f)
+
+        self._config = config.get('competitions') or {}
+
+    def codes(self):
+        """
+        Get the codes of the competitions that have a table page.
+
+        Returns
+        -------
+        list of str
+            The competition codes.
+        """
+        return [code for code, settings in self._config.items() if settings.get('bbc_table_site')]
+
+    def url(self, code):
+        """
+        Get the URL of the table page of a competition.
+
+        Parameters
+        ----------
+        code : str
+            The competition code.
+
+        Returns
+        -------
+        str
+            The URL.
+
+        Raises
+        ------
+        KeyError
+            When the competition or its table page is not configured.
+        """
+        return self._config[code]['bbc_table_site']
+
+    def parse(self, code, content):
+        """
+        Create a competition from its table page.
+
+        Parameters
+        ----------
+        code : str
+            The competition code.
+        content : str
+            The HTML of the table page.
+
+        Returns
+        -------
+        footy.domain.Competition.Competition
+            The competition and its teams.
+
+        Raises
+        ------
+        ValueError
+            When the page does not have a table of teams and points.
+        """
+        for table in pd.read_html(io.StringIO(content)):
+            table = table.rename(columns=COLUMNS)
+
+            if {'team_name', 'played', 'goals_for', 'goals_against', 'points'}.issubset(table.columns):
+                break
+        else:
+            raise ValueError(f'The page for {code} does not have a table of teams and points.')
+
+        table = table.dropna(subset=['team_name'])
+        numbers = table[['played', 'goals_for', 'goals_against', 'points']].apply(pd.to_numeric).astype(int)
+        teams = [
+            Team(team_name, goals_for, goals_against, (played + 1) // 2, played // 2, points)
+            for team_name, played, goals_for, goals_against, points in zip(
+                table['team_name'].astype(str).tolist(), numbers['played'].tolist(), numbers['goals_for'].tolist(),
+                numbers['goals_against'].tolist(), numbers['points'].tolist()
+            )
+        ]
+        return Competition(code, self._config.get(code, {}).get('competition_name'), teams)
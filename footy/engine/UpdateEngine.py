@@ -1,33 +1,235 @@
 """Prediction Engine - Update the data model with the most resent fixtures and results."""
 
-from footy.domain import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.engine.CompetitionFetcher import CompetitionFetcher
+from footy.engine.ResultsLoader import ResultsLoader
+from footy.engine.TableSource import TableSource
+from footy.instrumentation import register
+
+POINTS_FOR_A_WIN = 3
+"""int : The number of points a team gets for winning a fixture."""
+POINTS_FOR_A_DRAW = 1
+"""int : The number of points a team gets for drawing a fixture."""
 
 
 class UpdateEngine:
     """Prediction Engine - Update the data model with the most resent fixtures and results."""
 
-    def __init__(self):
-        """Construct a UpdateEngine object."""
+    def __init__(self, fetcher=None):
+        """
+        Construct a UpdateEngine object.
+
+        Parameters
+        ----------
+        fetcher : footy.engine.CompetitionFetcher.CompetitionFetcher, optional
+            The fetcher used to retrieve competitions.  Defaults to a fetcher of the table pages configured in
+            footy.yml, created when it is first needed.
+        """
+        self._fetcher = fetcher
 
     def get_competition(self, code):
         """
         Retrieve data for the supplied competition code.
 
+        Parameters
+        ----------
+        code : str
+            The competition code (e.g. PL).
+
         Returns
         -------
         Competition
             A Competition object with the most recent fixtures and results for the supplied competition code.
+
+        Raises
+        ------
+        requests.RequestException
+            When the competition cannot be retrieved.
         """
-        # return Competition
-        return Competition
+        return self.fetcher().fetch(code)
 
-    def update_competition(self, competition):
+    def get_competitions(self, codes=None):
         """
-        Retrieve data and enrich the supplied competition with the most recent fixtures and results.
+        Retrieve data for several competitions concurrently.
+
+        Parameters
+        ----------
+        codes : list of str, optional
+            The competition codes.  Defaults to every competition configured.
+
+        Returns
+        -------
+        dict
+            Competition objects with the teams of the most recent tables keyed by their code.  The tables have no
+            fixtures (see `footy.engine.TableSource.TableSource`).
+
+        Raises
+        ------
+        requests.RequestException
+            When a competition cannot be retrieved.
+        """
+        return self.fetcher().fetch_all(codes)
+
+    def fetcher(self):
+        """
+        Get the fetcher used to retrieve competitions.
+
+        Returns
+        -------
+        footy.engine.CompetitionFetcher.CompetitionFetcher
+            The fetcher.
+        """
+        if self._fetcher is None:
+            self._fetcher = CompetitionFetcher(TableSource())
+
+        return self._fetcher
+
+    def apply_results(self, competition, results):
+        """
+        Apply newly finished results to the teams and fixtures of a competition.
+
+        Each result is looked up by the key of its fixture (see `footy.domain.Fixture.Fixture.key`) and added to the
+        goals, games and points of the two teams, so applying a result costs O(1) however big the competition is.  A
+        result for a fixture that the competition does not have is added to the competition.  Results that have
+        already been applied are skipped, and a corrected result (a fixture that has finished with a different score)
+        replaces the previous result.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition to update.
+        results : iterable of footy.domain.Fixture.Fixture
+            Fixtures holding the latest results (e.g. as retrieved from a data source, rather than the fixtures of the
+            competition itself).  Fixtures that are not FINISHED are skipped.
+
+        Returns
+        -------
+        set of str
+            The names of the teams whose goals, games or points have changed.
+
+        Raises
+        ------
+        KeyError
+            When a result refers to a team that is not in the competition.
+        """
+        changed_teams = set()
+
+        for result in results:
+            if result.status != 'FINISHED':
+                continue
+
+            home_team_name, away_team_name, utc_start = result.key()
+            home_team = competition.get_team(home_team_name)
+            away_team = competition.get_team(away_team_name)
+            home_goals = result.result.home_team_goals_scored
+            away_goals = result.result.away_team_goals_scored
+
+            if not competition.has_fixture(result):
+                self._add_result(home_team, away_team, home_goals, away_goals, 1)
+                competition.add_fixture(Fixture(home_team, away_team, 'FINISHED', utc_start,
+                                                Result('FINISHED', home_goals, away_goals)))
+                changed_teams.update((home_team_name, away_team_name))
+                continue
+
+            fixture = competition.get_fixture(home_team_name, away_team_name, utc_start)
+
+            if fixture.status == 'FINISHED':
+                previous = fixture.result
+
+                if (previous.home_team_goals_scored, previous.away_team_goals_scored) == (home_goals, away_goals):
+                    continue
+
+                self._add_result(home_team, away_team, previous.home_team_goals_scored,
+                                 previous.away_team_goals_scored, -1)
+
+            self._add_result(home_team, away_team, home_goals, away_goals, 1)
+            fixture.result = Result('FINISHED', home_goals, away_goals)
+            fixture.status = 'FINISHED'
+            changed_teams.update((home_team_name, away_team_name))
+
+        return changed_teams
+
+    def load_results(self, paths, config='footy.yml', chunk_size=10000, division=None):
+        """
+        Load historical results files into competitions.
+
+        The files are streamed a chunk of rows at a time (see `footy.engine.ResultsLoader.ResultsLoader`), so loading
+        many seasons of many leagues does not need all of the rows in memory at once.  Every season of a division is
+        loaded into one competition, so the competitions are for history and backtesting rather than prediction.
+
+        Parameters
+        ----------
+        paths : str or list of str
+            The paths of the files in the football-data.co.uk layout (CSV, or Parquet if pyarrow is installed).
+        config : str or dict, optional
+            The path of the footy configuration file, or the configuration itself.  Only the competitions configured
+            are loaded.  Defaults to 'footy.yml'.
+        chunk_size : int, optional
+            The number of rows read at a time.  Defaults to 10000.
+        division : str, optional
+            The football-data division code (e.g. 'E0') of files without a Div column.
+
+        Returns
+        -------
+        dict
+            The competitions keyed by their code (e.g. PL).
+        """
+        return ResultsLoader(self, config, chunk_size).load(paths, division)
+
+    def update_competition(self, competition, results=None):
+        """
+        Enrich the supplied competition with the most recent fixtures and results.
+
+        Parameters
+        ----------
+        competition : footy.domain.Competition.Competition
+            The competition to update.
+        results : iterable of footy.domain.Fixture.Fixture, optional
+            Fixtures holding the latest results, which are applied with `apply_results`.
 
         Returns
         -------
         Competition
-            A Competition object with the most recent fixtures and results for the supplied competition code.
+            The competition, updated with the results.
+        """
+        if results is not None:
+            self.apply_results(competition, results)
+
+        return competition
+
+    def _add_result(self, home_team, away_team, home_goals, away_goals, sign):
+        """
+        Add (or remove) a result to (or from) the goals, games and points of the two teams.
+
+        Parameters
+        ----------
+        home_team : footy.domain.Team.Team
+            The home team.
+        away_team : footy.domain.Team.Team
+            The away team.
+        home_goals : int
+            The number of goals scored by the home team.
+        away_goals : int
+            The number of goals scored by the away team.
+        sign : int
+            1 to add the result or -1 to remove it.
         """
-        return Competition
+        if home_goals > away_goals:
+            home_points, away_points = POINTS_FOR_A_WIN, 0
+        elif home_goals < away_goals:
+            home_points, away_points = 0, POINTS_FOR_A_WIN
+        else:
+            home_points, away_points = POINTS_FOR_A_DRAW, POINTS_FOR_A_DRAW
+
+        home_team.goals_for(home_team.goals_for() + sign * home_goals)
+        home_team.goals_against(home_team.goals_against() + sign * away_goals)
+        home_team.home_games(home_team.home_games() + sign)
+        home_team.points(home_team.points() + sign * home_points)
+        away_team.goals_for(away_team.goals_for() + sign * away_goals)
+        away_team.goals_against(away_team.goals_against() + sign * home_goals)
+        away_team.away_games(away_team.away_games() + sign)
+        away_team.points(away_team.points() + sign * away_points)
+
+
+register(UpdateEngine, 'apply_results', 'get_competition', 'get_competitions', 'load_results', 'update_competition')
@@ -0,0 +1,166 @@
+"""
+Instrumentation - Opt-in timing and call counts of the footy hot paths.
+
+The methods registered with this module are left untouched until instrumentation is enabled, so it costs nothing
+when disabled.  Enabling it replaces each registered method with a wrapper that counts the calls and times them,
+and disabling it restores the original methods.  Timings are inclusive (e.g. the time of `Footy.fixture` includes
+the time of the `Footy.predict_fixtures` call that it makes) and are only collected in the current process.
+
+Examples
+--------
+>>> from footy import instrumentation
+>>> with instrumentation.profiling():
+...     widget.fixture(widget.get_team('Arsenal'), widget.get_team('Stoke'))
+>>> instrumentation.snapshot()['Footy.fixture']
+{'calls': 1, 'total_seconds': 0.0004, 'mean_seconds': 0.0004, 'max_seconds': 0.0004}
+"""
+import functools
+import threading
+import time
+
+from contextlib import contextmanager
+
+_targets = []
+_originals = {}
+_stats = {}
+_lock = threading.Lock()
+_enabled = False
+
+
+def register(owner, *names):
+    """
+    Register methods of a class to be instrumented.
+
+    Parameters
+    ----------
+    owner : type
+        The class that defines the methods.
+    *names : str
+        The names of the methods.
+    """
+    for name in names:
+        _targets.append((owner, name))
+
+        if _enabled:
+            _wrap(owner, name)
+
+
+def enable():
+    """Start collecting the timings and call counts of the registered methods."""
+    global _enabled
+
+    with _lock:
+        if _enabled:
+            return
+
+        _enabled = True
+
+    for owner, name in _targets:
+        _wrap(owner, name)
+
+
+def disable():
+    """Stop collecting timings and call counts, restoring the original methods (the statistics are kept)."""
+    global _enabled
+
+    with _lock:
+        _enabled = False
+
+    for (owner, name), original in list(_originals.items()):
+        setattr(owner, name, original)
+        del _originals[(owner, name)]
+
+
+def is_enabled():
+    """
+    Check if instrumentation is enabled.
+
+    Returns
+    -------
+    bool
+        True if timings and call counts are being collected.
+    """
+    return _enabled
+
+
+def reset():
+    """Discard the statistics collected so far."""
+    with _lock:
+        _stats.clear()
+
+
+def snapshot():
+    """
+    Get the statistics collected so far.
+
+    Returns
+    -------
+    dict
+        For each method that has been called (keyed by class and method name, e.g. 'Footy.fixture'), a dictionary of
+        the number of calls and the total, mean and maximum duration of a call in seconds.
+    """
+    with _lock:
+        return {
+            key: {
+                'calls': calls,
+                'total_seconds': total,
+                'mean_seconds': total / calls,
+                'max_seconds': maximum
+            }
+            for key, (calls, total, maximum) in _stats.items()
+        }
+
+
+@contextmanager
+def profiling(clear=True):
+    """
+    Collect timings and call counts for the duration of a with block.
+
+    Parameters
+    ----------
+    clear : bool, optional
+        If True, discard the statistics collected before the block.  Defaults to True.
+    """
+    if clear:
+        reset()
+
+    enable()
+
+    try:
+        yield
+    finally:
+        disable()
+
+
+def _wrap(owner, name):
+    """
+    Replace a method with a wrapper that records its timings and call counts.
+
+    Parameters
+    ----------
+    owner : type
+        The class that defines the method.
+    name : str
+        The name of the method.
+    """
+    if (owner, name) in _originals:
+        return
+
+    original = owner.__dict__[name]
+    key = f'{owner.__name__}.{name}'
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            return original(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+
+            with _lock:
+                calls, total, maximum = _stats.get(key, (0, 0.0, 0.0))
+                _stats[key] = (calls + 1, total + elapsed, max(maximum, elapsed))
+
+    _originals[(owner, name)] = original
+    setattr(owner, name, wrapper)
@@ -0,0 +1,114 @@
+"""
+Season - Convert UTC dates/times to timestamps and find the season that a fixture is played in.
+
+The starts of fixtures are held as ISO 8601 strings (see `footy.domain.Fixture.Fixture`).  These functions convert
+them to POSIX timestamps, which `footy.domain.Competition.Competition`, `footy.domain.ResultsStore.ResultsStore` and
+`footy.engine.BacktestEngine.BacktestEngine` order and group fixtures by, and take the season of a fixture to start
+in July of the year it starts in, or the year before (January for calendar year competitions).
+
+Examples
+--------
+>>> season_of(timestamp('2021-02-13T21:30:00Z'), season_start_month('PL'))
+2020
+"""
+from datetime import datetime, timezone
+
+SEASON_START_MONTH = 7
+"""int : The month that a season is taken to start in, unless its competition is in `SEASON_START_MONTHS`."""
+SEASON_START_MONTHS = {
+    'BSA': 1
+}
+"""dict : The month that a season starts in of each competition (by code) whose seasons do not start in July."""
+
+
+def season_of(timestamp, start_month=SEASON_START_MONTH):
+    """
+    Get the season of a fixture from when it starts.
+
+    Parameters
+    ----------
+    timestamp : float
+        The POSIX timestamp of the start of the fixture.
+    start_month : int, optional
+        The month that the seasons of the competition of the fixture start in (see `season_start_month`).  Defaults
+        to `SEASON_START_MONTH`.
+
+    Returns
+    -------
+    int
+        The year that the season of the fixture starts in.
+    """
+    moment = datetime.fromtimestamp(timestamp, timezone.utc)
+    return moment.year if moment.month >= start_month else moment.year - 1
+
+
+def season_start_month(code):
+    """
+    Get the month that the seasons of a competition start in.
+
+    Parameters
+    ----------
+    code : str
+        The code of the competition.
+
+    Returns
+    -------
+    int
+        The month from `SEASON_START_MONTHS`, or `SEASON_START_MONTH` if the competition is not in it.
+    """
+    return SEASON_START_MONTHS.get(code, SEASON_START_MONTH)
+
+
+def timestamp(utc_start):
+    """
+    Convert a UTC date/time to a POSIX timestamp.
+
+    Parameters
+    ----------
+    utc_start : str or datetime.datetime
+        An ISO 8601 date/time (e.g. '2021-02-13T21:30:00Z') or a datetime (naive datetimes are taken to be UTC).
+
+    Returns
+    -------
+    float
+        The timestamp, or None if the date/time is empty or not valid.
+    """
+    if isinstance(utc_start, datetime):
+        moment = utc_start
+    else:
+        try:
+            moment = datetime.fromisoformat(utc_start.replace('Z', '+00:00'))
+        except (AttributeError, ValueError):
+            return None
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+
+    return moment.timestamp()
+
+
+def valid_timestamp(moment):
+    """
+    Convert a UTC date/time to a POSIX timestamp, raising an error if it is not valid.
+
+    Parameters
+    ----------
+    moment : str or datetime.datetime
+        An ISO 8601 date/time or a datetime.
+
+    Returns
+    -------
+    float
+        The timestamp.
+
+    Raises
+    ------
+    ValueError
+        When the date/time is not valid.
+    """
+    seconds = timestamp(moment)
+
+    if seconds is None:
+        raise ValueError(f'Invalid date/time: {moment!r}')
+
+    return seconds
@@ -0,0 +1,90 @@
+"""
+Snapshot - Save and load named arrays as an uncompressed .npz file that can be memory mapped.
+
+`footy.Footy.snapshot` and `footy.domain.Competition.Competition.snapshot` use this module to store their state as
+columns of arrays.  The arrays are stored uncompressed, so each array is held in one contiguous block of the file and
+can be memory mapped in place instead of being read into memory.  Nothing is pickled, so a snapshot cannot run code
+when it is loaded.
+
+Examples
+--------
+>>> save_arrays('state.npz', {'goals_for': np.array([64, 65])})
+>>> load_arrays('state.npz', mmap_mode='r')['goals_for']
+memmap([64, 65])
+"""
+import zipfile
+
+import numpy as np
+
+
+def save_arrays(path, arrays):
+    """
+    Save named arrays to an uncompressed .npz file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.  Unlike `numpy.savez`, '.npz' is not appended.
+    arrays : dict
+        The arrays keyed by name.
+    """
+    with open(path, 'wb') as f:
+        np.savez(f, **arrays)
+
+
+def load_arrays(path, mmap_mode=None):
+    """
+    Load named arrays from an uncompressed .npz file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    mmap_mode : str, optional
+        If given (e.g. 'r' or 'c', see `numpy.memmap`), the numeric arrays are memory mapped rather than read into
+        memory.  Arrays of strings are always read into memory.  Defaults to reading every array.
+
+    Returns
+    -------
+    dict
+        The arrays keyed by name.
+
+    Raises
+    ------
+    ValueError
+        When memory mapping an array that is compressed or holds Python objects.
+    """
+    if mmap_mode is None:
+        with np.load(path, allow_pickle=False) as archive:
+            return {name: archive[name] for name in archive.files}
+
+    arrays = {}
+
+    with open(path, 'rb') as f, zipfile.ZipFile(f) as archive:
+        for info in archive.infolist():
+            name = info.filename[:-len('.npy')]
+
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f'Cannot memory map the compressed array {name}.')
+
+            # The data of a member follows its local header, which has a fixed size plus its name and extra field.
+            f.seek(info.header_offset)
+            local_header = f.read(30)
+            f.seek(info.header_offset + 30 + int.from_bytes(local_header[26:28], 'little') +
+                   int.from_bytes(local_header[28:30], 'little'))
+            if np.lib.format.read_magic(f) == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+            if dtype.hasobject:
+                raise ValueError(f'Cannot memory map the array {name}, which holds Python objects.')
+
+            if dtype.kind in 'US' or shape == () or 0 in shape:
+                arrays[name] = np.fromfile(f, dtype=dtype, count=int(np.prod(shape))).reshape(
+                    shape, order='F' if fortran_order else 'C')
+            else:
+                arrays[name] = np.memmap(f, dtype=dtype, mode=mmap_mode, offset=f.tell(), shape=shape,
+                                         order='F' if fortran_order else 'C')
+
+    return arrays
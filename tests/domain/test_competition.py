@@ -1,7 +1,15 @@
+import os
+import pickle
+import tempfile
 import unittest
 
+from datetime import datetime, timezone
+
+import numpy as np
+
 from footy.domain.Competition import Competition
 from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
 from footy.domain.Team import Team
 
 
@@ -70,6 +78,222 @@ class TestCompetition(unittest.TestCase):
         self.assertEqual(1, len(competition.fixtures))
         self.assertTrue(fixture in competition.fixtures)
 
+    def test_add_team_does_not_add_team_with_same_name(self):
+        competition = self.competition_under_test_producer()
+        competition.add_team(Team('Arsenal', 1, 2, 3, 4, 5))
+
+        self.assertEqual(2, len(competition.teams))
+        self.assertEqual(self.EXPECTED_COMPETITION.teams[0], competition.get_team('Arsenal'))
+        self.assertTrue(competition.has_team('Stoke'))
+        self.assertFalse(competition.has_team('Hull'))
+
+    def test_add_fixture_does_not_add_fixture_with_same_key(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        fixture = Fixture(arsenal, stoke, utc_start='2021-02-13T21:30:00Z')
+        competition.add_fixture(fixture)
+        competition.add_fixture(Fixture(arsenal, stoke, 'FINISHED', '2021-02-13T21:30:00Z'))
+        competition.add_fixture(Fixture(stoke, arsenal, utc_start='2021-02-13T21:30:00Z'))
+
+        self.assertEqual(2, len(competition.fixtures))
+        self.assertIs(fixture, competition.get_fixture('Arsenal', 'Stoke', '2021-02-13T21:30:00Z'))
+        self.assertTrue(competition.has_fixture(Fixture(stoke, arsenal, utc_start='2021-02-13T21:30:00Z')))
+        self.assertFalse(competition.has_fixture(Fixture(stoke, arsenal)))
+
+        with self.assertRaises(KeyError):
+            competition.get_fixture('Stoke', 'Arsenal')
+
+    def test_setting_fixtures_rebuilds_index(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        competition.add_fixture(Fixture(arsenal, stoke))
+        competition.fixtures = [Fixture(stoke, arsenal)]
+
+        self.assertFalse(competition.has_fixture(Fixture(arsenal, stoke)))
+        self.assertTrue(competition.has_fixture(Fixture(stoke, arsenal)))
+
+    def test_fixtures_are_indexed_by_team_status_and_start(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        hull = Team('Hull', 39, 63, 18, 19, 35)
+        competition.add_team(hull)
+        first = Fixture(arsenal, stoke, 'FINISHED', '2021-02-13T15:00:00Z')
+        second = Fixture(stoke, hull, utc_start='2021-02-20T15:00:00Z')
+        third = Fixture(hull, arsenal, utc_start='2021-02-16T19:45:00Z')
+        unscheduled = Fixture(arsenal, hull)
+
+        for fixture in [first, second, third, unscheduled]:
+            competition.add_fixture(fixture)
+
+        self.assertEqual([first, second], competition.fixtures_for_team('Stoke'))
+        self.assertEqual([], competition.fixtures_for_team('Chelsea'))
+        self.assertEqual([second, third, unscheduled], competition.fixtures_with_status('SCHEDULED'))
+        self.assertEqual([first, third, second], competition.fixtures_between())
+        self.assertEqual([third], competition.fixtures_between('2021-02-14T00:00:00Z', '2021-02-20T15:00:00Z'))
+        self.assertEqual([third, second],
+                         competition.fixtures_between(datetime(2021, 2, 16, 19, 45, tzinfo=timezone.utc)))
+
+        with self.assertRaises(ValueError):
+            competition.fixtures_between('next week')
+
+    def test_indexes_follow_changes_to_fixtures(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        fixture = Fixture(arsenal, stoke, utc_start='2021-02-13T15:00:00Z')
+        competition.add_fixture(fixture)
+
+        fixture.status = 'FINISHED'
+        self.assertEqual([], competition.fixtures_with_status('SCHEDULED'))
+        self.assertEqual([fixture], competition.fixtures_with_status('FINISHED'))
+
+        fixture.utc_start = '2021-03-13T15:00:00Z'
+        self.assertEqual([], competition.fixtures_between(end='2021-03-01T00:00:00Z'))
+        self.assertEqual([fixture], competition.fixtures_between(start='2021-03-01T00:00:00Z'))
+        self.assertIs(fixture, competition.get_fixture('Arsenal', 'Stoke', '2021-03-13T15:00:00Z'))
+        self.assertFalse(competition.has_fixture(Fixture(arsenal, stoke, utc_start='2021-02-13T15:00:00Z')))
+
+        fixture.home_team = Team('Hull', 39, 63, 18, 19, 35)
+        self.assertEqual([], competition.fixtures_for_team('Arsenal'))
+        self.assertEqual([fixture], competition.fixtures_for_team('Hull'))
+
+    def test_every_competition_of_a_fixture_follows_its_changes(self):
+        competition = self.competition_under_test_producer()
+        other = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        fixture = Fixture(arsenal, stoke, utc_start='2021-02-13T15:00:00Z')
+        competition.add_fixture(fixture)
+        other.add_fixture(Fixture(stoke, arsenal, utc_start='2021-01-13T15:00:00Z'))
+        other.add_fixture(fixture)
+        self.assertEqual([competition, other], fixture.competitions())
+
+        fixture.status = 'FINISHED'
+
+        for item in (competition, other):
+            self.assertNotIn(fixture, item.fixtures_with_status('SCHEDULED'))
+            self.assertEqual([fixture], item.fixtures_with_status('FINISHED'))
+
+        fixture.utc_start = '2021-03-13T15:00:00Z'
+
+        for item in (competition, other):
+            self.assertEqual([fixture], item.fixtures_between(start='2021-03-01T00:00:00Z'))
+
+    def test_changing_a_fixture_to_the_key_of_another_raises_value_error(self):
+        competition = self.competition_under_test_producer()
+        other = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        fixture = Fixture(arsenal, stoke, utc_start='2021-02-13T15:00:00Z')
+        competition.add_fixture(fixture)
+        other.add_fixture(fixture)
+        other.add_fixture(Fixture(arsenal, stoke, utc_start='2021-03-13T15:00:00Z'))
+
+        with self.assertRaises(ValueError):
+            fixture.utc_start = '2021-03-13T15:00:00Z'
+
+        # The fixture and the indexes of both of its competitions are left as they were.
+        self.assertEqual('2021-02-13T15:00:00Z', fixture.utc_start)
+
+        for item in (competition, other):
+            self.assertIs(fixture, item.get_fixture('Arsenal', 'Stoke', '2021-02-13T15:00:00Z'))
+            self.assertEqual([fixture], item.fixtures_between(end='2021-03-01T00:00:00Z'))
+
+        self.assertIsNot(fixture, other.get_fixture('Arsenal', 'Stoke', '2021-03-13T15:00:00Z'))
+
+    def test_pickled_competition_follows_changes_to_its_fixtures(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        competition.add_fixture(Fixture(arsenal, stoke, utc_start='2021-02-13T15:00:00Z'))
+        copy = pickle.loads(pickle.dumps(competition))
+        fixture = copy.fixtures[0]
+        self.assertEqual([copy], fixture.competitions())
+
+        fixture.status = 'FINISHED'
+        self.assertEqual([fixture], copy.fixtures_with_status('FINISHED'))
+        self.assertEqual([competition.fixtures[0]], competition.fixtures_with_status('SCHEDULED'))
+
+    def test_most_confident_fixtures_are_ranked_by_largest_odds(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        fixtures = []
+
+        for index, probabilities in enumerate([[0.5, 0.3, 0.2], [0.1, 0.2, 0.7], [0.4, 0.35, 0.25], None]):
+            fixture = Fixture(arsenal, stoke, utc_start=f'2021-02-1{index}T15:00:00Z')
+            fixture.outcome_probabilities(probabilities)
+            competition.add_fixture(fixture)
+            fixtures.append(fixture)
+
+        fixtures[2].status = 'FINISHED'
+        self.assertEqual([fixtures[1], fixtures[0]], competition.most_confident_fixtures(2))
+        self.assertEqual([fixtures[2], fixtures[0], fixtures[1]], competition.most_confident_fixtures(5, least=True))
+        self.assertEqual([fixtures[0]], competition.most_confident_fixtures(1, status='SCHEDULED', least=True))
+        self.assertEqual([], competition.most_confident_fixtures(1, status='POSTPONED'))
+        self.assertEqual([fixtures[1]], Competition.rank_fixtures(reversed(fixtures), 1))
+
+    def test_snapshot_is_restored(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        hull = Team('Hull', 39, 63, 18, 19, 35)
+        finished = Fixture(arsenal, stoke, 'FINISHED', '2021-02-13T15:00:00Z', Result('FINISHED', 2, 1))
+        scheduled = Fixture(stoke, hull, utc_start='2021-03-13T15:00:00Z')
+        scheduled.final_score_matrix(np.full((7, 7), 1 / 49), tail_mass=True)
+        scheduled.outcome_probabilities([0.4, 0.3, 0.3])
+        scheduled.home_team_goals_probability([1 / 7] * 7)
+        scheduled.away_team_goals_probability([1 / 7] * 7)
+        competition.fixtures = [finished, scheduled, Fixture(hull, arsenal)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'competition.npz')
+            competition.snapshot(path)
+
+            for mmap_mode in (None, 'r'):
+                restored = Competition.restore(path, mmap_mode)
+                self.assertEqual('Test', restored.code())
+                self.assertEqual('Group', restored.stage)
+                self.assertEqual('2021-02-13T21:30:00Z', restored.end_date)
+                self.assertEqual(competition.teams, restored.teams)
+                self.assertEqual([fixture.key() for fixture in competition.fixtures],
+                                 [fixture.key() for fixture in restored.fixtures])
+                self.assertEqual(Result('FINISHED', 2, 1), restored.fixtures[0].result)
+                self.assertEqual(hull, restored.fixtures[1].away_team)
+                self.assertIs(restored.fixtures[1].away_team, restored.fixtures[2].home_team)
+                self.assertEqual([0.4, 0.3, 0.3], restored.fixtures[1].outcome_probabilities())
+                self.assertEqual(0.4, restored.fixtures[1].largest_odds())
+                np.testing.assert_array_equal(scheduled.final_score_matrix(), restored.fixtures[1].final_score_matrix())
+                self.assertTrue(restored.fixtures[1].final_score_tail_mass())
+                self.assertIsNone(restored.fixtures[0].final_score_matrix())
+                self.assertEqual(restored.fixtures[1:], restored.fixtures_with_status('SCHEDULED'))
+                self.assertEqual([restored.fixtures[1]], restored.fixtures_between(start='2021-03-01T00:00:00Z'))
+                self.assertEqual([restored.fixtures[1]], restored.most_confident_fixtures(5))
+
+    def test_snapshot_keeps_fixtures_without_a_start(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        competition.add_fixture(Fixture(arsenal, stoke, utc_start=None))
+        competition.add_fixture(Fixture(stoke, arsenal, None, '', Result(None, 0, 0)))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'competition.npz')
+            competition.snapshot(path)
+            restored = Competition.restore(path)
+
+        self.assertEqual([('Arsenal', 'Stoke', None), ('Stoke', 'Arsenal', '')],
+                         [fixture.key() for fixture in restored.fixtures])
+        self.assertTrue(restored.has_fixture(Fixture(arsenal, stoke, utc_start=None)))
+        self.assertIs(restored.fixtures[0], restored.get_fixture('Arsenal', 'Stoke', None))
+        self.assertEqual(['SCHEDULED', None], [fixture.status for fixture in restored.fixtures])
+        self.assertIsNone(restored.fixtures[1].result.status)
+
+    def test_snapshot_needs_predictions_of_one_shape(self):
+        competition = self.competition_under_test_producer()
+        arsenal, stoke = competition.teams
+        fixtures = [Fixture(arsenal, stoke, utc_start='2021-02-13T15:00:00Z'), Fixture(stoke, arsenal)]
+        fixtures[0].final_score_matrix(np.zeros((7, 7)))
+        fixtures[1].final_score_matrix(np.zeros((8, 8)))
+        competition.fixtures = fixtures
+
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                competition.snapshot(os.path.join(directory, 'competition.npz'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,8 @@
+import numpy as np
+import pickle
 import unittest
 
+from footy.domain.Competition import Competition
 from footy.domain.Fixture import Fixture
 from footy.domain.Result import Result
 from footy.domain.Team import Team
@@ -45,6 +48,52 @@ class TestFixture(unittest.TestCase):
         fixture_b = Fixture(self.HOME_TEAM, self.AWAY_TEAM, self.STATUS, self.UTC_START, Result('COMPLETE', 1, 2))
         self.assertNotEqual(fixture_a, fixture_b)
 
+    def test_largest_odds_is_cached_when_outcome_probabilities_are_set(self):
+        fixture_a = Fixture(self.HOME_TEAM, self.AWAY_TEAM)
+        fixture_b = Fixture(self.HOME_TEAM, self.AWAY_TEAM)
+        self.assertIsNone(fixture_a.largest_odds())
+        fixture_a.outcome_probabilities([0.2, 0.3, 0.5])
+        fixture_b.outcome_probabilities([0.6, 0.3, 0.1])
+        self.assertEqual(0.5, fixture_a.largest_odds())
+        self.assertTrue(fixture_a < fixture_b)
+        fixture_a.outcome_probabilities([0.7, 0.2, 0.1])
+        self.assertEqual(0.7, fixture_a.largest_odds())
+        self.assertTrue(fixture_a > fixture_b)
+        self.assertEqual([fixture_b, fixture_a], sorted([fixture_a, fixture_b]))
+
+    def test_final_score_probabilities_are_built_from_matrix_and_cached(self):
+        fixture = Fixture(self.HOME_TEAM, self.AWAY_TEAM)
+        self.assertIsNone(fixture.final_score_probabilities())
+
+        fixture.final_score_matrix(np.array([[0.2, 0.1], [0.0, 0.7]]))
+        df = fixture.final_score_probabilities()
+        self.assertEqual([[1, 1, 0.7], [0, 0, 0.2], [0, 1, 0.1]], df.values.tolist())
+        self.assertIs(df, fixture.final_score_probabilities())
+
+        fixture.final_score_matrix(np.array([[1.0]]))
+        self.assertEqual([[0, 0, 1.0]], fixture.final_score_probabilities().values.tolist())
+
+    def test_tail_bucket_of_final_score_matrix_is_labelled(self):
+        fixture = Fixture(self.HOME_TEAM, self.AWAY_TEAM)
+        fixture.final_score_matrix(np.array([[0.2, 0.1], [0.0, 0.7]]), tail_mass=True)
+        self.assertTrue(fixture.final_score_tail_mass())
+        self.assertEqual([['1+', '1+', 0.7], [0, 0, 0.2], [0, '1+', 0.1]],
+                         fixture.final_score_probabilities().values.tolist())
+
+        fixture.final_score_matrix(np.array([[0.2, 0.1], [0.0, 0.7]]))
+        self.assertFalse(fixture.final_score_tail_mass())
+        self.assertEqual([[1, 1, 0.7], [0, 0, 0.2], [0, 1, 0.1]], fixture.final_score_probabilities().values.tolist())
+
+    def test_competitions_are_not_pickled_with_the_fixture(self):
+        competition = Competition('Test', fixtures=[Fixture(self.HOME_TEAM, self.AWAY_TEAM, utc_start=self.UTC_START)])
+        fixture = pickle.loads(pickle.dumps(competition.fixtures[0]))
+        self.assertEqual([], fixture.competitions())
+        self.assertEqual(self.UTC_START, fixture.utc_start)
+        self.assertEqual('Arsenal', fixture.home_team.team_name())
+
+        fixture.status = 'FINISHED'
+        self.assertEqual([], competition.fixtures_with_status('FINISHED'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,128 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.ResultsStore import ResultsStore
+from footy.domain.Team import Team
+
+
+class TestResultsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'results.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def results_store_under_test_producer(self):
+        arsenal, stoke, hull = Team('Arsenal'), Team('Stoke'), Team('Hull')
+        store = ResultsStore(self.path, mode='a')
+        store.append([Fixture(arsenal, stoke, 'FINISHED', '2019-08-10T15:00:00Z', Result('FINISHED', 2, 1)),
+                      Fixture(stoke, hull, 'FINISHED', '2020-03-07T15:00:00Z', Result('FINISHED', 0, 0))], 'PL')
+        store.append([Fixture(hull, arsenal, 'FINISHED', '2020-09-12T15:00:00Z', Result('FINISHED', 1, 3))], 'PL')
+        store.append([Fixture(stoke, arsenal, 'FINISHED', '', Result('FINISHED', 1, 1))], 'ELC', season=2020)
+        return store
+
+    def test_fixtures_are_appended_and_read(self):
+        store = self.results_store_under_test_producer()
+        self.assertEqual(4, len(store))
+        self.assertEqual([2019, 2020], store.seasons())
+        self.assertEqual(['ELC', 'PL'], store.competitions())
+        self.assertEqual(['Arsenal', 'Stoke', 'Hull'], store.team_names())
+        self.assertEqual(2, store.team_id('Hull'))
+
+        fixtures = list(store)
+        self.assertEqual(('Arsenal', 'Stoke', '2019-08-10T15:00:00Z'), fixtures[0].key())
+        self.assertEqual(Result('FINISHED', 2, 1), fixtures[0].result)
+        self.assertEqual('FINISHED', fixtures[0].status)
+        self.assertEqual(('Stoke', 'Arsenal', ''), fixtures[3].key())
+        self.assertIs(fixtures[3].home_team, fixtures[1].home_team)
+
+    def test_seasons_of_calendar_year_competitions_start_in_january(self):
+        store = ResultsStore(self.path, mode='a')
+        fixtures = [Fixture(Team('Santos'), Team('Flamengo'), 'FINISHED', utc_start, Result('FINISHED', 1, 0))
+                    for utc_start in ('2021-05-29T19:00:00Z', '2021-08-07T19:00:00Z')]
+        store.append(fixtures, 'BSA')
+        store.append(fixtures, 'PL')
+        self.assertEqual([2021, 2021], store.records(competition='BSA')['season'].tolist())
+        self.assertEqual([2020, 2021], store.records(competition='PL')['season'].tolist())
+
+    def test_records_are_memory_mapped_and_filtered(self):
+        self.results_store_under_test_producer()
+        store = ResultsStore(self.path)
+        records = store.records()
+        self.assertIsInstance(records, np.memmap)
+        self.assertFalse(records.flags.writeable)
+        self.assertEqual([2, 0, 1, 1], records['home_goals'].tolist())
+
+        self.assertEqual([0, 1], store.records(team='Hull')['home_goals'].tolist())
+        self.assertEqual([3, 1], store.records(season=2020)['away_goals'].tolist())
+        self.assertEqual(1, len(store.records(season=2020, competition='PL')))
+        self.assertEqual(0, len(store.records(team='Chelsea')))
+        self.assertEqual([('Stoke', 'Hull', '2020-03-07T15:00:00Z')],
+                         [fixture.key() for fixture in store.fixtures(season=2019, team='Hull')])
+
+        with self.assertRaises(ValueError):
+            store.append([], 'PL')
+
+    def test_groups_are_slices_when_appended_in_order(self):
+        store = self.results_store_under_test_producer()
+        groups = dict(store.groups('season'))
+        self.assertEqual([2019, 2020], list(groups))
+        self.assertIsInstance(groups[2019], np.memmap)
+        self.assertEqual([2, 0], groups[2019]['home_goals'].tolist())
+
+        groups = dict(store.groups('competition'))
+        self.assertEqual(['ELC', 'PL'], list(groups))
+        self.assertEqual([2, 0, 1], groups['PL']['home_goals'].tolist())
+
+        groups = {team_name: [fixture.key()[:2] for fixture in fixtures]
+                  for team_name, fixtures in store.groups('team', fixtures=True)}
+        self.assertEqual([('Arsenal', 'Stoke'), ('Hull', 'Arsenal'), ('Stoke', 'Arsenal')], groups['Arsenal'])
+        self.assertEqual([('Stoke', 'Hull'), ('Hull', 'Arsenal')], groups['Hull'])
+
+        with self.assertRaises(ValueError):
+            store.groups('matchday')
+
+    def test_appends_are_seen_after_refresh(self):
+        store = self.results_store_under_test_producer()
+        reader = pickle.loads(pickle.dumps(ResultsStore(self.path)))
+        self.assertEqual(4, len(reader))
+
+        store.append([Fixture(Team('Chelsea'), Team('Hull'), 'FINISHED', '2021-01-02T15:00:00Z',
+                              Result('FINISHED', 4, 0))], 'PL')
+        self.assertEqual(5, len(store))
+        self.assertEqual(4, len(reader))
+
+        reader.refresh()
+        self.assertEqual(5, len(reader))
+        self.assertEqual('Chelsea', reader.team_names()[3])
+
+    def test_invalid_fixtures_are_not_appended(self):
+        store = self.results_store_under_test_producer()
+
+        with self.assertRaises(ValueError):
+            store.append([Fixture(Team('Chelsea'), Team('Hull'))], 'PL')
+
+        with self.assertRaises(ValueError):
+            store.append([Fixture(Team('Hull'), Team('Stoke'), 'ABANDONED', '2021-01-02T15:00:00Z')], 'PL')
+
+        with self.assertRaises(ValueError):
+            store.append([], 'PREMIER_LEAGUE')
+
+        self.assertEqual(4, len(store))
+        self.assertEqual(['Arsenal', 'Stoke', 'Hull'], ResultsStore(self.path).team_names())
+        self.assertEqual(['Arsenal', 'Stoke', 'Hull'], store.team_names())
+
+        with self.assertRaises(FileNotFoundError):
+            ResultsStore(os.path.join(self.directory.name, 'missing.bin'))
+
+
+if __name__ == '__main__':
+    unittest.main()
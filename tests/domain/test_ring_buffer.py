@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from footy.domain.RingBuffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def ring_buffer_under_test_producer(self, values, capacity=5):
+        ring_buffer = RingBuffer(capacity)
+
+        for value in values:
+            ring_buffer.append(value)
+
+        return ring_buffer
+
+    def test_ring_buffer_keeps_newest_values(self):
+        ring_buffer = self.ring_buffer_under_test_producer(range(8))
+        self.assertEqual(5, len(ring_buffer))
+        self.assertEqual(5, ring_buffer.capacity())
+        self.assertEqual([3.0, 4.0, 5.0, 6.0, 7.0], ring_buffer.tolist())
+        np.testing.assert_array_equal([3.0, 4.0, 5.0, 6.0, 7.0], ring_buffer.values())
+        self.assertEqual(3.0, ring_buffer[0])
+        self.assertEqual(7.0, ring_buffer[-1])
+
+        with self.assertRaises(IndexError):
+            ring_buffer[5]
+
+    def test_statistics_match_pandas(self):
+        values = [0.5, 1.25, 2.0, 0.75, 1.5, 1.0, 2.25]
+        ring_buffer = self.ring_buffer_under_test_producer(values)
+        series = pd.Series(values[-5:])
+        self.assertAlmostEqual(series.mean(), ring_buffer.mean())
+        self.assertAlmostEqual(series.tail(3).mean(), ring_buffer.mean(window=3))
+        self.assertAlmostEqual(series.std(ddof=0), ring_buffer.std())
+        self.assertAlmostEqual(series.tail(4).std(), ring_buffer.std(window=4, ddof=1))
+        self.assertAlmostEqual(series.ewm(alpha=0.3).mean().iloc[-1], ring_buffer.ewm(0.3))
+        self.assertAlmostEqual(series.tail(2).ewm(alpha=0.3).mean().iloc[-1], ring_buffer.ewm(0.3, window=2))
+
+    def test_statistics_of_empty_ring_buffer_are_nan(self):
+        ring_buffer = self.ring_buffer_under_test_producer([])
+        self.assertTrue(np.isnan(ring_buffer.mean()))
+        self.assertTrue(np.isnan(ring_buffer.std()))
+        self.assertTrue(np.isnan(ring_buffer.ewm(0.5)))
+
+    def test_invalid_arguments_raise_errors(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+        with self.assertRaises(ValueError):
+            self.ring_buffer_under_test_producer([1.0]).ewm(0.0)
+
+    def test_clear_discards_values(self):
+        ring_buffer = self.ring_buffer_under_test_producer(range(3))
+        ring_buffer.clear()
+        self.assertEqual([], ring_buffer.tolist())
+        ring_buffer.append(4.0)
+        self.assertEqual([4.0], ring_buffer.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from footy.domain.Team import Team
+from footy.domain.Team import HISTORY_CAPACITY, Team
 
 
 class TestTeam(unittest.TestCase):
@@ -56,6 +56,34 @@ class TestTeam(unittest.TestCase):
         team_b = Team("team", 1, 2, 3, 4, 5)
         self.assertNotEqual(team_a, team_b)
 
+    def test_team_has_no_instance_dictionary(self):
+        team = Team(self.TEAM_NAME)
+        self.assertFalse(hasattr(team, '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            team.nickname = 'Toffees'
+
+    def test_histories_are_created_when_first_used(self):
+        team = Team(self.TEAM_NAME)
+        history = team.historic_attack_strength()
+        self.assertEqual([], history.tolist())
+        history.append(1.2)
+        team.historic_attack_strength(0.9)
+        self.assertEqual([1.2, 0.9], team.historic_attack_strength().tolist())
+        self.assertEqual([0.25], team.historic_briers_score(0.25).tolist())
+        self.assertEqual(0, len(team.historic_defence_factor()))
+
+    def test_histories_are_bounded(self):
+        team = Team(self.TEAM_NAME)
+
+        for matchday in range(HISTORY_CAPACITY + 10):
+            team.historic_defence_factor(float(matchday))
+
+        history = team.historic_defence_factor()
+        self.assertEqual(HISTORY_CAPACITY, len(history))
+        self.assertEqual(10.0, history[0])
+        self.assertEqual(float(HISTORY_CAPACITY + 9), history[-1])
+
 
 if __name__ == '__main__':
     unittest.main()
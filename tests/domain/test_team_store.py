@@ -0,0 +1,85 @@
+import unittest
+
+from footy.domain.Team import Team
+from footy.domain.TeamStore import COLUMNS, TeamStore, TeamView
+
+
+class TestTeamStore(unittest.TestCase):
+
+    def team_store_under_test_producer(self):
+        store = TeamStore(capacity=1)
+        store.add_team(Team('Arsenal', 64, 36, 18, 19, 69))
+        store.add_team(Team('Stoke', 37, 51, 19, 18, 45))
+        return store
+
+    def test_add_team_grows_and_indexes_rows(self):
+        store = self.team_store_under_test_producer()
+        self.assertEqual(2, len(store))
+        self.assertTrue('Stoke' in store)
+        self.assertEqual(1, store.row('Stoke'))
+        self.assertEqual(['Arsenal', 'Stoke'], store.team_names())
+        self.assertEqual([64, 37], list(store.column('goals_for')))
+
+    def test_totals_follow_updated_teams(self):
+        store = self.team_store_under_test_producer()
+        self.assertEqual(101, store.total('goals_for'))
+
+        store.add_team(Team('Arsenal', 70, 36, 18, 19, 69))
+        self.assertEqual(2, len(store))
+        self.assertEqual(107, store.total('goals_for'))
+        self.assertEqual(87, store.total('goals_against'))
+
+    def test_incomplete_teams_are_counted(self):
+        store = TeamStore()
+        store.add_team(Team('Arsenal'))
+        store.add_team(Team('Stoke', 1, 0, 1, 0, 3))
+        self.assertEqual(2, store.incomplete_teams())
+
+        store.add_team(Team('Stoke', 1, 0, 1, 1, 3))
+        self.assertEqual(1, store.incomplete_teams())
+
+        store.view('Arsenal').home_games(1)
+        self.assertEqual(1, store.incomplete_teams())
+        store.view('Arsenal').away_games(1)
+        self.assertEqual(0, store.incomplete_teams())
+
+        store.view('Stoke').away_games(0)
+        self.assertEqual(1, store.incomplete_teams())
+
+    def test_from_columns_matches_added_teams(self):
+        store = self.team_store_under_test_producer()
+        restored = TeamStore.from_columns(store.team_names(), {column: store.column(column) for column in COLUMNS})
+        self.assertEqual(store.team_names(), restored.team_names())
+        self.assertEqual(1, restored.row('Stoke'))
+
+        for column in COLUMNS:
+            self.assertEqual(list(store.column(column)), list(restored.column(column)))
+            self.assertEqual(store.total(column), restored.total(column))
+
+        self.assertEqual(0, restored.incomplete_teams())
+        restored.add_team(Team('Hull'))
+        self.assertEqual(1, restored.incomplete_teams())
+
+        with self.assertRaises(ValueError):
+            TeamStore.from_columns(['Arsenal', 'Arsenal'], {column: [0, 0] for column in COLUMNS})
+
+    def test_view_reads_and_writes_the_store(self):
+        store = self.team_store_under_test_producer()
+        view = store.view('Arsenal')
+        self.assertIsInstance(view, TeamView)
+        self.assertEqual(Team('Arsenal', 64, 36, 18, 19, 69), view)
+        self.assertEqual(28, view.goal_difference())
+
+        view.goals_for(view.goals_for() + 10)
+        self.assertEqual(74, store.column('goals_for')[0])
+        self.assertEqual(111, store.total('goals_for'))
+
+    def test_unknown_team_raises_key_error(self):
+        store = self.team_store_under_test_producer()
+
+        with self.assertRaises(KeyError):
+            store.row('Hull')
+
+
+if __name__ == '__main__':
+    unittest.main()
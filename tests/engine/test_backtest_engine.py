@@ -0,0 +1,125 @@
+import unittest
+
+import numpy as np
+
+from footy import Footy
+from footy.domain.Competition import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+from footy.engine.BacktestEngine import BacktestEngine
+from footy.engine.UpdateEngine import UpdateEngine
+
+SCHEDULE = [
+    ('2020-09-12', [('Arsenal', 'Stoke', 2, 1), ('Chelsea', 'Wigan', 3, 0)]),
+    ('2020-09-19', [('Stoke', 'Chelsea', 0, 0), ('Wigan', 'Arsenal', 1, 2)]),
+    ('2020-09-26', [('Arsenal', 'Chelsea', 1, 1), ('Stoke', 'Wigan', 2, 2)]),
+    ('2020-10-03', [('Chelsea', 'Arsenal', 2, 0), ('Wigan', 'Stoke', 0, 1)]),
+    ('2021-08-14', [('Stoke', 'Arsenal', 1, 0), ('Wigan', 'Chelsea', 1, 1)]),
+    ('2021-08-21', [('Arsenal', 'Wigan', 4, 0), ('Chelsea', 'Stoke', 2, 2)]),
+    ('2021-08-28', [('Arsenal', 'Stoke', 0, 0), ('Chelsea', 'Wigan', 1, 0)])
+]
+
+CALENDAR_YEAR_SCHEDULE = [
+    ('2021-05-29', [('Flamengo', 'Santos', 2, 0), ('Palmeiras', 'Gremio', 1, 1)]),
+    ('2021-06-05', [('Santos', 'Palmeiras', 0, 1), ('Gremio', 'Flamengo', 2, 2)]),
+    ('2021-06-26', [('Flamengo', 'Palmeiras', 1, 0), ('Santos', 'Gremio', 3, 1)]),
+    ('2021-07-03', [('Palmeiras', 'Flamengo', 2, 1), ('Gremio', 'Santos', 0, 0)]),
+    ('2021-07-10', [('Santos', 'Flamengo', 1, 2), ('Gremio', 'Palmeiras', 0, 3)])
+]
+
+
+class TestBacktestEngine(unittest.TestCase):
+
+    def competition_under_test_producer(self, code='PL', schedule=SCHEDULE):
+        competition = Competition(code, code)
+
+        for day, results in schedule:
+            for home_team_name, away_team_name, home_goals, away_goals in results:
+                for team_name in (home_team_name, away_team_name):
+                    competition.add_team(Team(team_name))
+
+                competition.add_fixture(Fixture(competition.get_team(home_team_name),
+                                                competition.get_team(away_team_name), 'FINISHED',
+                                                f'{day}T15:00:00Z', Result('FINISHED', home_goals, away_goals)))
+
+        # Fixtures that have not finished are not replayed.
+        competition.add_fixture(Fixture(competition.teams[0], competition.teams[1], utc_start='2021-09-04T15:00:00Z'))
+        return competition
+
+    def test_fixtures_are_predicted_from_the_table_before_their_matchday(self):
+        backtest = BacktestEngine().backtest(self.competition_under_test_producer())
+        df = backtest['fixtures']
+
+        # Every team has played at home and away after the second matchday of each season.
+        self.assertEqual(['2020-09-26', '2020-10-03', '2021-08-28'], sorted(set(df['matchday'])))
+        self.assertEqual([2020, 2020, 2020, 2020, 2021, 2021], df['season'].tolist())
+
+        for matchday, season in (('2020-10-03', 2020), ('2021-08-28', 2021)):
+            # Rebuild the table from every earlier result of the season.
+            table = Competition('PL', 'PL')
+            earlier = [(home, away, home_goals, away_goals) for day, results in SCHEDULE
+                       if day.startswith(str(season) + '-') and day < matchday
+                       for home, away, home_goals, away_goals in results]
+
+            for home, away, _, _ in earlier:
+                table.add_team(Team(home))
+                table.add_team(Team(away))
+
+            UpdateEngine().apply_results(table, [
+                Fixture(table.get_team(home), table.get_team(away), 'FINISHED', f'{index}',
+                        Result('FINISHED', home_goals, away_goals))
+                for index, (home, away, home_goals, away_goals) in enumerate(earlier)
+            ])
+            footy = Footy.from_competition(table)
+
+            for _, row in df[df['matchday'] == matchday].iterrows():
+                fixture = footy.fixture(footy.get_team(row['home_team']), footy.get_team(row['away_team']))
+                self.assertEqual(fixture.outcome_probabilities(), [row['home_win'], row['draw'], row['away_win']])
+                outcome = [int(row['home_goals'] > row['away_goals']), int(row['home_goals'] == row['away_goals']),
+                           int(row['home_goals'] < row['away_goals'])]
+                self.assertEqual(footy.brier_score(np.array(outcome), np.array(fixture.outcome_probabilities())),
+                                 round(row['brier_score'], 2))
+
+    def test_brier_scores_are_aggregated(self):
+        backtest = BacktestEngine().backtest(self.competition_under_test_producer())
+        scores = backtest['fixtures']['brier_score']
+        self.assertEqual([4, 2], backtest['seasons']['count'].tolist())
+        self.assertAlmostEqual(scores.sum(), backtest['seasons']['total'].sum())
+        self.assertEqual([2, 2, 2], backtest['matchdays']['count'].tolist())
+        self.assertEqual(['PL'], backtest['competitions'].index.tolist())
+        self.assertEqual(['Arsenal', 'Chelsea', 'Stoke', 'Wigan'], backtest['teams'].index.tolist())
+        self.assertEqual(12, backtest['teams']['count'].sum())
+        arsenal = backtest['fixtures'][(backtest['fixtures'][['home_team', 'away_team']] == 'Arsenal').any(axis=1)]
+        self.assertAlmostEqual(arsenal['brier_score'].mean(), backtest['teams'].loc['Arsenal', 'mean'])
+
+    def test_competitions_can_be_replayed_in_processes(self):
+        competitions = [self.competition_under_test_producer('PL'), self.competition_under_test_producer('BL1')]
+        serial = BacktestEngine().backtest(competitions)
+        parallel = BacktestEngine(workers=2).backtest(competitions)
+        self.assertTrue(serial['fixtures'].equals(parallel['fixtures']))
+        self.assertEqual(['BL1', 'PL'], parallel['competitions'].index.tolist())
+        self.assertEqual([6, 6], parallel['competitions']['count'].tolist())
+
+    def test_seasons_of_calendar_year_competitions_are_not_split_in_july(self):
+        backtest = BacktestEngine().backtest(self.competition_under_test_producer('BSA', CALENDAR_YEAR_SCHEDULE))
+        self.assertEqual([2021] * 6, backtest['fixtures']['season'].tolist())
+        self.assertEqual(['2021-06-26', '2021-07-03', '2021-07-10'], backtest['matchdays'].index.tolist())
+
+        # The same results in a competition whose seasons start in July are split into two seasons.
+        backtest = BacktestEngine().backtest(self.competition_under_test_producer('PL', CALENDAR_YEAR_SCHEDULE))
+        self.assertEqual([2020, 2020], backtest['fixtures']['season'].tolist())
+
+        backtest = BacktestEngine(season_start_months={'PL': 1}).backtest(
+            self.competition_under_test_producer('PL', CALENDAR_YEAR_SCHEDULE)
+        )
+        self.assertEqual([2021] * 6, backtest['fixtures']['season'].tolist())
+
+    def test_competition_without_enough_results_is_not_scored(self):
+        competition = Competition('PL', 'PL', [Team('Arsenal'), Team('Stoke')])
+        self.assertEqual(0, len(BacktestEngine().backtest(competition)['fixtures']))
+        self.assertEqual(0, len(BacktestEngine().backtest([])['seasons']))
+
+
+if __name__ == '__main__':
+    unittest.main()
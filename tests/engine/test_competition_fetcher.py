@@ -0,0 +1,120 @@
+import threading
+import time
+import unittest
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from footy.engine.CompetitionFetcher import CompetitionFetcher
+from footy.engine.TableSource import TableSource
+from footy.engine.UpdateEngine import UpdateEngine
+
+
+def table_page(team_name, points):
+    return (f'<table><tr><th>Team</th><th>P</th><th>F</th><th>A</th><th>Pts</th></tr>'
+            f'<tr><td>{team_name}</td><td>10</td><td>20</td><td>5</td><td>{points}</td></tr></table>')
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.most_active = max(server.most_active, server.active)
+            statuses = server.statuses.get(self.path, [])
+            status = statuses.pop(0) if statuses else 200
+
+        time.sleep(server.delay)
+        body = server.pages.get(self.path, '').encode() if status == 200 else b''
+
+        with server.lock:
+            server.active -= 1
+
+        self.send_response(status if self.path in server.pages else 404)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestCompetitionFetcher(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.active = 0
+        self.server.most_active = 0
+        self.server.delay = 0.0
+        self.server.statuses = {}
+        self.server.pages = {f'/{code}': table_page(f'Team {code}', points)
+                             for points, code in enumerate(['PL', 'BL1', 'SA', 'PD'])}
+        threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True).start()
+        host, port = self.server.server_address
+        self.source = TableSource({'competitions': {
+            code: {'bbc_table_site': f'http://{host}:{port}/{code}', 'competition_name': code}
+            for code in ['PL', 'BL1', 'SA', 'PD', 'FL1']
+        }})
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_fetch_all_fetches_every_competition_concurrently(self):
+        self.server.delay = 0.2
+
+        with CompetitionFetcher(self.source, max_workers=4) as fetcher:
+            competitions = fetcher.fetch_all(['PL', 'BL1', 'SA', 'PD'])
+
+        self.assertEqual(['PL', 'BL1', 'SA', 'PD'], list(competitions))
+        self.assertEqual(2, competitions['SA'].get_team('Team SA').points())
+        self.assertGreater(self.server.most_active, 1)
+
+    def test_requests_to_a_host_are_limited(self):
+        self.server.delay = 0.05
+
+        with CompetitionFetcher(self.source, max_workers=4, max_per_host=1) as fetcher:
+            fetcher.fetch_all(['PL', 'BL1', 'SA', 'PD'])
+
+        self.assertEqual(1, self.server.most_active)
+
+    def test_failed_requests_are_retried(self):
+        self.server.statuses['/PL'] = [503, 502]
+
+        with CompetitionFetcher(self.source, retries=2, backoff_factor=0) as fetcher:
+            self.assertEqual(0, fetcher.fetch('PL').get_team('Team PL').points())
+
+        self.assertEqual(['/PL'] * 3, self.server.requests)
+
+    def test_errors_are_raised_after_retries(self):
+        self.server.statuses['/PL'] = [503, 503]
+
+        with CompetitionFetcher(self.source, retries=1, backoff_factor=0) as fetcher:
+            with self.assertRaises(requests.HTTPError):
+                fetcher.fetch('PL')
+
+            with self.assertRaises(requests.HTTPError):
+                fetcher.fetch_all()
+
+    def test_slow_hosts_time_out(self):
+        self.server.delay = 1.0
+
+        with CompetitionFetcher(self.source, timeout=0.1, retries=0) as fetcher:
+            with self.assertRaises(requests.RequestException):
+                fetcher.fetch('PL')
+
+    def test_update_engine_gets_competitions_from_fetcher(self):
+        engine = UpdateEngine(CompetitionFetcher(self.source))
+        self.assertEqual('BL1', engine.get_competition('BL1').code())
+        self.assertEqual(['PL', 'PD'], list(engine.get_competitions(['PL', 'PD'])))
+
+
+if __name__ == '__main__':
+    unittest.main()
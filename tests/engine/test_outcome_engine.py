@@ -0,0 +1,75 @@
+import numpy as np
+import unittest
+
+from footy.engine.OutcomeEngine import OutcomeEngine
+
+
+class TestOutcomeEngine(unittest.TestCase):
+
+    def test_predict_returns_expected_shapes(self):
+        prediction = OutcomeEngine().predict([2.1, 0.6, 1.2], [0.56, 2.12, 1.2])
+        self.assertEqual((3,), prediction['home_expected_goals'].shape)
+        self.assertEqual((3,), prediction['away_expected_goals'].shape)
+        self.assertEqual((3, 7), prediction['home_team_goals_probability'].shape)
+        self.assertEqual((3, 7), prediction['away_team_goals_probability'].shape)
+        self.assertEqual((3, 7, 7), prediction['final_score_probabilities'].shape)
+        self.assertEqual((3, 3), prediction['outcome_probabilities'].shape)
+
+    def test_predict_matches_single_fixture_calculation(self):
+        engine = OutcomeEngine()
+        batch = engine.predict([2.1, 0.6], [0.56, 2.12])
+
+        for index, (home, away) in enumerate([(2.1, 0.56), (0.6, 2.12)]):
+            single = engine.predict(home, away)
+            np.testing.assert_array_equal(single['outcome_probabilities'][0], batch['outcome_probabilities'][index])
+            np.testing.assert_array_equal(single['final_score_probabilities'][0],
+                                          batch['final_score_probabilities'][index])
+
+    def test_equal_teams_have_symmetric_outcomes(self):
+        prediction = OutcomeEngine().predict([1.4], [1.4])
+        home_win, draw, away_win = prediction['outcome_probabilities'][0]
+        self.assertEqual(home_win, away_win)
+        self.assertGreater(draw, 0.0)
+
+    def test_closed_form_outcomes_sum_to_one(self):
+        engine = OutcomeEngine(closed_form=True, decimals=None)
+        prediction = engine.predict([2.1, 0.0, 4.5], [0.56, 1.2, 0.0])
+        np.testing.assert_allclose(prediction['outcome_probabilities'].sum(axis=1), 1.0)
+        np.testing.assert_allclose(prediction['outcome_probabilities'][1], [0.0, np.exp(-1.2), 1.0 - np.exp(-1.2)],
+                                   atol=1e-9)
+
+    def test_closed_form_agrees_with_large_score_matrix(self):
+        closed_form = OutcomeEngine(closed_form=True, decimals=None).predict([2.1], [0.56])
+        summed = OutcomeEngine(max_goals=40, decimals=None).predict([2.1], [0.56])
+        np.testing.assert_allclose(closed_form['outcome_probabilities'], summed['outcome_probabilities'], atol=1e-9)
+
+    def test_tail_mass_is_held_in_final_bucket(self):
+        prediction = OutcomeEngine(max_goals=3, tail_mass=True, decimals=None).predict([2.1], [0.56])
+        self.assertEqual((1, 5), prediction['home_team_goals_probability'].shape)
+        self.assertEqual((1, 5, 5), prediction['final_score_probabilities'].shape)
+        self.assertAlmostEqual(prediction['home_tail_mass'][0], prediction['home_team_goals_probability'][0, -1])
+        self.assertAlmostEqual(1.0, prediction['final_score_probabilities'].sum())
+
+    def test_tail_mass_of_both_teams_is_split_between_outcomes(self):
+        engine = OutcomeEngine(max_goals=1, tail_mass=True, decimals=None)
+        prediction = engine.predict([2.5, 2.1], [2.5, 0.56])
+        closed_form = OutcomeEngine(closed_form=True, decimals=None).predict([2.5, 2.1], [2.5, 0.56])
+
+        # Every final score is counted in exactly one outcome, so the outcomes match the Skellam distribution.
+        np.testing.assert_allclose(prediction['outcome_probabilities'], closed_form['outcome_probabilities'],
+                                   atol=1e-12)
+        tail_outcomes = engine.tail_outcome_probabilities([2.5], [2.5])[0]
+        np.testing.assert_allclose(tail_outcomes.sum(), 1.0)
+        self.assertAlmostEqual(tail_outcomes[0], tail_outcomes[2])
+        self.assertLess(tail_outcomes[1], 0.5)
+
+    def test_default_settings_lose_tail_mass(self):
+        prediction = OutcomeEngine().predict([4.5], [3.5])
+        self.assertLess(prediction['outcome_probabilities'].sum(), 0.95)
+        self.assertGreater(prediction['home_tail_mass'][0], 0.0)
+        self.assertEqual({'max_goals': 6, 'tail_mass': False, 'decimals': 4, 'closed_form': False},
+                         OutcomeEngine().settings())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import numpy as np
+import unittest
+
+from scipy.stats import poisson
+
+from footy.engine.OutcomeEngine import OutcomeEngine
+from footy.engine.PoissonCache import PoissonCache
+
+
+class TestPoissonCache(unittest.TestCase):
+
+    def test_probability_mass_matches_poisson(self):
+        cache = PoissonCache()
+        probability_mass = cache.probability_mass([2.1, 0.56], max_goals=6)
+        np.testing.assert_array_equal(poisson.pmf(np.arange(7), 2.1), probability_mass[0, :-1])
+        np.testing.assert_array_equal(poisson.pmf(np.arange(7), 0.56), probability_mass[1, :-1])
+        self.assertAlmostEqual(poisson.sf(6, 2.1), probability_mass[0, -1])
+
+    def test_hits_and_misses_are_counted(self):
+        cache = PoissonCache()
+        cache.probability_mass([2.1, 0.56, 2.1], max_goals=6)
+        self.assertEqual({'hits': 1, 'misses': 2, 'size': 2, 'max_size': 4096}, cache.stats())
+
+        cache.probability_mass([0.56], max_goals=6)
+        cache.probability_mass([0.56], max_goals=10)
+        self.assertEqual({'hits': 2, 'misses': 3, 'size': 3, 'max_size': 4096}, cache.stats())
+
+        cache.clear()
+        self.assertEqual({'hits': 0, 'misses': 0, 'size': 0, 'max_size': 4096}, cache.stats())
+
+    def test_least_recently_used_values_are_evicted(self):
+        cache = PoissonCache(max_size=2)
+        cache.probability_mass([1.0, 2.0], max_goals=6)
+        cache.probability_mass([1.0], max_goals=6)
+        cache.probability_mass([3.0], max_goals=6)
+        self.assertEqual(2, cache.stats()['size'])
+
+        cache.probability_mass([1.0], max_goals=6)
+        self.assertEqual(3, cache.stats()['misses'])
+        cache.probability_mass([2.0], max_goals=6)
+        self.assertEqual(4, cache.stats()['misses'])
+
+    def test_outcome_engine_reads_from_its_cache(self):
+        cache = PoissonCache()
+        engine = OutcomeEngine(cache=cache)
+        self.assertIs(cache, engine.cache())
+
+        engine.predict([2.1, 2.1], [0.56, 0.56])
+        self.assertEqual(2, cache.stats()['misses'])
+        engine.predict([2.1], [0.56])
+        self.assertEqual(2, cache.stats()['misses'])
+        self.assertEqual(4, cache.stats()['hits'])
+
+
+if __name__ == '__main__':
+    unittest.main()
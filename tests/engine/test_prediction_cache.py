@@ -0,0 +1,89 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import numpy as np
+
+from footy.engine.PredictionCache import PredictionCache
+
+
+class TestPredictionCache(unittest.TestCase):
+
+    SETTINGS = {'max_goals': 1, 'tail_mass': False, 'decimals': 4, 'closed_form': False}
+
+    def prediction_producer(self, expected_goals):
+        return (expected_goals, 1.0, [0.5, 0.3, 0.2], [0.4, 0.6], [0.7, 0.3], np.array([[0.28, 0.12], [0.42, 0.18]]))
+
+    def test_key_depends_on_inputs_and_settings(self):
+        key = PredictionCache.key([64, 36, 37, 51, 46, 46, 1.36, 1.06], self.SETTINGS)
+        self.assertEqual(64, len(key))
+        self.assertEqual(key, PredictionCache.key([64.0, 36, 37, 51, 46, 46, 1.36, 1.06], dict(self.SETTINGS)))
+        self.assertNotEqual(key, PredictionCache.key([64, 36, 37, 51, 46, 46, 1.36, 1.07], self.SETTINGS))
+        self.assertNotEqual(key, PredictionCache.key([64, 36, 37, 51, 46, 46, 1.36, 1.06],
+                                                     dict(self.SETTINGS, tail_mass=True)))
+
+    def test_predictions_persist_across_connections(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'predictions.sqlite')
+
+            with PredictionCache(path) as cache:
+                cache.put_many({'a': self.prediction_producer(2.1)})
+
+            with PredictionCache(path) as cache:
+                found = cache.get_many(['a', 'b'])
+                self.assertEqual({'hits': 1, 'misses': 1, 'size': 1, 'max_entries': 100000}, cache.stats())
+
+        home_expected_goals, away_expected_goals, outcome, home_goals, away_goals, final_score = found['a']
+        self.assertEqual((2.1, 1.0), (home_expected_goals, away_expected_goals))
+        np.testing.assert_array_equal([0.5, 0.3, 0.2], outcome)
+        np.testing.assert_array_equal([0.7, 0.3], away_goals)
+        np.testing.assert_array_equal([[0.28, 0.12], [0.42, 0.18]], final_score)
+
+    def test_least_recently_used_predictions_are_evicted(self):
+        cache = PredictionCache(max_entries=2)
+        cache.put_many({'a': self.prediction_producer(1.0), 'b': self.prediction_producer(2.0)})
+        cache.get_many(['a'])
+        cache.put_many({'c': self.prediction_producer(3.0)})
+        self.assertEqual(['a', 'c'], sorted(cache.get_many(['a', 'b', 'c'])))
+        self.assertEqual(2, cache.stats()['size'])
+
+    def test_size_counts_replaced_predictions_once(self):
+        cache = PredictionCache(max_entries=3)
+        cache.put_many({'a': self.prediction_producer(1.0), 'b': self.prediction_producer(2.0)})
+        cache.put_many({'b': self.prediction_producer(2.5), 'c': self.prediction_producer(3.0)})
+        self.assertEqual(3, cache.stats()['size'])
+        self.assertEqual(2.5, cache.get_many(['b'])['b'][0])
+
+        # Nothing found, so the order of use is unchanged and 'a' is still the least recently used.
+        self.assertEqual({}, cache.get_many(['x']))
+        cache.put_many({'d': self.prediction_producer(4.0)})
+        self.assertEqual(['b', 'c', 'd'], sorted(cache.get_many(['a', 'b', 'c', 'd'])))
+        self.assertEqual(3, cache.stats()['size'])
+
+    def test_corrupt_predictions_are_found_and_removed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'predictions.sqlite')
+            cache = PredictionCache(path)
+            cache.put_many({'a': self.prediction_producer(1.0), 'b': self.prediction_producer(2.0),
+                            'c': self.prediction_producer(3.0)})
+
+            connection = sqlite3.connect(path)
+            connection.execute('UPDATE predictions SET home_expected_goals = 9.9 WHERE key = ?', ('a',))
+            connection.execute('UPDATE predictions SET outcome_probabilities = ? WHERE key = ?',
+                               (np.array([1.0, 0.0, 0.0]).tobytes(), 'b'))
+            connection.commit()
+            connection.close()
+
+            self.assertEqual(['a', 'b'], sorted(cache.check(remove=False)))
+            self.assertEqual(['c'], list(cache.get_many(['a', 'c'])))
+            self.assertEqual(['b'], cache.check())
+            self.assertEqual([], cache.check())
+            self.assertEqual(1, cache.stats()['size'])
+            cache.clear()
+            self.assertEqual({'hits': 0, 'misses': 0, 'size': 0, 'max_entries': 100000}, cache.stats())
+            cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
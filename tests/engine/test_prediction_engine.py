@@ -0,0 +1,165 @@
+import os
+import tempfile
+import unittest
+
+from footy import Footy
+from footy.domain.Competition import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+from footy.engine.OutcomeEngine import OutcomeEngine
+from footy.engine.PredictionCache import PredictionCache
+from footy.engine.PredictionEngine import PredictionEngine
+
+
+class TestPredictionEngine(unittest.TestCase):
+
+    def competition_under_test_producer(self, code='PL', finished=True):
+        teams = [
+            Team('Arsenal', 64, 36, 19, 18, 72),
+            Team('Chelsea', 65, 22, 18, 19, 80),
+            Team('Stoke', 37, 51, 19, 18, 45),
+            Team('Wigan', 33, 45, 18, 19, 42)
+        ]
+        competition = Competition(code, code, teams)
+        status = 'FINISHED' if finished else 'SCHEDULED'
+        competition.add_fixture(Fixture(teams[0], teams[2], status, '2021-05-01T15:00:00Z',
+                                        Result(status, 2, 1)))
+        competition.add_fixture(Fixture(teams[3], teams[1], status, '2021-05-01T15:00:00Z',
+                                        Result(status, 0, 1)))
+        competition.add_fixture(Fixture(teams[1], teams[0], utc_start='2021-05-08T15:00:00Z'))
+        competition.add_fixture(Fixture(teams[2], teams[3], utc_start='2021-05-08T15:00:00Z'))
+        return competition
+
+    def test_predict_results_populates_scheduled_fixtures(self):
+        competition = self.competition_under_test_producer()
+        self.assertIs(competition, PredictionEngine(competition).predict_results())
+
+        footy = Footy.from_competition(competition)
+        finished, _, scheduled, _ = competition.fixtures
+        self.assertIsNone(finished.outcome_probabilities())
+        expected = footy.fixture(scheduled.home_team, scheduled.away_team)
+        self.assertEqual(expected.outcome_probabilities(), scheduled.outcome_probabilities())
+        self.assertEqual(expected.home_team_goals_probability(), scheduled.home_team_goals_probability())
+        self.assertTrue(expected.final_score_probabilities().equals(scheduled.final_score_probabilities()))
+
+    def test_parallel_predictions_match_serial_predictions(self):
+        serial = [self.competition_under_test_producer(code) for code in ['PL', 'BL1', 'SA']]
+        parallel = [self.competition_under_test_producer(code) for code in ['PL', 'BL1', 'SA']]
+        serial[1].get_team('Stoke').goals_for(50)
+        parallel[1].get_team('Stoke').goals_for(50)
+        engine = PredictionEngine(outcome_engine=OutcomeEngine(tail_mass=True))
+        self.assertIs(serial, engine.predict_results(serial))
+        self.assertIs(parallel, engine.predict_results(parallel, workers=2))
+
+        for serial_competition, parallel_competition in zip(serial, parallel):
+            for serial_fixture, parallel_fixture in zip(serial_competition.fixtures, parallel_competition.fixtures):
+                self.assertEqual(serial_fixture.outcome_probabilities(), parallel_fixture.outcome_probabilities())
+                self.assertEqual(serial_fixture.away_team_goals_probability(),
+                                 parallel_fixture.away_team_goals_probability())
+
+        self.assertNotEqual(serial[0].fixtures[3].outcome_probabilities(),
+                            serial[1].fixtures[3].outcome_probabilities())
+        self.assertTrue(parallel[0].fixtures[3].final_score_tail_mass())
+
+    def test_competitions_without_finished_fixtures_are_not_predicted(self):
+        competition = self.competition_under_test_producer(finished=False)
+        PredictionEngine(workers=2).predict_results([competition])
+        self.assertEqual([None] * 4, [fixture.outcome_probabilities() for fixture in competition.fixtures])
+
+    def test_only_fixtures_with_changed_inputs_are_predicted_again(self):
+        competition = self.competition_under_test_producer()
+        teams = competition.teams
+        competition.add_fixture(Fixture(teams[0], teams[3], utc_start='2021-05-15T15:00:00Z'))
+        engine = PredictionEngine(competition)
+        engine.predict_results()
+        self.assertEqual({'predicted': 3, 'reused': 0, 'cached': 0}, engine.stats())
+
+        engine.predict_results()
+        self.assertEqual({'predicted': 3, 'reused': 3, 'cached': 0}, engine.stats())
+
+        # One more goal for Stoke leaves the league average unchanged, so only the Stoke fixture is predicted again.
+        before = [fixture.outcome_probabilities() for fixture in competition.fixtures]
+        competition.get_team('Stoke').goals_for(38)
+        engine.predict_results()
+        after = [fixture.outcome_probabilities() for fixture in competition.fixtures]
+        self.assertEqual({'predicted': 4, 'reused': 5, 'cached': 0}, engine.stats())
+        self.assertEqual(Footy.from_competition(competition).fixture(teams[2], teams[3]).outcome_probabilities(),
+                         after[3])
+        self.assertNotEqual(before[3], after[3])
+        self.assertEqual(before[2], after[2])
+        self.assertEqual(before[4], after[4])
+
+    def test_competitions_with_the_same_code_are_tracked_apart(self):
+        first = self.competition_under_test_producer()
+        second = self.competition_under_test_producer()
+        second.name = 'Premier League 2'
+        engine = PredictionEngine([first, second])
+        engine.predict_results()
+        engine.predict_results()
+        self.assertEqual({'predicted': 4, 'reused': 4, 'cached': 0}, engine.stats())
+
+        second.name = first.name
+
+        with self.assertRaises(ValueError):
+            engine.predict_results()
+
+    def test_predictions_within_tolerance_are_kept(self):
+        competition = self.competition_under_test_producer()
+        engine = PredictionEngine(competition, tolerance=1.0)
+        engine.predict_results()
+        before = competition.fixtures[3].outcome_probabilities()
+        competition.get_team('Stoke').goals_for(45)
+        engine.predict_results()
+        self.assertEqual({'predicted': 2, 'reused': 2, 'cached': 0}, engine.stats())
+        self.assertEqual(before, competition.fixtures[3].outcome_probabilities())
+
+        engine.clear()
+        engine.predict_results()
+        self.assertEqual({'predicted': 4, 'reused': 2, 'cached': 0}, engine.stats())
+        self.assertNotEqual(before, competition.fixtures[3].outcome_probabilities())
+
+    def test_kept_predictions_are_copied_to_new_fixture_objects(self):
+        competition = self.competition_under_test_producer()
+        engine = PredictionEngine()
+        engine.predict_results(competition)
+        predicted = competition.fixtures[2]
+        teams = competition.teams
+        refreshed = Competition('PL', 'PL', teams, fixtures=[
+            Fixture(teams[1], teams[0], utc_start='2021-05-08T15:00:00Z')
+        ] + competition.fixtures[:2])
+        engine.predict_results(refreshed)
+        self.assertEqual({'predicted': 2, 'reused': 1, 'cached': 0}, engine.stats())
+        self.assertEqual(predicted.outcome_probabilities(), refreshed.fixtures[0].outcome_probabilities())
+
+    def test_restarted_engine_reads_predictions_from_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'predictions.sqlite')
+            competition = self.competition_under_test_producer()
+
+            with PredictionCache(path) as cache:
+                PredictionEngine(competition, cache=cache).predict_results()
+
+            restarted = self.competition_under_test_producer()
+
+            with PredictionCache(path) as cache:
+                engine = PredictionEngine(restarted, cache=cache)
+                engine.predict_results()
+                self.assertEqual({'predicted': 0, 'reused': 0, 'cached': 2}, engine.stats())
+
+                restarted.get_team('Stoke').goals_for(38)
+                engine.predict_results()
+                self.assertEqual({'predicted': 1, 'reused': 1, 'cached': 2}, engine.stats())
+
+        for fixture, restarted_fixture in zip(competition.fixtures[:3], restarted.fixtures[:3]):
+            self.assertEqual(fixture.outcome_probabilities(), restarted_fixture.outcome_probabilities())
+            self.assertEqual(fixture.home_team_goals_probability(), restarted_fixture.home_team_goals_probability())
+            self.assertEqual(fixture.final_score_probabilities() is None,
+                             restarted_fixture.final_score_probabilities() is None)
+
+        self.assertTrue(competition.fixtures[2].final_score_probabilities().equals(
+            restarted.fixtures[2].final_score_probabilities()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from footy.domain.Fixture import Fixture
+from footy.domain.Team import Team
+from footy.engine.ResultsLoader import pq, ResultsLoader
+from footy.engine.UpdateEngine import UpdateEngine
+
+
+class TestResultsLoader(unittest.TestCase):
+
+    CONFIG = {'competitions': {'PL': {'competition_name': 'Premier League'}, 'BSA': {'competition_name': 'Série A'}}}
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.main_path = os.path.join(self.directory.name, 'E0.csv')
+        self.extra_path = os.path.join(self.directory.name, 'BRA.csv')
+
+        with open(self.main_path, 'w', encoding='latin-1') as f:
+            f.write('Div,Date,Time,HomeTeam,AwayTeam,FTHG,FTAG,FTR,B365H\n'
+                    'E0,12/09/2020,12:30,Fulham,Arsenal,0,3,A,3.5\n'
+                    'E0,19/09/20,17:30,Arsenal,West Ham,2,1,H,1.6\n'
+                    'E0,26/09/2020,,West Ham,Fulham,,,,2.1\n'
+                    'D1,18/09/2020,19:30,Bayern Munich,Schalke 04,8,0,H,1.1\n'
+                    ',,,,,,,,\n')
+
+        with open(self.extra_path, 'w', encoding='latin-1') as f:
+            f.write('Country,League,Season,Date,Time,Home,Away,HG,AG,Res\n'
+                    'Brazil,Serie A,2020,08/08/2020,19:00,Fortaleza,Athletico-PR,0,2,A\n'
+                    'Brazil,Serie A,2020,09/08/2020,16:00,Grêmio,Fluminense,1,0,H\n')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_streams_results_into_configured_competitions(self):
+        loader = ResultsLoader(UpdateEngine(), self.CONFIG, chunk_size=2)
+        competitions = loader.load(self.main_path)
+        self.assertEqual(['PL'], list(competitions))
+
+        competition = competitions['PL']
+        self.assertEqual('Premier League', competition.name)
+        self.assertEqual(['Fulham', 'Arsenal', 'West Ham'], [team.team_name() for team in competition.teams])
+        arsenal = competition.get_team('Arsenal')
+        self.assertEqual((5, 1, 1, 1, 6), (arsenal.goals_for(), arsenal.goals_against(), arsenal.home_games(),
+                                           arsenal.away_games(), arsenal.points()))
+        # Kickoffs are UK local times, so a kickoff during British Summer Time is an hour earlier in UTC.
+        self.assertEqual('FINISHED', competition.get_fixture('Arsenal', 'West Ham', '2020-09-19T16:30:00Z').status)
+        self.assertEqual('SCHEDULED', competition.get_fixture('West Ham', 'Fulham', '2020-09-26T00:00:00Z').status)
+
+        # Loading the same file again does not count the results twice.
+        loader.load([self.main_path])
+        self.assertEqual(6, competition.get_team('Arsenal').points())
+        self.assertEqual(3, len(competition.fixtures))
+
+    def test_load_extra_league_files_with_division(self):
+        loader = ResultsLoader(UpdateEngine(), self.CONFIG)
+
+        with self.assertRaises(ValueError):
+            loader.load(self.extra_path)
+
+        competition = loader.load(self.extra_path, division='BRA')['BSA']
+        self.assertEqual(3, competition.get_team('Grêmio').points())
+        self.assertTrue(competition.has_fixture(Fixture(Team('Fortaleza'), Team('Athletico-PR'),
+                                                        utc_start='2020-08-08T18:00:00Z')))
+        self.assertEqual(2, competition.get_team('Athletico-PR').goals_for())
+
+    def test_update_engine_loads_results(self):
+        competitions = UpdateEngine().load_results([self.main_path], self.CONFIG)
+        self.assertEqual(0, competitions['PL'].get_team('Fulham').points())
+
+    @unittest.skipIf(pq is None, 'pyarrow is not installed')
+    def test_load_parquet_files(self):
+        path = os.path.join(self.directory.name, 'E0.parquet')
+        pd.read_csv(self.main_path).to_parquet(path)
+        competition = ResultsLoader(UpdateEngine(), self.CONFIG).load(path)['PL']
+        self.assertEqual(6, competition.get_team('Arsenal').points())
+
+
+if __name__ == '__main__':
+    unittest.main()
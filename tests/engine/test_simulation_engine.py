@@ -0,0 +1,74 @@
+import numpy as np
+import unittest
+
+from footy import Footy
+from footy.domain.Competition import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+from footy.engine.SimulationEngine import SimulationEngine
+
+
+class TestSimulationEngine(unittest.TestCase):
+
+    def competition_under_test_producer(self):
+        teams = [
+            Team('Chelsea', 65, 22, 19, 18, 80),
+            Team('Liverpool', 74, 26, 18, 19, 83),
+            Team('Man United', 67, 24, 19, 18, 87),
+            Team('Stoke', 37, 51, 19, 18, 45)
+        ]
+        competition = Competition('PL', 'Premier League', teams)
+        competition.add_fixture(Fixture(teams[0], teams[3], 'FINISHED', result=Result('FINISHED', 2, 1)))
+        competition.add_fixture(Fixture(teams[2], teams[1], 'FINISHED', result=Result('FINISHED', 1, 1)))
+        competition.add_fixture(Fixture(teams[0], teams[1]))
+        competition.add_fixture(Fixture(teams[3], teams[2]))
+        return competition
+
+    def test_simulate_returns_position_distribution(self):
+        engine = SimulationEngine(self.competition_under_test_producer())
+        positions = engine.simulate(5000, seed=1)
+        self.assertEqual(['Chelsea', 'Liverpool', 'Man United', 'Stoke'], list(positions.index))
+        self.assertEqual([1, 2, 3, 4], list(positions.columns))
+        np.testing.assert_allclose(positions.sum(axis=1), 1.0)
+        np.testing.assert_allclose(positions.sum(axis=0), 1.0)
+
+        # Stoke are too far behind to climb off the bottom and Chelsea cannot reach the top.
+        self.assertEqual(1.0, positions.loc['Stoke', 4])
+        self.assertEqual(0.0, positions.loc['Chelsea', 1])
+
+    def test_seeded_simulation_is_reproducible_across_workers(self):
+        engine = SimulationEngine(self.competition_under_test_producer())
+        serial = engine.simulate(3000, seed=7, chunk_size=1000)
+        parallel = engine.simulate(3000, seed=7, workers=2, chunk_size=1000)
+        self.assertTrue(serial.equals(parallel))
+
+    def test_summary_reports_title_top_and_relegation(self):
+        engine = SimulationEngine(self.competition_under_test_producer())
+        summary = engine.summary(engine.simulate(2000, seed=3), top=2, relegated=1)
+        self.assertEqual('Stoke', summary.index[-1])
+        self.assertEqual(1.0, summary.loc['Stoke', 'relegated'])
+        self.assertAlmostEqual(1.0, summary['title'].sum())
+        self.assertAlmostEqual(2.0, summary['top'].sum())
+
+    def test_simulate_without_enough_data_raises_value_error(self):
+        competition = self.competition_under_test_producer()
+
+        # Without any finished fixtures, the average goals scored by home and away teams are not known.
+        engine = SimulationEngine(competition, Footy.from_competition(Competition('PL', teams=competition.teams)))
+
+        with self.assertRaises(ValueError):
+            engine.simulate(10)
+
+    def test_simulate_without_iterations_raises_value_error(self):
+        engine = SimulationEngine(self.competition_under_test_producer())
+
+        with self.assertRaises(ValueError):
+            engine.simulate(0)
+
+        with self.assertRaises(ValueError):
+            engine.simulate(10, chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from footy.engine.TableSource import TableSource
+
+PAGE = '''<html><body>
+<table><tr><th>Date</th><th>Fixture</th></tr><tr><td>Saturday</td><td>Arsenal v Stoke</td></tr></table>
+<table>
+<thead><tr><th>Position</th><th>Team</th><th>P</th><th>W</th><th>D</th><th>L</th><th>F</th><th>A</th><th>GD</th>
+<th>Pts</th></tr></thead>
+<tbody>
+<tr><td>1</td><td>Man United</td><td>38</td><td>28</td><td>6</td><td>4</td><td>68</td><td>24</td><td>44</td>
+<td>90</td></tr>
+<tr><td>2</td><td>Chelsea</td><td>37</td><td>25</td><td>10</td><td>2</td><td>65</td><td>22</td><td>43</td>
+<td>85</td></tr>
+</tbody>
+</table>
+</body></html>'''
+
+
+class TestTableSource(unittest.TestCase):
+
+    CONFIG = {'competitions': {
+        'PL': {'bbc_table_site': 'https://www.bbc.co.uk/sport/football/premier-league/table',
+               'competition_name': 'Premier League'},
+        'XX': {'competition_name': 'No Table'}
+    }}
+
+    def test_codes_and_urls_come_from_configuration(self):
+        source = TableSource(self.CONFIG)
+        self.assertEqual(['PL'], source.codes())
+        self.assertEqual('https://www.bbc.co.uk/sport/football/premier-league/table', source.url('PL'))
+
+        with self.assertRaises(KeyError):
+            source.url('XX')
+
+    def test_configured_competitions_have_table_pages(self):
+        source = TableSource('footy.yml')
+        self.assertEqual(9, len(source.codes()))
+
+    def test_parse_creates_competition_from_table(self):
+        competition = TableSource(self.CONFIG).parse('PL', PAGE)
+        self.assertEqual('PL', competition.code())
+        self.assertEqual('Premier League', competition.name)
+        chelsea = competition.get_team('Chelsea')
+        self.assertEqual((65, 22, 19, 18, 85), (chelsea.goals_for(), chelsea.goals_against(), chelsea.home_games(),
+                                                chelsea.away_games(), chelsea.points()))
+        self.assertEqual(['Man United', 'Chelsea'], [team.team_name() for team in competition.teams])
+
+    def test_parse_rejects_pages_without_a_table(self):
+        with self.assertRaises(ValueError):
+            TableSource(self.CONFIG).parse('PL', '<table><tr><th>Date</th></tr><tr><td>Today</td></tr></table>')
+
+
+if __name__ == '__main__':
+    unittest.main()
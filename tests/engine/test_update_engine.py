@@ -0,0 +1,83 @@
+import unittest
+
+from footy.domain.Competition import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
+from footy.domain.Team import Team
+from footy.engine.UpdateEngine import UpdateEngine
+
+
+class TestUpdateEngine(unittest.TestCase):
+
+    def competition_under_test_producer(self):
+        teams = [
+            Team('Arsenal', 64, 36, 19, 18, 72),
+            Team('Chelsea', 65, 22, 18, 19, 80),
+            Team('Stoke', 37, 51, 19, 18, 45)
+        ]
+        competition = Competition('PL', 'Premier League', teams)
+        competition.add_fixture(Fixture(teams[0], teams[1], utc_start='2021-05-01T15:00:00Z'))
+        competition.add_fixture(Fixture(teams[2], teams[0], utc_start='2021-05-08T15:00:00Z'))
+        return competition
+
+    def result_producer(self, home_team_name, away_team_name, utc_start, home_goals, away_goals, status='FINISHED'):
+        return Fixture(Team(home_team_name), Team(away_team_name), status, utc_start,
+                       Result(status, home_goals, away_goals))
+
+    def assertTeam(self, team, goals_for, goals_against, home_games, away_games, points):
+        self.assertEqual((goals_for, goals_against, home_games, away_games, points),
+                         (team.goals_for(), team.goals_against(), team.home_games(), team.away_games(), team.points()))
+
+    def test_apply_results_updates_teams_and_fixtures(self):
+        competition = self.competition_under_test_producer()
+        changed_teams = UpdateEngine().apply_results(competition, [
+            self.result_producer('Arsenal', 'Chelsea', '2021-05-01T15:00:00Z', 2, 1),
+            self.result_producer('Stoke', 'Arsenal', '2021-05-08T15:00:00Z', 0, 0, 'SCHEDULED')
+        ])
+        self.assertEqual({'Arsenal', 'Chelsea'}, changed_teams)
+        self.assertTeam(competition.get_team('Arsenal'), 66, 37, 20, 18, 75)
+        self.assertTeam(competition.get_team('Chelsea'), 66, 24, 18, 20, 80)
+        self.assertTeam(competition.get_team('Stoke'), 37, 51, 19, 18, 45)
+
+        fixture = competition.get_fixture('Arsenal', 'Chelsea', '2021-05-01T15:00:00Z')
+        self.assertEqual('FINISHED', fixture.status)
+        self.assertEqual(Result('FINISHED', 2, 1), fixture.result)
+        self.assertEqual([fixture], competition.fixtures_with_status('FINISHED'))
+
+    def test_apply_results_skips_applied_results_and_replaces_corrected_results(self):
+        competition = self.competition_under_test_producer()
+        engine = UpdateEngine()
+        engine.apply_results(competition, [self.result_producer('Stoke', 'Arsenal', '2021-05-08T15:00:00Z', 1, 0)])
+        self.assertEqual(set(), engine.apply_results(competition, [
+            self.result_producer('Stoke', 'Arsenal', '2021-05-08T15:00:00Z', 1, 0)
+        ]))
+        self.assertEqual({'Stoke', 'Arsenal'}, engine.apply_results(competition, [
+            self.result_producer('Stoke', 'Arsenal', '2021-05-08T15:00:00Z', 1, 1)
+        ]))
+        self.assertTeam(competition.get_team('Arsenal'), 65, 37, 19, 19, 73)
+        self.assertTeam(competition.get_team('Stoke'), 38, 52, 20, 18, 46)
+
+    def test_apply_results_adds_missing_fixtures(self):
+        competition = self.competition_under_test_producer()
+        UpdateEngine().apply_results(competition, [
+            self.result_producer('Chelsea', 'Stoke', '2021-05-15T15:00:00Z', 3, 0)
+        ])
+        fixture = competition.get_fixture('Chelsea', 'Stoke', '2021-05-15T15:00:00Z')
+        self.assertIs(competition.get_team('Chelsea'), fixture.home_team)
+        self.assertEqual('FINISHED', fixture.status)
+        self.assertTeam(competition.get_team('Chelsea'), 68, 22, 19, 19, 83)
+
+        with self.assertRaises(KeyError):
+            UpdateEngine().apply_results(competition, [self.result_producer('Hull', 'Stoke', '', 1, 0)])
+
+    def test_update_competition_returns_competition(self):
+        competition = self.competition_under_test_producer()
+        self.assertIs(competition, UpdateEngine().update_competition(competition))
+        self.assertIs(competition, UpdateEngine().update_competition(competition, [
+            self.result_producer('Arsenal', 'Chelsea', '2021-05-01T15:00:00Z', 0, 2)
+        ]))
+        self.assertEqual(83, competition.get_team('Chelsea').points())
+
+
+if __name__ == '__main__':
+    unittest.main()
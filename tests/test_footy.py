@@ -1,10 +1,16 @@
 import numpy as np
+import os
+import tempfile
 import unittest
 
 from parameterized import parameterized
 
-from footy import Footy
+from footy import Footy, OUTCOME_AWAY_WIN, OUTCOME_HOME_WIN, OUTCOME_SCORE_DRAW
+from footy.domain.Competition import Competition
+from footy.domain.Fixture import Fixture
+from footy.domain.Result import Result
 from footy.domain.Team import Team
+from footy.engine.OutcomeEngine import OutcomeEngine
 
 
 class TestFootyClass(unittest.TestCase):
@@ -65,6 +71,216 @@ class TestFootyClass(unittest.TestCase):
         bs = footy.brier_score(y_true, y_prob)
         self.assertEqual(bs, expected_answer)
 
+    def test_league_averages_follow_replaced_teams(self):
+        footy = self.footy_under_test_producer()
+        self.assertEqual(footy.goals_scored(), 46)
+        self.assertEqual(footy.goals_conceded(), 46)
+
+        # Replacing a team must remove its previous contribution to the league totals.
+        footy.add_team(Team('Arsenal', 64 + 20, 36 + 20, 18, 19, 69))
+        self.assertEqual(footy.goals_scored(), 47)
+        self.assertEqual(footy.goals_conceded(), 47)
+        self.assertEqual(footy.attack_strength(footy.get_team('Arsenal')), round(84 / 47, 2))
+
+        footy.add_team(Team('Arsenal', 64, 36, 18, 19, 69))
+        self.assertEqual(footy.goals_scored(), 46)
+        self.assertEqual(footy.goals_conceded(), 46)
+
+    def test_strengths_are_read_from_the_store_until_a_changed_team_is_added_again(self):
+        footy = self.footy_under_test_producer()
+        arsenal = footy.get_team('Arsenal')
+        stoke = footy.get_team('Stoke')
+        expected = footy.fixture(arsenal, stoke).outcome_probabilities()
+
+        # Changing a team without adding it again changes none of the strengths or predictions.
+        arsenal.goals_for(128)
+        arsenal.goals_against(72)
+        df = footy.dataframe().set_index('team_name')
+        self.assertEqual(footy.attack_strength(arsenal), round(64 / 46, 2))
+        self.assertEqual(footy.defence_factor(arsenal), round(36 / 46, 2))
+        self.assertEqual(footy.attack_strength(arsenal), df.loc['Arsenal', 'attack_strength'])
+        self.assertEqual(footy.defence_factor(arsenal), df.loc['Arsenal', 'defence_factor'])
+        self.assertEqual(footy.fixture(arsenal, stoke).outcome_probabilities(), expected)
+        self.assertEqual(footy.goals_scored('Arsenal'), 64)
+        self.assertEqual(footy.goals_conceded('Arsenal'), 36)
+
+        footy.add_team(arsenal)
+        self.assertEqual(footy.goals_scored('Arsenal'), 128)
+        self.assertEqual(footy.goals_conceded('Arsenal'), 72)
+        df = footy.dataframe().set_index('team_name')
+        self.assertEqual(footy.attack_strength(arsenal), round(128 / 49, 2))
+        self.assertEqual(footy.defence_factor(arsenal), round(72 / 48, 2))
+        self.assertEqual(footy.attack_strength(arsenal), df.loc['Arsenal', 'attack_strength'])
+        self.assertEqual(footy.defence_factor(arsenal), df.loc['Arsenal', 'defence_factor'])
+        self.assertNotEqual(footy.fixture(arsenal, stoke).outcome_probabilities(), expected)
+
+    def test_predict_fixtures_matches_fixture(self):
+        footy = self.footy_under_test_producer()
+        pairs = [
+            (footy.get_team('Arsenal'), footy.get_team('Stoke')),
+            (footy.get_team('Hull'), footy.get_team('Man United')),
+            (footy.get_team('Fulham'), footy.get_team('Everton'))
+        ]
+        prediction = footy.predict_fixtures(pairs)
+
+        for index, (home_team, away_team) in enumerate(pairs):
+            fixture = footy.fixture(home_team, away_team)
+            self.assertEqual(list(prediction['outcome_probabilities'][index]), fixture.outcome_probabilities())
+            self.assertEqual(list(prediction['home_team_goals_probability'][index]),
+                             fixture.home_team_goals_probability())
+            self.assertEqual(list(prediction['away_team_goals_probability'][index]),
+                             fixture.away_team_goals_probability())
+
+        self.assertEqual(prediction['home_expected_goals'][0], 2.1)
+
+    def test_expected_goals_match_the_scalar_calculation(self):
+        footy = self.footy_under_test_producer()
+        teams = [footy.get_team(team_name) for team_name in footy.get_team_names()]
+        pairs = [(home_team, away_team) for home_team in teams for away_team in teams if home_team is not away_team]
+        home_expected_goals, away_expected_goals = footy.expected_goals(pairs)
+
+        for index, (home_team, away_team) in enumerate(pairs):
+            self.assertEqual(home_expected_goals[index], round(1.36 * footy.attack_strength(home_team) *
+                                                               footy.defence_factor(away_team), 2))
+            self.assertEqual(away_expected_goals[index], round(1.06 * footy.attack_strength(away_team) *
+                                                               footy.defence_factor(home_team), 2))
+
+    def test_populate_fixtures_sets_probabilities(self):
+        footy = self.footy_under_test_producer()
+        fixtures = [Fixture(footy.get_team('Arsenal'), footy.get_team('Stoke')),
+                    Fixture(footy.get_team('Hull'), footy.get_team('Man United'))]
+        footy.populate_fixtures(fixtures)
+
+        for fixture in fixtures:
+            expected = footy.fixture(fixture.home_team, fixture.away_team)
+            self.assertEqual(expected.outcome_probabilities(), fixture.outcome_probabilities())
+            self.assertTrue(expected.final_score_probabilities().equals(fixture.final_score_probabilities()))
+
+    def test_predict_fixtures_returns_none_without_enough_data(self):
+        footy = Footy()
+        team_a = Team('Team A')
+        team_b = Team('Team B')
+        footy.add_team(team_a)
+        footy.add_team(team_b)
+        self.assertIsNone(footy.predict_fixtures([(team_a, team_b)]))
+
+    def test_fixture_is_not_populated_until_every_team_has_played_home_and_away(self):
+        footy = self.footy_under_test_producer()
+        arsenal = footy.get_team('Arsenal')
+        stoke = footy.get_team('Stoke')
+        self.assertIsNotNone(footy.fixture(arsenal, stoke).outcome_probabilities())
+
+        # Replacing the same team more than once must only count it once.
+        footy.add_team(Team('Wigan', 33, 45, 0, 19, 42))
+        footy.add_team(Team('Wigan', 33, 45, 18, 0, 42))
+        self.assertIsNone(footy.fixture(arsenal, stoke).outcome_probabilities())
+
+        footy.add_team(Team('Wigan', 33, 45, 18, 19, 42))
+        self.assertIsNotNone(footy.fixture(arsenal, stoke).outcome_probabilities())
+
+    def test_columnar_footy_matches_default_footy(self):
+        footy = self.footy_under_test_producer()
+        columnar = Footy(columnar=True)
+
+        for team_name in footy.get_team_names():
+            columnar.add_team(footy.get_team(team_name))
+
+        columnar.average_goals_scored_by_a_home_team(1.36)
+        columnar.average_goals_scored_by_an_away_team(1.06)
+
+        self.assertTrue(footy.dataframe().equals(columnar.dataframe()))
+        self.assertEqual(footy.get_team('Arsenal'), columnar.get_team('Arsenal'))
+        self.assertEqual(footy.fixture(footy.get_team('Arsenal'), footy.get_team('Stoke')).outcome_probabilities(),
+                         columnar.fixture(columnar.get_team('Arsenal'),
+                                          columnar.get_team('Stoke')).outcome_probabilities())
+
+        # Teams of a columnar object update the league totals in place.
+        columnar.get_team('Arsenal').goals_for(84)
+        self.assertEqual(47, columnar.goals_scored())
+
+    def test_outcome_engine_can_be_configured(self):
+        footy = self.footy_under_test_producer()
+        exact = Footy(outcome_engine=OutcomeEngine(max_goals=10, decimals=None, closed_form=True))
+
+        for team_name in footy.get_team_names():
+            exact.add_team(footy.get_team(team_name))
+
+        exact.average_goals_scored_by_a_home_team(1.36)
+        exact.average_goals_scored_by_an_away_team(1.06)
+        fixture = exact.fixture(exact.get_team('Arsenal'), exact.get_team('Stoke'))
+        self.assertAlmostEqual(1.0, sum(fixture.outcome_probabilities()))
+        self.assertEqual(11, len(fixture.home_team_goals_probability()))
+
+    def test_snapshot_is_restored(self):
+        footy = self.footy_under_test_producer()
+        columnar = Footy(columnar=True, outcome_engine=OutcomeEngine(max_goals=8, decimals=None))
+
+        for team_name in footy.get_team_names():
+            columnar.add_team(footy.get_team(team_name))
+
+        columnar.average_goals_scored_by_a_home_team(1.36)
+        columnar.average_goals_scored_by_an_away_team(1.06)
+
+        with tempfile.TemporaryDirectory() as directory:
+            for original, mmap_mode in ((footy, None), (columnar, 'r')):
+                path = os.path.join(directory, 'footy.npz')
+                original.snapshot(path)
+                restored = Footy.restore(path, mmap_mode)
+                arsenal, stoke = restored.get_team('Arsenal'), restored.get_team('Stoke')
+                self.assertTrue(original.dataframe().equals(restored.dataframe()))
+                self.assertEqual(original.get_team('Arsenal'), arsenal)
+                self.assertEqual(1.36, restored.average_goals_scored_by_a_home_team())
+                self.assertEqual(1.06, restored.average_goals_scored_by_an_away_team())
+                self.assertEqual(original.fixture(original.get_team('Arsenal'),
+                                                  original.get_team('Stoke')).outcome_probabilities(),
+                                 restored.fixture(arsenal, stoke).outcome_probabilities())
+
+            # The statistics of a restored object can be updated.
+            arsenal.goals_for(84)
+            self.assertEqual(47, restored.goals_scored())
+
+    def test_brier_scores_scores_a_batch_of_predictions(self):
+        footy = self.footy_under_test_producer()
+        y_true = [OUTCOME_HOME_WIN, OUTCOME_SCORE_DRAW, OUTCOME_AWAY_WIN, OUTCOME_HOME_WIN]
+        y_prob = np.array([[0.7002, 0.1843, 0.0956]] * 3 + [[1.0, 0.0, 0.0]])
+        scores = footy.brier_scores(y_true, y_prob)
+        np.testing.assert_array_equal([0.13, 1.16, 1.34, 0.0], np.round(scores, 2))
+
+        with self.assertRaises(ValueError):
+            footy.brier_scores(y_true, y_prob[:, :2])
+
+    def test_brier_scores_are_grouped_by_matchday_and_team(self):
+        footy = self.footy_under_test_producer()
+        scores = np.array([0.5, 1.0, 0.25, 0.75])
+        by_matchday = footy.group_brier_scores(scores, [2, 1, 1, 2])
+        self.assertEqual([1, 2], list(by_matchday.index))
+        self.assertEqual([2, 2], list(by_matchday['count']))
+        self.assertEqual([1.25, 1.25], list(by_matchday['total']))
+        self.assertEqual([0.625, 0.625], list(by_matchday['mean']))
+
+        by_team = footy.team_brier_scores(scores, ['Arsenal', 'Stoke', 'Hull', 'Arsenal'],
+                                          ['Stoke', 'Hull', 'Arsenal', 'Wigan'])
+        self.assertEqual(['Arsenal', 'Hull', 'Stoke', 'Wigan'], list(by_team.index))
+        self.assertEqual([3, 2, 2, 1], list(by_team['count']))
+        self.assertEqual([1.5, 1.25, 1.5, 0.75], list(by_team['total']))
+
+        with self.assertRaises(ValueError):
+            footy.group_brier_scores(scores, [1, 2])
+
+    def test_from_competition_sets_teams_and_average_goals(self):
+        arsenal = Team('Arsenal', 64, 36, 18, 19, 69)
+        stoke = Team('Stoke', 37, 51, 19, 18, 45)
+        competition = Competition('PL', 'Premier League', [arsenal, stoke])
+        competition.add_fixture(Fixture(arsenal, stoke, 'FINISHED', result=Result('FINISHED', 2, 1)))
+        competition.add_fixture(Fixture(stoke, arsenal, 'FINISHED', result=Result('FINISHED', 1, 1)))
+        competition.add_fixture(Fixture(arsenal, stoke, utc_start='2021-02-13T21:30:00Z'))
+
+        footy = Footy.from_competition(competition, columnar=True)
+        self.assertEqual(['Arsenal', 'Stoke'], footy.get_team_names())
+        self.assertEqual(arsenal, footy.get_team('Arsenal'))
+        self.assertEqual(1.5, footy.average_goals_scored_by_a_home_team())
+        self.assertEqual(1.0, footy.average_goals_scored_by_an_away_team())
+
     def test_dummy_league(self):
         """Test a dummy league through various stages of progression."""
         footy_obj = Footy()
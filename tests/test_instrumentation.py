@@ -0,0 +1,69 @@
+import unittest
+
+from footy import Footy, instrumentation
+from footy.domain.Team import Team
+from footy.engine.PredictionEngine import PredictionEngine
+from footy.engine.UpdateEngine import UpdateEngine
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def footy_under_test_producer(self):
+        footy = Footy()
+        footy.add_team(Team('Arsenal', 64, 36, 18, 19, 69))
+        footy.add_team(Team('Stoke', 37, 51, 19, 18, 45))
+        footy.average_goals_scored_by_a_home_team(1.36)
+        footy.average_goals_scored_by_an_away_team(1.06)
+        return footy
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_methods_are_untouched_when_disabled(self):
+        original = Footy.__dict__['fixture']
+        self.assertFalse(instrumentation.is_enabled())
+
+        instrumentation.enable()
+        self.assertIsNot(original, Footy.__dict__['fixture'])
+
+        instrumentation.disable()
+        self.assertIs(original, Footy.__dict__['fixture'])
+
+    def test_profiling_counts_and_times_calls(self):
+        footy = self.footy_under_test_producer()
+
+        with instrumentation.profiling():
+            self.assertTrue(instrumentation.is_enabled())
+            footy.fixture(footy.get_team('Arsenal'), footy.get_team('Stoke'))
+            footy.fixture(footy.get_team('Stoke'), footy.get_team('Arsenal'))
+            footy.dataframe()
+
+        footy.fixture(footy.get_team('Arsenal'), footy.get_team('Stoke'))
+        stats = instrumentation.snapshot()
+        self.assertEqual(2, stats['Footy.fixture']['calls'])
+        self.assertEqual(2, stats['Footy.predict_fixtures']['calls'])
+        self.assertEqual(1, stats['Footy.dataframe']['calls'])
+        self.assertGreater(stats['Footy.fixture']['total_seconds'], 0.0)
+        self.assertGreaterEqual(stats['Footy.fixture']['max_seconds'], stats['Footy.fixture']['mean_seconds'])
+
+    def test_engine_entry_points_are_registered(self):
+        with instrumentation.profiling():
+            for owner, name in [(PredictionEngine, 'predict_results'), (UpdateEngine, 'get_competition'),
+                                (UpdateEngine, 'update_competition')]:
+                self.assertTrue(hasattr(owner.__dict__[name], '__wrapped__'), name)
+
+        self.assertFalse(hasattr(PredictionEngine.__dict__['predict_results'], '__wrapped__'))
+
+    def test_exceptions_are_timed_and_raised(self):
+        footy = Footy()
+
+        with instrumentation.profiling():
+            with self.assertRaises(ZeroDivisionError):
+                footy.goals_scored()
+
+        self.assertEqual(1, instrumentation.snapshot()['Footy.goals_scored']['calls'])
+
+
+if __name__ == '__main__':
+    unittest.main()
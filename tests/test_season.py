@@ -0,0 +1,32 @@
+import unittest
+
+from datetime import datetime
+
+from footy.season import season_of, season_start_month, timestamp, valid_timestamp
+
+
+class TestSeason(unittest.TestCase):
+
+    def test_timestamp_converts_strings_and_datetimes(self):
+        self.assertEqual(1613251800.0, timestamp('2021-02-13T21:30:00Z'))
+        self.assertEqual(1613251800.0, timestamp(datetime(2021, 2, 13, 21, 30)))
+        self.assertIsNone(timestamp(None))
+        self.assertIsNone(timestamp('2021-000001'))
+
+    def test_valid_timestamp_raises_value_error_for_invalid_dates(self):
+        self.assertEqual(1613251800.0, valid_timestamp('2021-02-13T21:30:00Z'))
+
+        with self.assertRaises(ValueError):
+            valid_timestamp('')
+
+    def test_seasons_start_in_july_unless_the_competition_starts_in_january(self):
+        february = timestamp('2021-02-13T21:30:00Z')
+        self.assertEqual(7, season_start_month('PL'))
+        self.assertEqual(1, season_start_month('BSA'))
+        self.assertEqual(2020, season_of(february, season_start_month('PL')))
+        self.assertEqual(2021, season_of(february, season_start_month('BSA')))
+        self.assertEqual(2021, season_of(timestamp('2021-07-01T00:00:00Z')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+import numpy as np
+
+from footy.snapshot import load_arrays, save_arrays
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'state.npz')
+        self.arrays = {
+            'goals_for': np.array([64, 37]),
+            'matrix': np.arange(12, dtype=float).reshape(2, 2, 3),
+            'team_names': np.array(['Arsenal', 'Stoke']),
+            'average': np.array(1.36),
+            'empty': np.zeros((0, 7))
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_arrays_are_saved_and_loaded(self):
+        save_arrays(self.path, self.arrays)
+        arrays = load_arrays(self.path)
+        self.assertEqual(sorted(self.arrays), sorted(arrays))
+
+        for name, values in self.arrays.items():
+            np.testing.assert_array_equal(values, arrays[name])
+            self.assertEqual(values.shape, arrays[name].shape)
+
+    def test_numeric_arrays_are_memory_mapped(self):
+        save_arrays(self.path, self.arrays)
+        arrays = load_arrays(self.path, mmap_mode='r')
+
+        for name, values in self.arrays.items():
+            np.testing.assert_array_equal(values, arrays[name])
+
+        self.assertIsInstance(arrays['matrix'], np.memmap)
+        self.assertNotIsInstance(arrays['team_names'], np.memmap)
+        self.assertFalse(arrays['matrix'].flags.writeable)
+
+    def test_compressed_arrays_cannot_be_memory_mapped(self):
+        with open(self.path, 'wb') as f:
+            np.savez_compressed(f, **self.arrays)
+
+        np.testing.assert_array_equal(self.arrays['matrix'], load_arrays(self.path)['matrix'])
+
+        with self.assertRaises(ValueError):
+            load_arrays(self.path, mmap_mode='r')
+
+        self.assertTrue(zipfile.is_zipfile(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()